@@ -4,24 +4,37 @@ import sys
 import asyncio
 import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
+from collections import OrderedDict, deque
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python 3.8
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
 import json
+import re
+import bisect
+import logging
+import logging.handlers
+import queue
+import zlib
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QGridLayout, QTabWidget, QLabel, QPushButton, QLineEdit, QComboBox,
-    QTableWidget, QTableWidgetItem, QTextEdit, QSpinBox, QDoubleSpinBox,
+    QTableWidget, QTableWidgetItem, QTableView, QTextEdit, QSpinBox, QDoubleSpinBox,
     QCheckBox, QGroupBox, QSplitter, QScrollArea, QProgressBar,
     QStatusBar, QMenuBar, QMessageBox, QDialog, QFormLayout, QSlider,
     QFrame, QHeaderView, QListWidget, QListWidgetItem, QButtonGroup
 )
 from PyQt6.QtCore import (
-    QTimer, QThread, pyqtSignal, Qt, QMutex, QWaitCondition, QSize, QUrl
+    QTimer, QThread, QObject, pyqtSignal, Qt, QMutex, QWaitCondition, QSize, QUrl,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PyQt6.QtGui import QFont, QColor, QPalette, QAction, QPainter, QBrush, QPen
+from PyQt6.QtGui import QFont, QColor, QPalette, QAction, QActionGroup, QPainter, QBrush, QPen
 import os
 import pandas as pd
 import numpy as np
@@ -37,15 +50,14 @@ import feedparser
 import requests
 from bs4 import BeautifulSoup
 import seaborn as sns
-import nest_asyncio
 from math import isnan
 import webbrowser
 from matplotlib.patches import Rectangle
-from matplotlib.ticker import FuncFormatter
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.ticker import FuncFormatter, MaxNLocator
 from dateutil import parser as date_parser
-
-# Apply nest_asyncio to allow nested event loops
-nest_asyncio.apply()
+from email.utils import parsedate_to_datetime
 
 # Set matplotlib to use Qt backend
 plt.switch_backend('Qt5Agg')
@@ -55,17 +67,1133 @@ from math import isnan
 # Explicit imports for IB, Stock, Order, Contract
 from ib_insync import IB, Stock, Order, Contract, Trade, Fill, NewsProvider, NewsTick
 
+# Component loggers; all hang off the 'trading_platform' root configured by setup_logging()
+LOG_ROOT = 'trading_platform'
+ib_log = logging.getLogger(f'{LOG_ROOT}.ib')
+stream_log = logging.getLogger(f'{LOG_ROOT}.stream')
+quote_log = logging.getLogger(f'{LOG_ROOT}.quotes')
+trade_log = logging.getLogger(f'{LOG_ROOT}.orders')
+portfolio_log = logging.getLogger(f'{LOG_ROOT}.portfolio')
+news_log = logging.getLogger(f'{LOG_ROOT}.news')
+chart_log = logging.getLogger(f'{LOG_ROOT}.chart')
+watchlist_log = logging.getLogger(f'{LOG_ROOT}.watchlist')
+panel_log = logging.getLogger(f'{LOG_ROOT}.trading_panel')
+worker_log = logging.getLogger(f'{LOG_ROOT}.worker')
+screener_log = logging.getLogger(f'{LOG_ROOT}.screener')
+ui_log = logging.getLogger(f'{LOG_ROOT}.ui')
+main_log = logging.getLogger(f'{LOG_ROOT}.main')
+
+DEFAULT_LOG_LEVELS = {
+    '': 'INFO',
+    'quotes': 'INFO',
+    'worker': 'INFO',
+    'trading_panel': 'INFO',
+    'main': 'INFO',
+}
+LOG_FORMAT = '%(asctime)s %(levelname)-7s [%(name)s] %(message)s'
+
+def parse_log_levels(spec: str) -> Dict[str, str]:
+    """Parse a 'component=LEVEL,component=LEVEL' string (e.g. 'quotes=DEBUG,ib=WARNING')"""
+    levels = {}
+    for item in spec.split(','):
+        component, sep, level = item.partition('=')
+        if not sep:
+            # A bare level applies to the whole platform
+            component, level = '', component
+        if level.strip():
+            levels[component.strip()] = level.strip().upper()
+    return levels
+
+def set_log_levels(levels: Dict[str, str]):
+    """Apply per-component levels; '' addresses the platform root logger"""
+    for component, level in levels.items():
+        name = f'{LOG_ROOT}.{component}' if component else LOG_ROOT
+        logging.getLogger(name).setLevel(level)
+
+def setup_logging(log_file: str = 'trading_platform.log', levels: Optional[Dict[str, str]] = None,
+                  max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3,
+                  console: bool = True) -> logging.handlers.QueueListener:
+    """Route platform logging through a queue to a background writer with rotating files"""
+    log_levels = dict(DEFAULT_LOG_LEVELS)
+    log_levels.update(levels or {})
+    log_levels.update(parse_log_levels(os.environ.get('TRADING_LOG_LEVELS', '')))
+    set_log_levels(log_levels)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True
+    )
+    file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    # Callers only enqueue the record; formatting and file I/O happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger(LOG_ROOT)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+class QuoteBoard:
+    """Shared quote board: one NumPy structured-array row per symbol, updated in place and versioned"""
+
+    PRICE_FIELDS = ('last', 'bid', 'ask', 'change', 'percent_change')
+    SIZE_FIELDS = ('bid_size', 'ask_size', 'volume')
+    VALUE_FIELDS = PRICE_FIELDS + SIZE_FIELDS
+    DTYPE = np.dtype([(field, 'f8') for field in PRICE_FIELDS]
+                     + [(field, 'i8') for field in SIZE_FIELDS]
+                     + [('source', 'i2'), ('version', 'u8')])
+
+    def __init__(self, capacity: int = 64):
+        self.lock = threading.Lock()
+        self.rows = self._blank(capacity)
+        self.index = {}    # symbol -> row
+        self.symbols = []  # row -> symbol
+        self.sources = ['No TWS Data']  # source code -> name
+        self.source_codes = {'No TWS Data': 0}
+        self.version = 0   # bumped once per changed row; row versions say which write touched them last
+
+    @classmethod
+    def _blank(cls, n: int):
+        """Empty rows: NaN prices and -1 sizes mean 'no data yet'"""
+        rows = np.zeros(n, dtype=cls.DTYPE)
+        for field in cls.PRICE_FIELDS:
+            rows[field] = np.nan
+        for field in cls.SIZE_FIELDS:
+            rows[field] = -1
+        return rows
+
+    @classmethod
+    def value(cls, record, field: str):
+        """Python value of one field of a board record, or None when it is missing"""
+        value = record[field].item()
+        if field in cls.SIZE_FIELDS:
+            return value if value >= 0 else None
+        return None if isnan(value) else value
+
+    def _row(self, symbol: str) -> int:
+        """Row for symbol, allocating (and growing the array) on first use; caller holds the lock"""
+        row = self.index.get(symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == len(self.rows):
+                self.rows = np.concatenate([self.rows, self._blank(len(self.rows))])
+            self.index[symbol] = row
+            self.symbols.append(symbol)
+        return row
+
+    def _source_code(self, source: Optional[str]) -> int:
+        if not source:
+            return 0
+        code = self.source_codes.get(source)
+        if code is None:
+            code = len(self.sources)
+            self.sources.append(source)
+            self.source_codes[source] = code
+        return code
+
+    def source_name(self, code: int) -> str:
+        return self.sources[int(code)]
+
+    def write(self, symbol: str, source: Optional[str], values: tuple) -> bool:
+        """Write VALUE_FIELDS-ordered values in place (None keeps the old value); True if the row changed"""
+        with self.lock:
+            row = self._row(symbol)  # may grow (and rebind) self.rows, so look it up first
+            record = self.rows[row]  # view into the board
+            changed = False
+            for field, value in zip(self.VALUE_FIELDS, values):
+                if value is not None and record[field] != value:
+                    record[field] = value
+                    changed = True
+            code = self._source_code(source)
+            if code and record['source'] != code:
+                record['source'] = code
+                changed = True
+            if changed:
+                self.version += 1
+                record['version'] = self.version
+            return changed
+
+    def update(self, symbol: str, quote: Dict) -> bool:
+        """Write a quote dict from the fetch paths into the board"""
+        return self.write(symbol, quote.get('source'), tuple(quote.get(field) for field in self.VALUE_FIELDS))
+
+    def update_many(self, quotes: Dict[str, Dict]) -> int:
+        return sum(self.update(symbol, quote) for symbol, quote in quotes.items())
+
+    def rows_for(self, symbols: List[str]):
+        """Board rows for symbols, allocating missing ones; rows never move, so callers may keep them"""
+        with self.lock:
+            return np.fromiter((self._row(symbol) for symbol in symbols), dtype=np.intp, count=len(symbols))
+
+    def write_columns(self, rows, source: str, columns: Dict[str, np.ndarray]) -> int:
+        """Vectorized write of whole columns into board rows (from rows_for); returns how many rows changed"""
+        with self.lock:
+            block = self.rows[rows]
+            code = self._source_code(source)
+            changed = block['source'] != code
+            block['source'] = code
+            for field, values in columns.items():
+                changed |= block[field] != values
+                block[field] = values
+            n_changed = int(changed.sum())
+            if n_changed:
+                block['version'][changed] = np.arange(self.version + 1, self.version + n_changed + 1)
+                self.version += n_changed
+                self.rows[rows] = block
+            return n_changed
+
+    def remove(self, symbol: str):
+        """Clear a symbol's row; the row is reused if the symbol comes back"""
+        with self.lock:
+            row = self.index.get(symbol)
+            if row is not None:
+                self.rows[row] = self._blank(1)[0]
+
+    def snapshot(self, symbols: List[str]):
+        """Copy of the rows for symbols, in order; unknown symbols read as empty rows"""
+        with self.lock:
+            records = self._blank(len(symbols))
+            for i, symbol in enumerate(symbols):
+                row = self.index.get(symbol)
+                if row is not None:
+                    records[i] = self.rows[row]
+            return records
+
+    def read_rows(self, rows):
+        """Copy of the given board rows"""
+        with self.lock:
+            return self.rows[rows]
+
+    def changed_since(self, version: int) -> tuple:
+        """(board rows, records, current version) for every row written after version"""
+        with self.lock:
+            rows = np.flatnonzero(self.rows['version'][:len(self.symbols)] > version)
+            return rows, self.rows[rows], self.version
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Quote dict for a single symbol, for callers that still want one"""
+        with self.lock:
+            row = self.index.get(symbol)
+            if row is None:
+                return None
+            record = self.rows[row].copy()
+        quote = {'symbol': symbol, 'source': self.source_name(record['source'])}
+        for field in self.VALUE_FIELDS:
+            quote[field] = self.value(record, field)
+        return quote
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {
+                'symbols': len(self.symbols),
+                'version': self.version,
+                'bytes': self.rows.nbytes,
+            }
+
+
+class IBEventLoop:
+    """Dedicated thread owning the asyncio loop that all ib_insync I/O runs on"""
+
+    def __init__(self, name: str = "IBEventLoop"):
+        self.name = name
+        self.loop = asyncio.new_event_loop()
+        self.commands = queue.SimpleQueue()  # (fn, args, kwargs, future) waiting for the loop thread
+        self.drain_lock = threading.Lock()
+        self.drain_scheduled = False
+        self.thread = None
+        self.submitted = 0
+        self.completed = 0
+        self.max_backlog = 0
+
+    def start(self):
+        """Start the loop thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self):
+        """Stop the loop thread"""
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+            self.thread = None
+
+    def in_loop_thread(self) -> bool:
+        return self.thread is not None and threading.current_thread() is self.thread
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        """Queue fn(*args, **kwargs) for the loop thread (coroutines are awaited there); returns a Future"""
+        future = concurrent.futures.Future()
+        if self.in_loop_thread():
+            # Issued from an IB callback or another command: no queue round trip needed
+            self._execute(fn, args, kwargs, future)
+            return future
+
+        self.commands.put((fn, args, kwargs, future))
+        with self.drain_lock:
+            self.submitted += 1
+            self.max_backlog = max(self.max_backlog, self.commands.qsize())
+            schedule = not self.drain_scheduled
+            self.drain_scheduled = True
+        # One wake-up per burst of commands rather than one per command
+        if schedule:
+            self.loop.call_soon_threadsafe(self._drain)
+        return future
+
+    def call(self, fn, *args, timeout: Optional[float] = None, **kwargs):
+        """Blocking submit for worker threads; never call this from the GUI or loop thread"""
+        if self.in_loop_thread():
+            raise RuntimeError("IBEventLoop.call() from the loop thread would deadlock")
+        return self.submit(fn, *args, **kwargs).result(timeout)
+
+    def _drain(self):
+        """Run every queued command, in submission order"""
+        with self.drain_lock:
+            self.drain_scheduled = False
+        while True:
+            try:
+                fn, args, kwargs, future = self.commands.get_nowait()
+            except queue.Empty:
+                break
+            self._execute(fn, args, kwargs, future)
+
+    def _execute(self, fn, args, kwargs, future):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.completed += 1
+            future.set_exception(e)
+            return
+        if asyncio.iscoroutine(result):
+            task = self.loop.create_task(result)
+            task.add_done_callback(lambda task: self._finish(future, task))
+        else:
+            self.completed += 1
+            future.set_result(result)
+
+    def _finish(self, future, task):
+        self.completed += 1
+        if task.cancelled():
+            future.set_exception(concurrent.futures.CancelledError())
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def get_stats(self) -> Dict:
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'backlog': self.commands.qsize(),
+            'max_backlog': self.max_backlog,
+        }
+
+
+class IBQtBridge(QObject):
+    """Delivers IB events and finished IB commands from the loop thread to the GUI thread"""
+
+    ib_event = pyqtSignal(str, tuple)          # event name, event args
+    future_done = pyqtSignal(object, object)   # callback, finished Future
+
+    def __init__(self):
+        super().__init__()
+        self.handlers = {}  # event name -> GUI-thread handler
+        # Emitted from the loop thread, so both arrive as queued calls on this object's thread
+        self.ib_event.connect(self._dispatch)
+        self.future_done.connect(self._run_callback)
+
+    def on(self, name: str, handler):
+        """Register the GUI-thread handler for an IB event"""
+        self.handlers[name] = handler
+
+    def forward(self, name: str):
+        """Callable to attach to an ib_insync event on the loop thread"""
+        return lambda *args: self.ib_event.emit(name, args)
+
+    def deliver(self, future: concurrent.futures.Future, callback):
+        """Call callback(future) on the GUI thread once the IB command finishes"""
+        future.add_done_callback(lambda done: self.future_done.emit(callback, done))
+
+    def _dispatch(self, name: str, args: tuple):
+        handler = self.handlers.get(name)
+        if handler is None:
+            return
+        try:
+            handler(*args)
+        except Exception as e:
+            ib_log.error("Error handling %s event: %s", name, e)
+
+    def _run_callback(self, callback, future):
+        try:
+            callback(future)
+        except Exception as e:
+            ib_log.error("Error in command callback: %s", e)
+
+
+class IBStreamingQuoteEngine:
+    """Live bid/ask/last board fed by reqMktData subscriptions and pendingTickersEvent"""
+
+    # Board field -> ib_insync Ticker attribute
+    TICKER_FIELDS = {
+        'bid': 'bid',
+        'ask': 'ask',
+        'last': 'last',
+        'bid_size': 'bidSize',
+        'ask_size': 'askSize',
+        'last_size': 'lastSize',
+        'volume': 'volume',
+        'close': 'close',
+    }
+
+    def __init__(self, ib, ib_loop: IBEventLoop, max_subscriptions: int = 100,
+                 quote_board: Optional[QuoteBoard] = None):
+        self.ib = ib
+        self.ib_loop = ib_loop  # reqMktData/cancelMktData are issued on the IB loop thread
+        self.max_subscriptions = max_subscriptions  # TWS default market data line limit
+        self.quote_board = quote_board  # shared board that pushed ticks are written into
+        self.tickers = {}  # symbol -> Ticker returned by reqMktData
+        self.board = {}    # symbol -> latest pushed quote fields
+        self.board_lock = threading.Lock()
+        self.tick_updates = 0
+        self.ib.pendingTickersEvent += self.on_pending_tickers
+
+    def make_contract(self, symbol: str):
+        """Contract used for a watchlist symbol subscription"""
+        return Stock(symbol, "SMART", "USD")
+
+    def subscribe(self, symbol: str) -> bool:
+        """Start streaming a symbol; returns False when no market data line is free"""
+        symbol = symbol.upper()
+        with self.board_lock:
+            if symbol in self.tickers:
+                return True
+            if len(self.tickers) >= self.max_subscriptions:
+                return False
+            self.tickers[symbol] = None  # line reserved until the loop thread has the Ticker
+        self.ib_loop.submit(self._request_market_data, symbol)
+        return True
+
+    def _request_market_data(self, symbol: str):
+        """reqMktData for a reserved line; runs on the IB loop thread"""
+        try:
+            ticker = self.ib.reqMktData(self.make_contract(symbol), "", False, False)
+        except Exception as e:
+            stream_log.error("Error subscribing to %s: %s", symbol, e)
+            with self.board_lock:
+                self.tickers.pop(symbol, None)
+            return
+        with self.board_lock:
+            reserved = symbol in self.tickers
+            if reserved:
+                self.tickers[symbol] = ticker
+        if not reserved:
+            # Unsubscribed while the request was queued
+            self._cancel_market_data(symbol, ticker.contract)
+            return
+        stream_log.info("Subscribed to %s (%d/%d lines)", symbol, len(self.tickers), self.max_subscriptions)
+
+    def _cancel_market_data(self, symbol: str, contract):
+        try:
+            self.ib.cancelMktData(contract)
+        except Exception as e:
+            stream_log.error("Error unsubscribing from %s: %s", symbol, e)
+
+    def subscribe_many(self, symbols: List[str]):
+        """Subscribe a list of symbols until the line limit is reached"""
+        for symbol in symbols:
+            if not self.subscribe(symbol):
+                break
+
+    def unsubscribe(self, symbol: str):
+        """Stop streaming a symbol and drop it from the board"""
+        symbol = symbol.upper()
+        with self.board_lock:
+            ticker = self.tickers.pop(symbol, None)
+            self.board.pop(symbol, None)
+        if ticker is not None:
+            self.ib_loop.submit(self._cancel_market_data, symbol, ticker.contract)
+
+    def stop(self):
+        """Cancel every subscription and detach from the IB event stream"""
+        for symbol in list(self.tickers):
+            self.unsubscribe(symbol)
+        self.ib_loop.submit(self._detach)
+
+    def _detach(self):
+        try:
+            self.ib.pendingTickersEvent -= self.on_pending_tickers
+        except Exception:
+            pass
+
+    def on_pending_tickers(self, tickers):
+        """Apply pushed ticks to the board"""
+        now = time.time()
+        touched = []
+        with self.board_lock:
+            for ticker in tickers:
+                symbol = getattr(ticker.contract, 'symbol', None)
+                if symbol not in self.tickers:
+                    continue
+
+                entry = self.board.setdefault(symbol, {})
+                for field, attr in self.TICKER_FIELDS.items():
+                    value = getattr(ticker, attr, None)
+                    # IB reports missing values as nan and missing bid/ask as -1
+                    if value is None or isnan(value) or value < 0:
+                        continue
+                    entry[field] = value
+                entry['updated_at'] = now
+                self.tick_updates += 1
+                touched.append(symbol)
+
+        if self.quote_board is not None:
+            for symbol in touched:
+                values = self.quote_values(symbol)
+                if values is not None:
+                    self.quote_board.write(symbol, 'IB Streaming', values)
+
+    def is_subscribed(self, symbol: str) -> bool:
+        return symbol.upper() in self.tickers
+
+    def quote_values(self, symbol: str) -> Optional[tuple]:
+        """Streamed quote as a QuoteBoard.VALUE_FIELDS tuple, or None if nothing has streamed yet"""
+        with self.board_lock:
+            entry = dict(self.board.get(symbol.upper(), {}))
+        if not entry:
+            return None
+
+        bid = entry.get('bid')
+        ask = entry.get('ask')
+        last = entry.get('last')
+        if not last and bid and ask:
+            last = (bid + ask) / 2
+        if not last:
+            last = entry.get('close')
+        if not last or last <= 0:
+            return None
+
+        close = entry.get('close')
+        change = last - close if close else 0.0
+        percent_change = (change / close * 100) if close else 0.0
+
+        return (last, bid if bid else last, ask if ask else last, change, percent_change,
+                int(entry.get('bid_size', 0)), int(entry.get('ask_size', 0)), int(entry.get('volume', 0)))
+
+    def get_quote(self, symbol: str) -> Optional[Dict]:
+        """Quote dict in the same shape as the Yahoo fallback, or None if nothing has streamed yet"""
+        values = self.quote_values(symbol)
+        if values is None:
+            return None
+        quote = dict(zip(QuoteBoard.VALUE_FIELDS, values))
+        quote['symbol'] = symbol.upper()
+        quote['source'] = 'IB Streaming'
+        return quote
+
+
+class QuoteCache:
+    """Single-flight LRU quote cache with a TTL per quote source"""
+
+    # Seconds a quote stays fresh, keyed by its 'source' field
+    DEFAULT_TTLS = {
+        'IB Streaming': 0.0,             # pushed ticks: only coalesce concurrent reads
+        'Yahoo Finance (Demo)': 0.9,     # just under the fastest poll interval
+        'Mock Data (Development)': 1.0,
+        'Simulated Market': 0.0,         # in-process simulator, nothing to save
+    }
+
+    def __init__(self, max_entries: int = 2000, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 1.0,
+                 wait_timeout: float = 10.0):
+        self.max_entries = max_entries
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.wait_timeout = wait_timeout  # longest a caller waits on a fetch another caller started
+        self.entries = OrderedDict()  # key -> (expires_at, quote), least recently used first
+        self.in_flight = {}           # key -> Future shared by every caller waiting on that fetch
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.timeouts = 0
+
+    def get_or_fetch(self, key, fetch_fn):
+        """Cached quote for key, calling fetch_fn() at most once across concurrent callers"""
+        results, errors = self.get_or_fetch_many([key], lambda missing: {key: fetch_fn()})
+        if key in errors:
+            raise errors[key]
+        return results[key]
+
+    def get_or_fetch_many(self, keys, fetch_fn, timeout: Optional[float] = None):
+        """Cached quotes for keys; fetch_fn(missing_keys) -> {key: quote} runs once for the misses
+
+        Returns (results, errors) so one failed key does not hide the others. Keys joined to another
+        caller's fetch wait at most timeout (wait_timeout by default) and then report a TimeoutError.
+        """
+        results = {}
+        errors = {}
+        waiting = {}
+        missing = []
+        now = time.monotonic()
+
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    results[key] = entry[1]
+                elif key in self.in_flight:
+                    self.coalesced += 1
+                    waiting[key] = self.in_flight[key]
+                else:
+                    self.misses += 1
+                    self.in_flight[key] = concurrent.futures.Future()
+                    missing.append(key)
+
+        if missing:
+            fetched = {}
+            try:
+                fetched = fetch_fn(missing)
+            except Exception as e:
+                for key in missing:
+                    errors[key] = e
+            except BaseException as e:
+                # Joined callers get an ordinary error; the interrupt itself propagates from here
+                for key in missing:
+                    errors[key] = RuntimeError(f"Quote fetch interrupted: {e!r}")
+                raise
+            finally:
+                # Always resolve the shared futures, or keys would stay in flight forever
+                for key in missing:
+                    with self.lock:
+                        future = self.in_flight.pop(key)
+                    if key in fetched:
+                        self.put(key, fetched[key])
+                        results[key] = fetched[key]
+                        future.set_result(fetched[key])
+                    else:
+                        errors.setdefault(key, LookupError(f"No quote returned for {key}"))
+                        future.set_exception(errors[key])
+
+        deadline = time.monotonic() + (self.wait_timeout if timeout is None else timeout)
+        for key, future in waiting.items():
+            try:
+                results[key] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except concurrent.futures.TimeoutError:
+                with self.lock:
+                    self.timeouts += 1
+                errors[key] = TimeoutError(f"Timed out waiting for the in-flight fetch of {key}")
+            except Exception as e:
+                errors[key] = e
+
+        return results, errors
+
+    def put(self, key, quote: Dict):
+        """Store a quote with the TTL of its source, evicting least recently used entries"""
+        ttl = self.ttls.get(quote.get('source'), self.default_ttl) if isinstance(quote, dict) else self.default_ttl
+        if ttl <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, quote)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when key is None"""
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+
+    def get_stats(self) -> Dict:
+        """Hit, miss, coalesce and eviction counters"""
+        with self.lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'entries': len(self.entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'timeouts': self.timeouts,
+                'hit_rate': (self.hits + self.coalesced) / lookups * 100 if lookups else 0.0,
+            }
+
+
+class IntradayBarStore:
+    """Running intraday session state per symbol, refreshed with only the newest 1-minute bars"""
+
+    GROUP_WINDOW = pd.Timedelta(minutes=5)  # symbols whose last bars are this close share one download
+
+    def __init__(self):
+        self.sessions = {}  # symbol -> session open, last price, running volume, last bar
+        self.lock = threading.Lock()
+        self.bars_received = 0  # downloaded rows, to compare against full-day refetches
+
+    def refresh(self, symbols: List[str]):
+        """Fetch bars newer than each symbol's last bar; the full day for symbols not seen yet"""
+        with self.lock:
+            starts = {symbol: self.sessions[symbol]['last_ts'] for symbol in symbols if symbol in self.sessions}
+        new_symbols = [symbol for symbol in symbols if symbol not in starts]
+
+        try:
+            if new_symbols:
+                self._download(new_symbols, period="1d")
+        except Exception as e:
+            quote_log.warning("Full-day bar download failed for %s: %s", new_symbols, e)
+        # One request per group of similar last bars, so a stale straggler only re-fetches its own history;
+        # apply_bars trims the overlap
+        for start, group in self.group_by_start(starts):
+            try:
+                self._download(group, start=start)
+            except Exception as e:
+                quote_log.warning("Incremental bar download failed for %s: %s", group, e)
+
+    @classmethod
+    def group_by_start(cls, starts: Dict) -> List[tuple]:
+        """(oldest start, symbols) groups whose last bars lie within GROUP_WINDOW of the group's oldest"""
+        groups = []
+        for symbol, start in sorted(starts.items(), key=lambda item: item[1]):
+            if groups and start - groups[-1][0] <= cls.GROUP_WINDOW:
+                groups[-1][1].append(symbol)
+            else:
+                groups.append((start, [symbol]))
+        return groups
+
+    def _download(self, symbols: List[str], **history_args):
+        """Download 1-minute bars for symbols and fold them into the sessions"""
+        if len(symbols) == 1:
+            frames = {symbols[0]: yf.Ticker(symbols[0]).history(interval="1m", **history_args)}
+        else:
+            frame = yf.download(
+                tickers=" ".join(symbols),
+                interval="1m",
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                **history_args
+            )
+            frames = {symbol: self._split_batch_frame(frame, symbol, len(symbols)) for symbol in symbols}
+
+        for symbol, bars in frames.items():
+            if bars is not None:
+                self.apply_bars(symbol, bars)
+
+    def _split_batch_frame(self, frame, symbol: str, batch_len: int):
+        """Extract one symbol's bars from a multi-ticker yf.download frame"""
+        if frame is None or frame.empty:
+            return None
+        if isinstance(frame.columns, pd.MultiIndex):
+            if symbol not in frame.columns.get_level_values(0):
+                return None
+            return frame[symbol].dropna(how='all')
+        # Older yfinance returns flat columns when only one ticker was requested
+        return frame.dropna(how='all') if batch_len == 1 else None
+
+    def apply_bars(self, symbol: str, bars):
+        """Fold newly downloaded bars into the running session fields"""
+        bars = bars.dropna(subset=['Close'])
+        if bars.empty:
+            return
+
+        with self.lock:
+            self.bars_received += len(bars)  # refresh runs on pool threads
+            state = self.sessions.get(symbol)
+            session_date = bars.index[-1].date()
+
+            if state is None or state['session_date'] != session_date:
+                # First fetch or a new trading day: start a fresh session
+                bars = bars[bars.index.date == session_date]
+                state = {
+                    'session_date': session_date,
+                    'open': float(bars['Open'].iloc[0]),
+                    'volume': 0,
+                    'last_ts': None,
+                    'last_bar_volume': 0,
+                }
+                self.sessions[symbol] = state
+            else:
+                bars = bars[bars.index >= state['last_ts']]
+                if bars.empty:
+                    return
+                if bars.index[0] == state['last_ts']:
+                    # The previous last bar was still forming; its new values replace the old ones
+                    state['volume'] -= state['last_bar_volume']
+
+            volumes = bars['Volume'].fillna(0)
+            state['volume'] += int(volumes.sum())
+            state['last_ts'] = bars.index[-1]
+            state['last_bar_volume'] = int(volumes.iloc[-1])
+            state['last'] = float(bars['Close'].iloc[-1])
+
+    def get_quote(self, symbol: str) -> Optional[Dict]:
+        """Quote dict built from the session fields, or None if the symbol has no bars yet"""
+        with self.lock:
+            state = self.sessions.get(symbol)
+            if state is None:
+                return None
+            last_price = state['last']
+            session_open = state['open']
+            volume = state['volume']
+
+        change = last_price - session_open
+        percent_change = (change / session_open * 100) if session_open else 0
+
+        quote_log.debug("Got data for %s: Last=$%.2f, Change=%+.2f", symbol, last_price, change)
+
+        return {
+            'symbol': symbol,
+            'last': last_price,
+            'bid': last_price * 0.999,
+            'ask': last_price * 1.001,
+            'volume': volume,
+            'change': change,
+            'percent_change': percent_change,
+            'source': 'Yahoo Finance (Demo)'
+        }
+
+    def forget(self, symbol: str):
+        with self.lock:
+            self.sessions.pop(symbol, None)
+
+
+class SyntheticMarketSimulator:
+    """Seedable per-symbol geometric Brownian motion market for offline load testing"""
+
+    BASE_PRICES = {
+        'AAPL': 175, 'GOOGL': 135, 'TSLA': 250, 'AMZN': 145,
+        'MSFT': 415, 'NVDA': 430, 'META': 485, 'SPY': 450,
+        'QQQ': 380, 'AMD': 140
+    }
+    SECONDS_PER_YEAR = 252 * 6.5 * 3600  # trading seconds, so drift/volatility are annualized
+
+    def __init__(self, symbols: Optional[List[str]] = None, seed: int = 42, tick_rate: float = 1000.0,
+                 drift: float = 0.05, volatility: float = 0.30, spread_bps: float = 5.0,
+                 max_catch_up: float = 5.0, clock=time.monotonic):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.tick_rate = tick_rate        # ticks per second across all symbols
+        self.drift = drift
+        self.volatility = volatility
+        self.spread_bps = spread_bps
+        self.max_catch_up = max_catch_up  # seconds of ticks generated at most per advance()
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.publish_lock = threading.Lock()  # the driver and the data worker may both publish
+
+        self.symbols = []
+        self.index = {}  # symbol -> row in the state arrays
+        self.open = np.empty(0)
+        self.last = np.empty(0)
+        self.bid = np.empty(0)
+        self.ask = np.empty(0)
+        self.bid_size = np.empty(0, dtype=np.int64)
+        self.ask_size = np.empty(0, dtype=np.int64)
+        self.volume = np.empty(0, dtype=np.int64)
+
+        self.published_symbols = None  # symbol list of the last publish, with its cached row lookups
+        self.published_rows = None
+        self.published_board_rows = None
+        self.total_ticks = 0
+        self.tick_carry = 0.0
+        self.last_advance = None
+        self.driver = None       # thread publishing at a fixed interval, see start_driver
+        self.driver_stop = None
+        self.publishes = 0
+        self.add_symbols(symbols or [])
+
+    def base_price(self, symbol: str) -> float:
+        """Starting price: known tickers keep their usual level, others get a stable pseudo-random one"""
+        if symbol in self.BASE_PRICES:
+            return float(self.BASE_PRICES[symbol])
+        return float(20 + zlib.crc32(symbol.encode()) % 480)
+
+    def add_symbols(self, symbols: List[str]):
+        """Start simulating new symbols"""
+        with self.lock:
+            new = [symbol.upper() for symbol in symbols if symbol.upper() not in self.index]
+            if not new:
+                return
+            for symbol in new:
+                self.index[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+
+            prices = np.array([self.base_price(symbol) for symbol in new])
+            self.open = np.concatenate([self.open, prices])
+            self.last = np.concatenate([self.last, prices])
+            self.bid = np.concatenate([self.bid, prices])
+            self.ask = np.concatenate([self.ask, prices])
+            self.bid_size = np.concatenate([self.bid_size, self.rng.integers(1, 50, len(new)) * 100])
+            self.ask_size = np.concatenate([self.ask_size, self.rng.integers(1, 50, len(new)) * 100])
+            self.volume = np.concatenate([self.volume, self.rng.integers(1_000_000, 50_000_000, len(new))])
+            self._update_book(np.ones(len(self.symbols), dtype=bool))
+
+    def _update_book(self, touched):
+        """Re-derive bid/ask around the last price for the touched symbols"""
+        half_spread = self.last[touched] * self.spread_bps / 2e4
+        self.bid[touched] = np.round(self.last[touched] - half_spread, 2)
+        self.ask[touched] = np.maximum(np.round(self.last[touched] + half_spread, 2), self.bid[touched] + 0.01)
+
+    def step(self, n_ticks: int):
+        """Apply n_ticks trades spread randomly over the symbols, fully vectorized"""
+        with self.lock:
+            self._step(n_ticks)
+
+    def _step(self, n_ticks: int):
+        """step() body; the caller holds self.lock"""
+        n_symbols = len(self.symbols)
+        if n_symbols == 0 or n_ticks <= 0:
+            return
+
+        which = self.rng.integers(0, n_symbols, n_ticks)
+        # Each tick moves its symbol by one per-symbol tick interval of GBM time
+        dt = n_symbols / self.tick_rate / self.SECONDS_PER_YEAR
+        shocks = self.rng.standard_normal(n_ticks)
+        log_returns = (self.drift - 0.5 * self.volatility ** 2) * dt + self.volatility * np.sqrt(dt) * shocks
+        self.last *= np.exp(np.bincount(which, weights=log_returns, minlength=n_symbols))
+
+        trade_sizes = self.rng.integers(1, 10, n_ticks) * 100
+        self.volume += np.bincount(which, weights=trade_sizes, minlength=n_symbols).astype(np.int64)
+
+        touched = np.bincount(which, minlength=n_symbols) > 0
+        n_touched = int(touched.sum())
+        self.bid_size[touched] = self.rng.integers(1, 50, n_touched) * 100
+        self.ask_size[touched] = self.rng.integers(1, 50, n_touched) * 100
+        self._update_book(touched)
+        self.total_ticks += n_ticks
+
+    def advance(self):
+        """Generate the ticks due since the last call at the configured tick rate"""
+        # Quote pool threads call this concurrently; the whole read-modify-write of the clock
+        # and carry is locked so no interval is counted twice
+        with self.lock:
+            now = self.clock()
+            if self.last_advance is None:
+                self.last_advance = now
+                return
+            elapsed = min(now - self.last_advance, self.max_catch_up)
+            self.last_advance = now
+            pending = elapsed * self.tick_rate + self.tick_carry
+            n_ticks = int(pending)
+            self.tick_carry = pending - n_ticks
+            self._step(n_ticks)
+
+    def set_tick_rate(self, tick_rate: float):
+        self.tick_rate = max(1.0, tick_rate)
+
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Current quotes for symbols, adding unknown symbols to the simulation"""
+        self.add_symbols(symbols)
+        self.advance()
+        quotes = {}
+        with self.lock:
+            for symbol in symbols:
+                i = self.index[symbol.upper()]
+                last = float(self.last[i])
+                change = last - float(self.open[i])
+                quotes[symbol] = {
+                    'symbol': symbol,
+                    'last': round(last, 2),
+                    'bid': float(self.bid[i]),
+                    'ask': float(self.ask[i]),
+                    'bid_size': int(self.bid_size[i]),
+                    'ask_size': int(self.ask_size[i]),
+                    'volume': int(self.volume[i]),
+                    'change': round(change, 2),
+                    'percent_change': round(change / float(self.open[i]) * 100, 2),
+                    'source': 'Simulated Market'
+                }
+        return quotes
+
+    def get_quote(self, symbol: str) -> Dict:
+        return self.get_quotes([symbol])[symbol]
+
+    def publish(self, board: QuoteBoard, symbols: List[str]) -> int:
+        """Write current quotes for symbols into a QuoteBoard as whole columns"""
+        with self.publish_lock:
+            if symbols != self.published_symbols:
+                self.add_symbols(symbols)
+                self.published_symbols = list(symbols)
+                self.published_rows = np.fromiter((self.index[symbol.upper()] for symbol in symbols),
+                                                  dtype=np.intp, count=len(symbols))
+                self.published_board_rows = board.rows_for(symbols)
+            self.advance()
+            rows = self.published_rows
+            with self.lock:
+                last = self.last[rows]
+                opens = self.open[rows]
+                columns = {
+                    'last': np.round(last, 2),
+                    'bid': self.bid[rows],
+                    'ask': self.ask[rows],
+                    'bid_size': self.bid_size[rows],
+                    'ask_size': self.ask_size[rows],
+                    'volume': self.volume[rows],
+                    'change': np.round(last - opens, 2),
+                    'percent_change': np.round((last - opens) / opens * 100, 2),
+                }
+            self.publishes += 1
+            return board.write_columns(self.published_board_rows, 'Simulated Market', columns)
+
+    def start_driver(self, board: QuoteBoard, symbols_fn, interval: float = 0.05, on_publish=None):
+        """Publish symbols_fn() onto board every interval seconds from a daemon thread, so ticks flow
+        through the pipeline at tick_rate without anyone polling; on_publish(version) follows each write"""
+        self.stop_driver()
+        self.driver_stop = threading.Event()
+        self.driver = threading.Thread(target=self._drive, args=(self.driver_stop, board, symbols_fn, interval,
+                                                                 on_publish),
+                                       name="market-simulator", daemon=True)
+        self.driver.start()
+        quote_log.info("Simulator driver started: %.0f ticks/s, publishing every %.0f ms",
+                       self.tick_rate, interval * 1000)
+
+    def _drive(self, stop: threading.Event, board: QuoteBoard, symbols_fn, interval: float, on_publish):
+        while not stop.wait(interval):
+            try:
+                symbols = symbols_fn()
+                if not symbols:
+                    continue
+                self.publish(board, symbols)
+                if on_publish is not None:
+                    on_publish(board.version)
+            except Exception as e:
+                quote_log.error("Simulator driver error: %s", e)
+
+    def stop_driver(self):
+        """Stop the publishing thread, if running"""
+        if self.driver is None:
+            return
+        self.driver_stop.set()
+        self.driver.join(timeout=1.0)
+        self.driver = None
+        self.driver_stop = None
+
+
+class NewsStore:
+    """Fixed-capacity ring of news items in arrival order, with provider lookups and a ticker -> item index"""
+
+    # Tickers as written in headlines: 'AAPL', '(NVDA)', 'BRK.B', '$TSLA'
+    TICKER_PATTERN = re.compile(r'(?<![A-Za-z0-9])\$?([A-Z][A-Z0-9]{0,4}(?:\.[A-Z])?)(?![A-Za-z0-9])')
+
+    def __init__(self, capacity: int = 200):
+        self.lock = threading.Lock()
+        self.capacity = capacity
+        self.slots = [None] * capacity  # item id % capacity -> item
+        self.next_id = 0                # ids increase with arrival; the live window is [next_id - capacity, next_id)
+        self.by_ticker = {}             # ticker -> deque of item ids, oldest first
+        self.provider_names = {}        # provider code -> display name
+
+    def set_providers(self, providers):
+        """Precompute provider code -> name for the subscribed providers"""
+        with self.lock:
+            self.provider_names = {provider.code: provider.name for provider in providers}
+
+    def provider_name(self, code: str) -> str:
+        return self.provider_names.get(code, code)
+
+    @classmethod
+    def extract_tickers(cls, item: Dict) -> set:
+        tickers = set(cls.TICKER_PATTERN.findall(item.get('headline', '')))
+        if item.get('symbol'):
+            tickers.add(item['symbol'].upper())
+        return tickers
+
+    def add(self, item: Dict) -> int:
+        """Store an item, evicting the oldest once full; tickers are indexed here, at insert time"""
+        tickers = self.extract_tickers(item)
+        item['tickers'] = tickers
+        with self.lock:
+            item_id = self.next_id
+            slot = item_id % self.capacity
+            evicted = self.slots[slot]
+            if evicted is not None:
+                # The evicted item is the oldest in every ticker list it appears in
+                for ticker in evicted['tickers']:
+                    ids = self.by_ticker[ticker]
+                    ids.popleft()
+                    if not ids:
+                        del self.by_ticker[ticker]
+            self.slots[slot] = item
+            for ticker in tickers:
+                self.by_ticker.setdefault(ticker, deque()).append(item_id)
+            self.next_id += 1
+            return item_id
+
+    def get(self, symbol: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Items newest first, optionally only those indexed under symbol; O(k) in the items returned"""
+        with self.lock:
+            if symbol:
+                ids = reversed(self.by_ticker.get(symbol.upper(), ()))
+            else:
+                ids = range(self.next_id - 1, max(self.next_id - self.capacity, 0) - 1, -1)
+            items = []
+            for item_id in ids:
+                if limit is not None and len(items) >= limit:
+                    break
+                items.append(self.slots[item_id % self.capacity])
+            return items
+
+    def __len__(self):
+        return min(self.next_id, self.capacity)
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {
+                'items': min(self.next_id, self.capacity),
+                'capacity': self.capacity,
+                'received': self.next_id,
+                'tickers': len(self.by_ticker),
+                'providers': len(self.provider_names),
+            }
+
+
 class EnhancedIBKRConnection:
     """Enhanced IBKR connection with full trading functionality and improved data handling"""
     
     def __init__(self):
         self.ib = None
+        # All ib_insync calls run on one loop thread; its events reach Qt through the bridge
+        self.ib_loop = IBEventLoop()
+        self.ib_loop.start()
+        self.ib_timeout = 10.0  # seconds worker threads wait for an IB command
+        self.bridge = IBQtBridge()
+        self.bridge.on('orderStatus', self.on_order_status)
+        self.bridge.on('execDetails', self.on_execution)
+        self.bridge.on('tickNews', self.on_news_tick)
         self.connected = False
         self.next_order_id = 1
         self.orders = {}
-        self.news_headlines = []
+        self.news_store = NewsStore(capacity=200)
         self.news_providers = []
         self.news_subscriptions = {}
+        self.streaming_engine = None
+        self.quote_cache = QuoteCache()
+        self.bar_store = IntradayBarStore()
+        self.quote_board = QuoteBoard()
+        # TRADING_SIM_TICK_RATE sets the simulator's ticks per second for offline stress runs
+        self.simulator = SyntheticMarketSimulator(tick_rate=float(os.environ.get('TRADING_SIM_TICK_RATE', 1000)))
+        self.simulated_market = False
 
         self.load_trade_history()
     
@@ -79,14 +1207,14 @@ class EnhancedIBKRConnection:
             }
             with open('trade_history.json', 'w') as f:
                 json.dump(trade_data, f, default=str, indent=2)
-            print(f"[TRADES] Saved {len(trade_data['trades'])} trades to history")
+            trade_log.info("Saved %d trades to history", len(trade_data['trades']))
         except Exception as e:
-            print(f"Error saving trade history: {e}")
+            trade_log.error("Error saving trade history: %s", e)
     
     def on_execution(self, trade, fill):
         """Handle order executions and save to history"""
         order_id = trade.order.orderId
-        print(f"Order {order_id} executed: {fill.shares} shares at ${fill.price}")
+        trade_log.info("Order %s executed: %s shares at $%s", order_id, fill.shares, fill.price)
         
         # Save to trades history
         trade_record = {
@@ -122,15 +1250,22 @@ class EnhancedIBKRConnection:
                     data = json.load(f)
                     self.trades_history = data.get('trades', [])
                     self.positions = data.get('positions', {})
-                    print(f"Loaded {len(self.trades_history)} historical trades")
+                    trade_log.info("Loaded %d historical trades", len(self.trades_history))
         except Exception as e:
-            print(f"Error loading trade history: {e}")
+            trade_log.error("Error loading trade history: %s", e)
             self.trades_history = []
             self.positions = {}
         
-    def connect(self, host="127.0.0.1", port=7496, client_id=1):
+    def connect(self, host="127.0.0.1", port=7496, client_id=1) -> concurrent.futures.Future:
+        """Connect to TWS/Gateway on the IB loop thread; the Future resolves to True on success"""
+        return self.ib_loop.submit(self._connect_async, host, port, client_id)
+
+    async def _connect_async(self, host, port, client_id) -> bool:
         """Connect to TWS/Gateway with enhanced error handling"""
         try:
+            if self.streaming_engine is not None:
+                self.streaming_engine.stop()
+                self.streaming_engine = None
             if self.ib:
                 try:
                     self.ib.disconnect()
@@ -140,122 +1275,181 @@ class EnhancedIBKRConnection:
             self.ib = IB()
             
             # Add connection timeout and retry logic
-            print(f"Attempting to connect to TWS at {host}:{port} with client ID {client_id}")
-            self.ib.connect(host, port, clientId=client_id, timeout=20)
+            ib_log.info("Attempting to connect to TWS at %s:%s with client ID %s", host, port, client_id)
+            await self.ib.connectAsync(host, port, clientId=client_id, timeout=20)
             
             if self.ib.isConnected():
                 self.connected = True
                 self.next_order_id = self.ib.client.getReqId()
                 
-                # Set up event handlers
-                self.ib.orderStatusEvent += self.on_order_status
-                self.ib.execDetailsEvent += self.on_execution
-                self.ib.tickNewsEvent += self.on_news_tick
+                # Set up event handlers; they fire on the loop thread and are handled on the GUI thread
+                self.ib.orderStatusEvent += self.bridge.forward('orderStatus')
+                self.ib.execDetailsEvent += self.bridge.forward('execDetails')
+                self.ib.tickNewsEvent += self.bridge.forward('tickNews')
                 
                 # Test the connection with a simple request
                 try:
-                    account_summary = self.ib.accountSummary()
-                    print(f"Connection test successful - Found {len(account_summary)} account values")
+                    account_summary = await self.ib.accountSummaryAsync()
+                    ib_log.info("Connection test successful - Found %d account values", len(account_summary))
                 except Exception as test_e:
-                    print(f"Connection test warning: {test_e}")
+                    ib_log.warning("Connection test warning: %s", test_e)
                 
-                self._setup_news_feeds()
-                
-                print(f"Successfully connected to TWS at {host}:{port}")
+                await self._setup_news_feeds()
+
+                # Live quotes are pushed through pendingTickersEvent; fall back to
+                # delayed data for symbols without a market data subscription
+                self.ib.reqMarketDataType(3)
+                self.streaming_engine = IBStreamingQuoteEngine(self.ib, self.ib_loop, quote_board=self.quote_board)
+
+                ib_log.info("Successfully connected to TWS at %s:%s", host, port)
                 return True
             else:
-                print("Failed to connect to TWS")
+                ib_log.warning("Failed to connect to TWS")
                 return False
                 
         except Exception as e:
-            print(f"Connection error: {e}")
-            import traceback
-            traceback.print_exc()
+            ib_log.exception("Connection error: %s", e)
             self.connected = False
             return False
 
     
-    def disconnect(self):
-        """Disconnect from TWS"""
+    def disconnect(self) -> concurrent.futures.Future:
+        """Disconnect from TWS on the IB loop thread"""
+        return self.ib_loop.submit(self._disconnect)
+
+    def _disconnect(self):
         try:
+            if self.streaming_engine is not None:
+                self.streaming_engine.stop()
+                self.streaming_engine = None
+            self.quote_cache.invalidate()
             if self.ib and self.ib.isConnected():
                 self.ib.disconnect()
             self.connected = False
-            print("Disconnected from TWS")
+            ib_log.info("Disconnected from TWS")
         except Exception as e:
-            print(f"Disconnect error: {e}")
+            ib_log.error("Disconnect error: %s", e)
     
     
     def get_real_time_data(self, symbol: str) -> Dict:
-        """Force Yahoo Finance quotes for the UI regardless of TWS connection."""
-        print(f"[DATA MODE] Yahoo-only quotes for {symbol} (ignoring TWS)")
+        """Streamed TWS quote when available, Yahoo Finance otherwise (cached, single-flight)"""
+        return self.quote_cache.get_or_fetch(('realtime', symbol), lambda: self._fetch_real_time_data(symbol))
+
+    def _fetch_real_time_data(self, symbol: str) -> Dict:
+        """Uncached quote lookup behind get_real_time_data"""
+        if self.simulated_market:
+            return self.simulator.get_quote(symbol)
+        if self.connected and self.streaming_engine is not None:
+            self.streaming_engine.subscribe(symbol)
+            quote = self.streaming_engine.get_quote(symbol)
+            if quote is not None:
+                return quote
         return self.get_fallback_data(symbol)
 
+    def get_streaming_symbols(self, symbols: List[str]) -> List[str]:
+        """Symbols whose quotes are pushed onto the quote board by TWS; the rest need the fallback"""
+        streamed = []
+        if self.simulated_market or not self.connected or self.streaming_engine is None:
+            return streamed
+        for symbol in symbols:
+            self.streaming_engine.subscribe(symbol)
+            if self.streaming_engine.quote_values(symbol) is not None:
+                streamed.append(symbol)
+        return streamed
+
+    def publish_simulated_quotes(self, symbols: List[str]) -> int:
+        """Advance the simulator and write its quotes for symbols onto the quote board"""
+        return self.simulator.publish(self.quote_board, symbols)
+
+    def subscribe_market_data(self, symbols: List[str]):
+        """Start streaming quotes for the given symbols"""
+        if self.streaming_engine is not None:
+            self.streaming_engine.subscribe_many(symbols)
+
+    def unsubscribe_market_data(self, symbol: str):
+        """Stop streaming quotes for a symbol"""
+        if self.streaming_engine is not None:
+            self.streaming_engine.unsubscribe(symbol)
+
 
     def get_fallback_data(self, symbol: str) -> Dict:
-        """Fallback to Yahoo Finance for demo/paper trading"""
+        """Fallback to Yahoo Finance for demo/paper trading (cached, single-flight)"""
+        return self.quote_cache.get_or_fetch(('fallback', symbol), lambda: self._fetch_fallback_data(symbol))
+
+    def _fetch_fallback_data(self, symbol: str) -> Dict:
+        """Uncached Yahoo Finance refresh behind get_fallback_data"""
+        if self.simulated_market:
+            return self.simulator.get_quote(symbol)
         try:
-            import yfinance as yf
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period="1d", interval="1m")
-            
-            if not data.empty:
-                last_price = float(data['Close'].iloc[-1])
-                prev_close = float(data['Open'].iloc[0])
-                change = last_price - prev_close
-                percent_change = (change / prev_close * 100) if prev_close else 0
-                volume = int(data['Volume'].sum())
-                
-                print(f"[YAHOO] Got data for {symbol}: Last=${last_price:.2f}, Change={change:+.2f}")
-                
-                return {
-                    'symbol': symbol,
-                    'last': last_price,
-                    'bid': last_price * 0.999,
-                    'ask': last_price * 1.001,
-                    'volume': volume,
-                    'change': change,
-                    'percent_change': percent_change,
-                    'source': 'Yahoo Finance (Demo)'
-                }
+            self.bar_store.refresh([symbol])
+            quote = self.bar_store.get_quote(symbol)
+            if quote is not None:
+                return quote
         except Exception as e:
-            print(f"Fallback data error for {symbol}: {e}")
-        
+            quote_log.warning("Fallback data error for %s: %s", symbol, e)
+
         # Final fallback - return mock data instead of None
         return self.get_mock_data(symbol)
 
+    def get_batch_fallback_data(self, symbols: List[str], batch_size: int = 50) -> Dict[str, Dict]:
+        """Fetch Yahoo Finance quotes for many symbols with one download per batch"""
+        # Only symbols with no fresh cached quote and no fetch already in flight are downloaded
+        def fetch_missing(keys):
+            quotes = self._download_batch_quotes([symbol for _, symbol in keys], batch_size)
+            return {('fallback', symbol): quote for symbol, quote in quotes.items()}
+
+        results, errors = self.quote_cache.get_or_fetch_many(
+            [('fallback', symbol) for symbol in symbols], fetch_missing
+        )
+        for (_, symbol), error in errors.items():
+            quote_log.warning("Batch fallback data error for %s: %s", symbol, error)
+        return {symbol: quote for (_, symbol), quote in results.items()}
+
+    def _download_batch_quotes(self, symbols: List[str], batch_size: int) -> Dict[str, Dict]:
+        """Incremental bar refresh per batch of symbols, read back as per-symbol quotes"""
+        if self.simulated_market:
+            return self.simulator.get_quotes(symbols)
+        quotes = {}
+        for start in range(0, len(symbols), batch_size):
+            batch = symbols[start:start + batch_size]
+            try:
+                self.bar_store.refresh(batch)
+            except Exception as e:
+                quote_log.warning("Batch fallback data error for %s: %s", batch, e)
+
+            for symbol in batch:
+                quote = self.bar_store.get_quote(symbol)
+                # Final fallback - mock data, same as the single-symbol path
+                quotes[symbol] = quote if quote is not None else self.get_mock_data(symbol)
+
+        quote_log.debug("Batched refresh for %d symbols in %d batch(es)",
+                        len(symbols), (len(symbols) + batch_size - 1) // batch_size)
+        return quotes
 
     def get_mock_data(self, symbol: str) -> Dict:
-        """Generate realistic mock data for development"""
-        import random
-        base_price = {
-            'AAPL': 175, 'GOOGL': 135, 'TSLA': 250, 'AMZN': 145, 
-            'MSFT': 415, 'NVDA': 430, 'META': 485, 'SPY': 450, 
-            'QQQ': 380, 'AMD': 140
-        }.get(symbol, 100)
-        
-        last_price = base_price + random.uniform(-5, 5)
-        change = random.uniform(-3, 3)
-        
-        return {
-            'symbol': symbol,
-            'last': round(last_price, 2),
-            'bid': round(last_price * 0.999, 2),
-            'ask': round(last_price * 1.001, 2),
-            'volume': random.randint(1000000, 50000000),
-            'change': round(change, 2),
-            'percent_change': round((change / last_price * 100), 2),
-            'source': 'Mock Data (Development)'
-        }
+        """Simulated quote used when no real data source answers"""
+        quote = self.simulator.get_quote(symbol)
+        quote['source'] = 'Mock Data (Development)'
+        return quote
+
+    def set_simulated_market(self, enabled: bool):
+        """Serve every quote from the synthetic market instead of TWS/Yahoo"""
+        self.simulated_market = enabled
+        self.quote_cache.invalidate()
+        quote_log.info("Simulated market data %s", 'enabled' if enabled else 'disabled')
     
-    def place_order(self, symbol: str, action: str, quantity: int, order_type: str, **kwargs) -> tuple:
+    def place_order(self, symbol: str, action: str, quantity: int, order_type: str, **kwargs) -> concurrent.futures.Future:
+        """Place an order on the IB loop thread; the Future resolves to (success, order id or error)"""
+        return self.ib_loop.submit(self._place_order_async, symbol, action, quantity, order_type, **kwargs)
+
+    async def _place_order_async(self, symbol: str, action: str, quantity: int, order_type: str, **kwargs) -> tuple:
         """Place order with enhanced error handling"""
         if not self.connected or self.ib is None or not self.ib.isConnected():
             return False, "Not connected to TWS"
             
         try:
             contract = Stock(symbol, "SMART", "USD")
-            qualified_contracts = self.ib.qualifyContracts(contract)
+            qualified_contracts = await self.ib.qualifyContractsAsync(contract)
             if not qualified_contracts:
                 return False, "Could not qualify contract"
                 
@@ -283,36 +1477,111 @@ class EnhancedIBKRConnection:
                     'status': 'Submitted',
                     'trade': trade
                 }
-                print(f"Order placed: {action} {quantity} {symbol} ({order_type}) - Order ID: {order.orderId}")
+                trade_log.info("Order placed: %s %s %s (%s) - Order ID: %s", action, quantity, symbol, order_type, order.orderId)
                 return True, str(order.orderId)
             else:
                 return False, "Failed to place order"
         except Exception as e:
-            print(f"Order error: {e}")
+            trade_log.error("Order error: %s", e)
+            return False, str(e)
+    
+    def place_bracket_order(self, symbol, action, quantity, limit_price, take_profit, stop_loss) -> concurrent.futures.Future:
+        """Place a bracket order on the IB loop thread; the Future resolves to (success, parent order id or error)"""
+        return self.ib_loop.submit(self._place_bracket_order_async, symbol, action, quantity,
+                                   limit_price, take_profit, stop_loss)
+
+    async def _place_bracket_order_async(self, symbol, action, quantity, limit_price, take_profit, stop_loss) -> tuple:
+        """Place bracket order (parent + take profit + stop loss)"""
+        if not self.connected or self.ib is None or not self.ib.isConnected():
+            return False, "Not connected to TWS"
+        try:
+            contract = Stock(symbol, "SMART", "USD")
+            qualified = await self.ib.qualifyContractsAsync(contract)
+            if not qualified:
+                return False, "Could not qualify contract"
+            contract = qualified[0]
+            
+            # Parent order
+            parent = Order()
+            parent.orderId = self.next_order_id
+            self.next_order_id += 1
+            parent.action = action.upper()
+            parent.orderType = 'LMT'
+            parent.lmtPrice = limit_price
+            parent.totalQuantity = quantity
+            parent.transmit = False  # Don't transmit yet
+            
+            # Take profit
+            tp = Order()
+            tp.orderId = self.next_order_id
+            self.next_order_id += 1
+            tp.action = 'SELL' if action == 'BUY' else 'BUY'
+            tp.orderType = 'LMT'
+            tp.lmtPrice = take_profit
+            tp.totalQuantity = quantity
+            tp.parentId = parent.orderId
+            tp.transmit = False
+            
+            # Stop loss
+            sl = Order()
+            sl.orderId = self.next_order_id
+            self.next_order_id += 1
+            sl.action = 'SELL' if action == 'BUY' else 'BUY'
+            sl.orderType = 'STP'
+            sl.auxPrice = stop_loss
+            sl.totalQuantity = quantity
+            sl.parentId = parent.orderId
+            sl.transmit = True  # Transmit the bracket
+            
+            # Place orders
+            self.ib.placeOrder(contract, parent)
+            self.ib.placeOrder(contract, tp)
+            self.ib.placeOrder(contract, sl)
+            return True, str(parent.orderId)
+        except Exception as e:
+            trade_log.error("Bracket order error: %s", e)
             return False, str(e)
     
     def cancel_all_orders(self) -> bool:
         """Cancel all open orders"""
-        if not self.connected or self.ib is None or not self.ib.isConnected():
+        if not self.connected or self.ib is None:
             return False
+        self.ib_loop.submit(self._cancel_all_orders)
+        return True
+
+    def _cancel_all_orders(self) -> bool:
         try:
             self.ib.reqGlobalCancel()
-            print("Requested cancellation of all orders")
+            trade_log.info("Requested cancellation of all orders")
             return True
         except Exception as e:
-            print(f"Error cancelling orders: {e}")
+            trade_log.error("Error cancelling orders: %s", e)
             return False
     
     def get_portfolio_data(self) -> Dict:
-        """Get portfolio data with fallback to mock data"""
+        """Get portfolio data with fallback to mock data; blocks on the IB loop, so not for the GUI thread"""
+        if not self.connected or self.ib is None:
+            portfolio_log.debug("Not connected, using mock data")
+            return self.get_mock_portfolio_data()
+        try:
+            return self.request_portfolio_data().result(timeout=self.ib_timeout)
+        except Exception as e:
+            portfolio_log.error("Error getting portfolio data: %s", e)
+            return self.get_mock_portfolio_data()
+
+    def request_portfolio_data(self) -> concurrent.futures.Future:
+        """Portfolio snapshot assembled on the IB loop thread"""
+        return self.ib_loop.submit(self._portfolio_data_async)
+
+    async def _portfolio_data_async(self) -> Dict:
         if not self.connected or self.ib is None or not self.ib.isConnected():
-            print("[PORTFOLIO] Not connected, using mock data")
+            portfolio_log.debug("Not connected, using mock data")
             return self.get_mock_portfolio_data()
             
         try:
-            account_values = self.ib.accountSummary()
+            account_values = await self.ib.accountSummaryAsync()
             portfolio_items = self.ib.portfolio()
-            print(f"[PORTFOLIO] Found {len(portfolio_items)} portfolio items")
+            portfolio_log.debug("Found %d portfolio items", len(portfolio_items))
             
             total_value = 0.0
             cash_balance = 0.0
@@ -342,7 +1611,10 @@ class EnhancedIBKRConnection:
                     pnl_pct = (unrealized_pnl / abs(market_value - unrealized_pnl) * 100) if market_value != unrealized_pnl else 0.0
                     
                     positions.append({
+                        'con_id': item.contract.conId,
                         'symbol': item.contract.symbol,
+                        'sec_type': item.contract.secType,
+                        'multiplier': float(item.contract.multiplier or 1),
                         'quantity': int(item.position),
                         'avg_cost': avg_cost,
                         'current_price': current_price,
@@ -361,7 +1633,7 @@ class EnhancedIBKRConnection:
                 'account_summary': account_summary
             }
         except Exception as e:
-            print(f"Error getting portfolio data: {e}")
+            portfolio_log.error("Error getting portfolio data: %s", e)
             return self.get_mock_portfolio_data()
     
     def get_mock_portfolio_data(self):
@@ -427,31 +1699,32 @@ class EnhancedIBKRConnection:
         
         if order_id in self.orders:
             self.orders[order_id]['status'] = status
-            print(f"Order {order_id} status: {status}")
+            trade_log.info("Order %s status: %s", order_id, status)
     
     def on_execution(self, trade, fill):
         """Handle order executions"""
         order_id = trade.order.orderId
-        print(f"Order {order_id} executed: {fill.shares} shares at ${fill.price}")
+        trade_log.info("Order %s executed: %s shares at $%s", order_id, fill.shares, fill.price)
 
     def get_open_orders(self):
         """Get current open orders"""
         if self.connected and self.ib:
-            return self.ib.openOrders()
+            return self.ib_loop.call(self.ib.openOrders, timeout=self.ib_timeout)
         return []
 
     def get_executions(self):
         """Get recent executions"""
         if self.connected and self.ib:
-            return self.ib.executions()
+            return self.ib_loop.call(self.ib.executions, timeout=self.ib_timeout)
         return []
 
-    def _setup_news_feeds(self):
+    async def _setup_news_feeds(self):
         """Setup TWS news feeds"""
         try:
             if self.ib is not None and self.ib.isConnected():
-                providers = self.ib.reqNewsProviders()
+                providers = await self.ib.reqNewsProvidersAsync()
                 self.news_providers = providers
+                self.news_store.set_providers(providers)
                 for provider in self.news_providers:
                     news_contract = Contract()
                     news_contract.symbol = f"{provider.code}:{provider.code}_ALL"
@@ -459,38 +1732,210 @@ class EnhancedIBKRConnection:
                     news_contract.exchange = provider.code
                     self.ib.reqMktData(news_contract, "mdoff,292", False, False)
                     self.news_subscriptions[provider.code] = news_contract
-                print(f"Subscribed to {len(self.news_providers)} news providers")
+                news_log.info("Subscribed to %d news providers", len(self.news_providers))
         except Exception as e:
-            print(f"Error setting up news feeds: {e}")
+            news_log.error("Error setting up news feeds: %s", e)
 
     def on_news_tick(self, reqId, timeStamp, providerCode, articleId, headline, extraData=None):
         """Handle news tick events"""
-        print(f"News tick received: provider={providerCode}, headline={headline}")
-        provider_name = next((p.name for p in self.news_providers if p.code == providerCode), providerCode)
+        news_log.debug("News tick received: provider=%s, headline=%s", providerCode, headline)
         news_item = {
             'reqId': reqId,
             'timestamp': datetime.fromtimestamp(timeStamp),
-            'provider': provider_name,
+            'provider': self.news_store.provider_name(providerCode),
             'provider_code': providerCode,
             'articleId': articleId,
             'headline': headline,
             'received_at': datetime.now(),
         }
-        self.news_headlines.append(news_item)
-        if len(self.news_headlines) > 200:
-            self.news_headlines = self.news_headlines[-200:]
+        self.news_store.add(news_item)
 
     def get_tws_news(self, symbol=None):
-        """Get TWS news headlines"""
-        filtered = self.news_headlines[-200:]
-        if symbol:
-            symbol = symbol.upper()
-            filtered = [n for n in filtered if symbol in n.get('headline', '').upper()]
-        return sorted(filtered, key=lambda x: x['received_at'], reverse=True)
+        """Get TWS news headlines, newest first"""
+        return self.news_store.get(symbol)
+
+class OHLCVCache:
+    """On-disk bar history per (symbol, interval): memory-mappable .npy columns plus a small JSON sidecar.
+    Loads come from disk; only bars after the last cached one are downloaded."""
+
+    DTYPE = np.dtype([('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'),
+                      ('volume', 'f8')])  # time: UTC epoch nanoseconds of the bar open
+    COLUMNS = {'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close', 'volume': 'Volume'}
+    SESSION_PERIODS = {'1d': 1, '5d': 5}  # like yfinance, these count trading sessions, not calendar days
+    PERIOD_DAYS = {'1mo': 31, '3mo': 92, '6mo': 183, '1y': 366, '2y': 731,
+                   '5y': 1827, '10y': 3653}
+    MAX_AGE = 300  # seconds before a cached series is topped up again (one bar, for shorter intervals)
+
+    def __init__(self, cache_dir: str = 'chart_cache'):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()  # guards key_locks
+        self.key_locks = {}           # (symbol, interval) -> lock, so a prefetch never blocks another symbol's load
+        self.hits = 0
+        self.downloads = 0
+        self.bars_downloaded = 0
+
+    def _key_lock(self, symbol: str, interval: str):
+        with self.lock:
+            return self.key_locks.setdefault((symbol.upper(), interval), threading.Lock())
+
+    def _paths(self, symbol: str, interval: str):
+        stem = os.path.join(self.cache_dir, f"{symbol.upper().replace('/', '_')}_{interval}")
+        return stem + '.npy', stem + '.json'
+
+    def load(self, symbol: str, interval: str):
+        """Cached bars (memory-mapped, read-only) and metadata, or (None, None)"""
+        data_path, meta_path = self._paths(symbol, interval)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            return np.load(data_path, mmap_mode='r'), meta
+        except (OSError, ValueError):
+            return None, None
+
+    def save(self, symbol: str, interval: str, bars, meta: Dict):
+        """Write atomically so a crash never leaves a half-written series behind"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path, meta_path = self._paths(symbol, interval)
+        with open(data_path + '.tmp', 'wb') as f:
+            np.save(f, np.ascontiguousarray(bars, dtype=self.DTYPE))
+        os.replace(data_path + '.tmp', data_path)
+        with open(meta_path + '.tmp', 'w') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    @classmethod
+    def to_bars(cls, df):
+        """yfinance history frame -> structured bar array"""
+        bars = np.empty(len(df), dtype=cls.DTYPE)
+        index = df.index if df.index.tz is not None else df.index.tz_localize('UTC')
+        bars['time'] = index.tz_convert('UTC').tz_localize(None).to_numpy(dtype='datetime64[ns]').view('i8')
+        for field, column in cls.COLUMNS.items():
+            bars[field] = df[column].to_numpy(dtype=float)
+        return bars
+
+    @classmethod
+    def to_frame(cls, bars, tz: Optional[str]):
+        index = pd.to_datetime(np.asarray(bars['time']), utc=True)
+        if tz:
+            index = index.tz_convert(tz)
+        return pd.DataFrame({column: np.asarray(bars[field]) for field, column in cls.COLUMNS.items()}, index=index)
+
+    @staticmethod
+    def merge(cached, new):
+        """Cached bars before the first new bar, then the new bars (which replace a still-forming last bar)"""
+        if cached is None or not len(cached):
+            return new
+        if not len(new):
+            return np.asarray(cached)
+        keep = np.searchsorted(cached['time'], new['time'][0], side='left')
+        return np.concatenate([cached[:keep], new])
+
+    def period_start_ns(self, period: str, times, tz: Optional[str]) -> Optional[int]:
+        """Start of a yfinance period for bars at times (sorted UTC ns), counted back from the last bar;
+        None for 'max'. '1d'/'5d' are the last sessions (exchange-local dates with bars), longer periods
+        calendar days."""
+        if period == 'max':
+            return None
+        last_ns = int(times[-1])
+        sessions = self.SESSION_PERIODS.get(period)
+        if sessions is not None:
+            index = pd.to_datetime(np.asarray(times), utc=True)
+            days = (index.tz_convert(tz) if tz else index).normalize()
+            session_days = days.unique()
+            if len(session_days) < sessions:
+                # Fewer sessions than asked for: only a download that reached further back covers the period
+                return int(times[0]) - 1
+            return int(times[days.searchsorted(session_days[-sessions])])
+        if period == 'ytd':
+            last = pd.Timestamp(last_ns, tz='UTC')
+            return pd.Timestamp(year=last.year, month=1, day=1, tz='UTC').value
+        return last_ns - self.PERIOD_DAYS.get(period, 183) * 86400 * 10**9
+
+    @staticmethod
+    def covers(meta: Dict, start: Optional[int]) -> bool:
+        """Whether the cached series reaches back to start (None meaning the whole history)"""
+        covered_from = meta.get('covered_from')
+        if covered_from == 'max':
+            return True
+        return start is not None and covered_from is not None and covered_from <= start
+
+    def get_history(self, symbol: str, interval: str = "1d", period: str = "6mo", max_age: Optional[float] = None):
+        """Bars for symbol/interval covering period, served from disk and topped up incrementally"""
+        if max_age is None:
+            max_age = min(ProfessionalTradingChart.INTERVAL_SECONDS.get(interval, 86400), self.MAX_AGE)
+        with self._key_lock(symbol, interval):
+            cached, meta = self.load(symbol, interval)
+            meta = dict(meta or {})
+            covered = (cached is not None and len(cached) > 0
+                       and self.covers(meta, self.period_start_ns(period, cached['time'], meta.get('tz'))))
+            now = time.time()
+
+            if covered and now - meta.get('updated', 0) < max_age:
+                self.hits += 1
+            else:
+                ticker = yf.Ticker(symbol)
+                df = None
+                if covered:
+                    # Only the range from the last cached bar on; that bar is re-fetched as it may still have been forming
+                    last = pd.Timestamp(int(cached['time'][-1]), tz='UTC')
+                    try:
+                        df = ticker.history(start=last.to_pydatetime(), interval=interval)
+                    except Exception as e:
+                        chart_log.warning("Incremental history for %s %s failed: %s", symbol, interval, e)
+                    # The range starts at a bar that exists, so an empty frame is how yfinance reports a
+                    # failure (e.g. 1m bars older than its intraday look-back): download the full period
+                    if df is not None and df.empty:
+                        chart_log.info("Incremental history for %s %s was empty, downloading %s", symbol,
+                                       interval, period)
+                        df = None
+                if df is None:
+                    df = ticker.history(period=period, interval=interval)
+                    if not df.empty:
+                        tz = str(df.index.tz) if df.index.tz is not None else None
+                        start = self.period_start_ns(period, self.to_bars(df)['time'], tz)
+                        previous = meta.get('covered_from')
+                        if start is None or previous == 'max':
+                            meta['covered_from'] = 'max'
+                        else:
+                            meta['covered_from'] = start if previous is None else min(previous, start)
+                if df.empty:
+                    if cached is None or not len(cached):
+                        return df
+                    # Nothing came back: serve the cached bars, but leave them due so the next call retries
+                    chart_log.warning("No history returned for %s %s, serving cached bars", symbol, interval)
+                else:
+                    new = self.to_bars(df)
+                    self.downloads += 1
+                    self.bars_downloaded += len(new)
+                    cached = self.merge(cached, new)
+                    meta['updated'] = now
+                    if df.index.tz is not None:
+                        meta['tz'] = str(df.index.tz)
+                    self.save(symbol, interval, cached, meta)
+
+            start = self.period_start_ns(period, cached['time'], meta.get('tz'))
+            if start is not None:
+                cached = cached[np.searchsorted(cached['time'], start, side='left'):]
+            return self.to_frame(cached, meta.get('tz'))
+
+    def get_stats(self) -> Dict:
+        return {'hits': self.hits, 'downloads': self.downloads, 'bars_downloaded': self.bars_downloaded}
+
 
 class ProfessionalTradingChart(FigureCanvas):
     """Professional TWS-style trading chart with multiple timeframes"""
     
+    data_ready = pyqtSignal(int, object)  # load generation, chart data; emitted from the loader thread
+    
+    UP_COLOR = '#26a69a'
+    DOWN_COLOR = '#ef5350'
+    BODY_WIDTH = 0.8
+    LOD_BAR_PIXELS = 3  # narrowest candle drawn before neighbouring bars are merged into buckets
+    ZOOM_FACTOR = 1.25  # x range change per mouse-wheel notch
+    MIN_VISIBLE_BARS = 10
+    INTERVAL_SECONDS = {'1m': 60, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600, '4h': 14400,
+                        '1d': 86400, '1wk': 604800, '1mo': 2592000}
+    
     def __init__(self, parent=None):
         self.figure = Figure(figsize=(12, 8), facecolor='#0d1421')
         super().__init__(self.figure)
@@ -499,48 +1944,152 @@ class ProfessionalTradingChart(FigureCanvas):
         self.timeframe = "1d"
         self.period = "6mo"
         self.indicators = ['SMA20', 'SMA50', 'Volume', 'RSI']
+        self.live = True  # move the newest bar with incoming quotes
+        self.bar_cache = OHLCVCache()
+        # History and indicators are computed off the GUI thread; only the newest request is rendered
+        self.load_generation = 0
+        self.load_future = None
+        self.loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-load')
+        self.prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-prefetch')
+        self.prefetch_futures = {}
+        self.data_ready.connect(self.apply_chart_data)
+        self._reset_artists()
+        # Every full draw refreshes the blitting background
+        self.mpl_connect('draw_event', self._on_draw)
+        self.mpl_connect('resize_event', lambda event: self._render_lod())
+        # Wheel zooms around the cursor, left-drag pans, double-click shows everything again
+        self.mpl_connect('scroll_event', self._on_scroll)
+        self.mpl_connect('button_press_event', self._on_press)
+        self.mpl_connect('motion_notify_event', self._on_motion)
+        self.mpl_connect('button_release_event', self._on_release)
+        self.pan_start = None
+    
+    def _reset_artists(self):
+        """Forget artist references; called whenever the figure is rebuilt"""
+        self.ax_price = self.ax_volume = self.ax_rsi = None
+        self.wicks = self.bodies = self.dojis = self.volume_bars = None
+        self.sma_lines = {}
+        self.rsi_line = None
+        self.line_values = {}    # full-resolution y values of each indicator line, one per bar including the live bar
+        self.history = None      # OHLCV arrays of the completed bars shown by the collections
+        self.bar_times = None    # bar open times by x position, the live bar included
+        self.lod_key = None      # (bucket size, first bar, last bar, bar count) the collections were built for
+        self.live_bar = None     # the newest bar, drawn by the animated live artists
+        self.live_artists = []
+        self.live_wick = self.live_body = self.live_price_line = self.live_volume = None
+        self.background = None
         
     def update_chart(self, symbol: str, timeframe: str = "1d", period: str = "6mo"):
-        """Update chart with professional candlestick display and indicators"""
+        """Load history and indicators on the loader thread; the chart is rebuilt when the newest request lands"""
         self.symbol = symbol
         self.timeframe = timeframe
         self.period = period
-        
+        self.load_generation += 1
+        # The shown bars belong to the previous request, so stop ticking them
+        self.live_bar = None
+        if self.load_future is not None:
+            self.load_future.cancel()
+        self.load_future = self.loader.submit(self._load_chart_data, self.load_generation, symbol, timeframe, period)
+    
+    def _load_chart_data(self, generation: int, symbol: str, timeframe: str, period: str):
+        """Loader thread: fetch bars and compute indicators, giving up once a newer request exists"""
+        try:
+            if generation != self.load_generation:
+                return
+            df = self.bar_cache.get_history(symbol, timeframe, period)
+            if generation != self.load_generation:
+                return
+            indicators = {}
+            if not df.empty:
+                if len(df) >= 20:
+                    indicators['SMA20'] = df['Close'].rolling(20).mean()
+                if len(df) >= 50:
+                    indicators['SMA50'] = df['Close'].rolling(50).mean()
+                if len(df) >= 14:
+                    indicators['RSI'] = ta.rsi(df['Close'], length=14)
+            self.data_ready.emit(generation, (symbol, timeframe, df, indicators))
+        except Exception as e:
+            chart_log.error("Error loading chart data for %s: %s", symbol, e)
+    
+    def apply_chart_data(self, generation: int, data):
+        """GUI thread: render a finished load unless the user has moved on"""
+        if generation != self.load_generation:
+            chart_log.debug("Dropped stale chart data for %s", data[0])
+            return
+        symbol, timeframe, df, indicators = data
+        self.render_chart(symbol, timeframe, df, indicators)
+    
+    def prefetch(self, symbols: List[str], timeframe: Optional[str] = None, period: Optional[str] = None):
+        """Warm the bar cache for symbols likely to be opened next; earlier queued prefetches are dropped"""
+        timeframe = timeframe or self.timeframe
+        period = period or self.period
+        wanted = [(symbol, timeframe, period) for symbol in symbols if symbol and symbol != self.symbol]
+        for key, future in list(self.prefetch_futures.items()):
+            if future.done() or (key not in wanted and future.cancel()):
+                del self.prefetch_futures[key]
+        for key in wanted:
+            if key not in self.prefetch_futures:
+                self.prefetch_futures[key] = self.prefetcher.submit(self._prefetch_one, *key)
+    
+    def _prefetch_one(self, symbol: str, timeframe: str, period: str):
+        try:
+            self.bar_cache.get_history(symbol, timeframe, period)
+        except Exception as e:
+            chart_log.debug("Prefetch of %s %s failed: %s", symbol, timeframe, e)
+    
+    def shutdown(self):
+        """Drop queued loads and prefetches without waiting for downloads already running"""
+        self.load_generation += 1  # a load still running finds itself stale
+        # Cancel by hand: Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in [self.load_future, *self.prefetch_futures.values()]:
+            if future is not None:
+                future.cancel()
+        self.loader.shutdown(wait=False)
+        self.prefetcher.shutdown(wait=False)
+    
+    def render_chart(self, symbol: str, timeframe: str, df, indicators: Dict):
+        """Rebuild the figure from loaded bars and precomputed indicators"""
         try:
             self.figure.clear()
-            
-            # Get data with proper date handling
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(period=period, interval=timeframe)
+            self._reset_artists()
             
             if df.empty:
+                self.draw()
                 return
-            
             # Create subplots: Price (main), Volume, RSI
             gs = self.figure.add_gridspec(4, 1, height_ratios=[3, 1, 1, 0.5], hspace=0.1)
             ax_price = self.figure.add_subplot(gs[0])
             ax_volume = self.figure.add_subplot(gs[1], sharex=ax_price)
             ax_rsi = self.figure.add_subplot(gs[2], sharex=ax_price)
+            self.ax_price, self.ax_volume, self.ax_rsi = ax_price, ax_volume, ax_rsi
             
-            # Plot candlesticks
-            self._plot_professional_candlesticks(ax_price, df)
+            # Plot candlesticks; the newest bar is drawn by the live artists so quotes can move it
+            completed = df.iloc[:-1]
+            x, o, h, l, c = self._ohlc_arrays(completed)
+            self.history = {'x': x, 'open': o, 'high': h, 'low': l, 'close': c,
+                            'volume': np.nan_to_num(completed['Volume'].to_numpy(dtype=float))}
+            self._plot_professional_candlesticks(ax_price, completed)
             
             # Add moving averages
-            if 'SMA20' in self.indicators and len(df) >= 20:
-                sma20 = df['Close'].rolling(20).mean()
-                ax_price.plot(range(len(df)), sma20, color='#00d4ff', linewidth=1.5, alpha=0.8, label='SMA 20')
+            if 'SMA20' in self.indicators and 'SMA20' in indicators:
+                self.sma_lines[20], = ax_price.plot(range(len(df)), indicators['SMA20'], color='#00d4ff', linewidth=1.5,
+                                                    alpha=0.8, label='SMA 20')
+                self.line_values[self.sma_lines[20]] = indicators['SMA20'].to_numpy(dtype=float)
             
-            if 'SMA50' in self.indicators and len(df) >= 50:
-                sma50 = df['Close'].rolling(50).mean()
-                ax_price.plot(range(len(df)), sma50, color='#ff6b35', linewidth=1.5, alpha=0.8, label='SMA 50')
+            if 'SMA50' in self.indicators and 'SMA50' in indicators:
+                self.sma_lines[50], = ax_price.plot(range(len(df)), indicators['SMA50'], color='#ff6b35', linewidth=1.5,
+                                                    alpha=0.8, label='SMA 50')
+                self.line_values[self.sma_lines[50]] = indicators['SMA50'].to_numpy(dtype=float)
             
             # Volume bars
             if 'Volume' in self.indicators:
-                self._plot_volume_bars(ax_volume, df)
+                self._plot_volume_bars(ax_volume, completed)
+            
+            self._start_live_bar(df)
             
             # RSI
             if 'RSI' in self.indicators:
-                self._plot_rsi(ax_rsi, df)
+                self._plot_rsi(ax_rsi, indicators.get('RSI'))
             
             # Style all axes
             self._style_professional_axes(ax_price, ax_volume, ax_rsi, df)
@@ -556,65 +2105,365 @@ class ProfessionalTradingChart(FigureCanvas):
             self._format_date_axis(ax_rsi, df)
             
             self.figure.subplots_adjust(left=0.08, right=0.95, top=0.95, bottom=0.08)
+            # Zooming and panning re-bucket the bars for the new view, whichever of the shared axes moved
+            for ax in (ax_price, ax_volume, ax_rsi):
+                ax.callbacks.connect('xlim_changed', lambda ax: self._render_lod())
+            self._render_lod(force=True)
             self.draw()
             
         except Exception as e:
-            print(f"Error updating chart: {e}")
+            chart_log.error("Error rendering chart for %s: %s", symbol, e)
+    
+    @staticmethod
+    def _ohlc_arrays(df):
+        """Open/high/low/close as float arrays plus the bar positions"""
+        o, h, l, c = (df[column].to_numpy(dtype=float) for column in ('Open', 'High', 'Low', 'Close'))
+        return np.arange(len(df), dtype=float), o, h, l, c
+    
+    def _bar_colors(self, up, alpha: float):
+        """Per-bar RGBA rows: up colour where up, down colour elsewhere"""
+        return np.where(up[:, None], to_rgba(self.UP_COLOR, alpha), to_rgba(self.DOWN_COLOR, alpha))
+    
+    @staticmethod
+    def _box_verts(x, bottom, top, width: float):
+        """(n, 4, 2) rectangle vertices centred on x, for PolyCollection"""
+        left, right = x - width / 2, x + width / 2
+        return np.stack([np.column_stack([left, bottom]), np.column_stack([left, top]),
+                         np.column_stack([right, top]), np.column_stack([right, bottom])], axis=1)
     
     def _plot_professional_candlesticks(self, ax, df):
-        """Plot professional candlestick chart"""
-        for i, (index, row) in enumerate(df.iterrows()):
-            # Determine color
-            if row['Close'] >= row['Open']:
-                color = '#26a69a'  # Green for up
-                edge_color = '#26a69a'
-            else:
-                color = '#ef5350'  # Red for down
-                edge_color = '#ef5350'
-            
-            # High-Low line (wick)
-            ax.plot([i, i], [row['Low'], row['High']], 
-                   color=edge_color, linewidth=1, alpha=0.8)
-            
-            # Open-Close rectangle (body)
-            height = abs(row['Close'] - row['Open'])
-            bottom = min(row['Open'], row['Close'])
-            
-            if height > 0:
-                rect = Rectangle((i-0.4, bottom), 0.8, height, 
-                                   facecolor=color, edgecolor=edge_color, 
-                                   alpha=0.9, linewidth=0.5)
-                ax.add_patch(rect)
-            else:
-                # Doji - draw line
-                ax.plot([i-0.4, i+0.4], [row['Close'], row['Close']], 
-                       color=edge_color, linewidth=1.5)
-        
+        """Plot professional candlestick chart as three collections: wicks, bodies and doji ticks"""
+        self.wicks = LineCollection([], linewidths=1)
+        self.bodies = PolyCollection([], linewidths=0.5)
+        self.dojis = LineCollection([], linewidths=1.5)
+        for collection in (self.wicks, self.bodies, self.dojis):
+            ax.add_collection(collection)
+        x, o, h, l, c = self._ohlc_arrays(df)
+        
+        # Collections do not autoscale like ax.plot, so fit the price range explicitly
+        valid = ~(np.isnan(l) | np.isnan(h))
+        if valid.any():
+            ax.update_datalim(np.column_stack([np.r_[x[valid], x[valid]], np.r_[l[valid], h[valid]]]))
+            ax.autoscale_view()
         ax.set_xlim(-1, len(df))
         ax.grid(True, alpha=0.3, color='#444444')
     
+    def _set_candles(self, x, o, h, l, c, width=BODY_WIDTH):
+        """Point the candle collections at OHLC arrays, skipping bars with missing data"""
+        valid = ~(np.isnan(o) | np.isnan(h) | np.isnan(l) | np.isnan(c))
+        x, o, h, l, c = x[valid], o[valid], h[valid], l[valid], c[valid]
+        width = width[valid] if np.ndim(width) else width
+        up = c >= o
+        
+        # High-Low lines (wicks)
+        self.wicks.set_segments(np.stack([np.column_stack([x, l]), np.column_stack([x, h])], axis=1))
+        self.wicks.set_color(self._bar_colors(up, 0.8))
+        
+        # Open-Close rectangles (bodies)
+        body = c != o
+        bottom, top = np.minimum(o, c), np.maximum(o, c)
+        self.bodies.set_verts(self._box_verts(x[body], bottom[body], top[body],
+                                              width[body] if np.ndim(width) else width))
+        self.bodies.set_facecolor(self._bar_colors(up[body], 0.9))
+        self.bodies.set_edgecolor(self._bar_colors(up[body], 0.9))
+        
+        # Doji - draw line
+        doji = ~body
+        half = (width[doji] if np.ndim(width) else width) / 2
+        self.dojis.set_segments(np.stack([np.column_stack([x[doji] - half, c[doji]]),
+                                          np.column_stack([x[doji] + half, c[doji]])], axis=1))
+        self.dojis.set_color(self._bar_colors(up[doji], 1.0))
+    
     def _plot_volume_bars(self, ax, df):
-        """Plot volume bars"""
-        colors = ['#26a69a' if df.iloc[i]['Close'] >= df.iloc[i]['Open'] 
-                 else '#ef5350' for i in range(len(df))]
-        
-        ax.bar(range(len(df)), df['Volume'], color=colors, alpha=0.6, width=0.8)
+        """Plot volume bars as a single PolyCollection"""
+        volume = np.nan_to_num(df['Volume'].to_numpy(dtype=float))
+        self.volume_bars = PolyCollection([], edgecolors='none')
+        ax.add_collection(self.volume_bars)
         ax.set_ylabel('Volume', color='white', fontsize=10)
         
-        # Format volume labels
-        max_vol = df['Volume'].max()
-        if max_vol > 1e9:
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x/1e9:.1f}B'))
-        elif max_vol > 1e6:
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x/1e6:.1f}M'))
-        elif max_vol > 1e3:
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x/1e3:.1f}K'))
-    
-    def _plot_rsi(self, ax, df):
-        """Plot RSI indicator"""
-        if len(df) >= 14:
-            rsi = ta.rsi(df['Close'], length=14)
-            ax.plot(range(len(df)), rsi, color='#ffd700', linewidth=1.5)
+        # Format volume labels; the unit follows the axis, which rescales as buckets change with the zoom
+        max_vol = volume.max() if len(volume) else 0
+        ax.set_ylim(0, max_vol * 1.05 if max_vol > 0 else 1)
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: self._format_volume(x, ax.get_ylim()[1])))
+    
+    @staticmethod
+    def _format_volume(value: float, top: float) -> str:
+        """Volume tick label in the unit that suits the axis top"""
+        for scale, unit in ((1e9, 'B'), (1e6, 'M'), (1e3, 'K')):
+            if top > scale:
+                return f'{value/scale:.1f}{unit}'
+        return f'{value:.0f}'
+    
+    def _set_volume(self, x, o, c, volume, width=BODY_WIDTH):
+        """Point the volume collection at new arrays"""
+        self.volume_bars.set_verts(self._box_verts(x, np.zeros_like(volume), volume, width))
+        self.volume_bars.set_facecolor(self._bar_colors(c >= o, 0.6))
+    
+    @staticmethod
+    def downsample_ohlcv(history: Dict, first: int, last: int, step: int):
+        """Merge bars first..last-1 into buckets of step: first open, highest high, lowest low, last close
+        and total volume, so spikes survive at any zoom. Returns x, open, high, low, close, volume, width."""
+        x, o, h, l, c, v = (history[key][first:last] for key in ('x', 'open', 'high', 'low', 'close', 'volume'))
+        if step <= 1 or not len(x):
+            return x, o, h, l, c, v, np.ones(len(x))
+        starts = np.arange(0, len(x), step)
+        ends = np.minimum(starts + step, len(x)) - 1
+        # fmax/fmin skip missing bars inside a bucket instead of propagating NaN
+        return ((x[starts] + x[ends]) / 2, o[starts], np.fmax.reduceat(h, starts), np.fmin.reduceat(l, starts),
+                c[ends], np.add.reduceat(v, starts), (ends - starts + 1).astype(float))
+    
+    @staticmethod
+    def downsample_line(values, first: int, last: int, step: int):
+        """Average values[first:last] over the same buckets as downsample_ohlcv, ignoring NaN warm-up values;
+        the final value is kept as is so the line still ends on the newest bar. Returns x, y."""
+        y = values[first:last]
+        x = np.arange(first, first + len(y), dtype=float)
+        if step <= 1 or not len(y):
+            return x, y
+        starts = np.arange(0, len(y), step)
+        ends = np.minimum(starts + step, len(y)) - 1
+        valid = ~np.isnan(y)
+        sums = np.add.reduceat(np.where(valid, y, 0.0), starts)
+        counts = np.add.reduceat(valid.astype(float), starts)
+        means = np.divide(sums, counts, out=np.full(len(starts), np.nan), where=counts > 0)
+        return np.append((x[starts] + x[ends]) / 2, x[-1]), np.append(means, y[-1])
+    
+    def _lod_step(self, bars: float) -> int:
+        """Bars per bucket so that candles stay at least LOD_BAR_PIXELS wide; a power of two keeps buckets stable"""
+        slots = max(self.ax_price.bbox.width / self.LOD_BAR_PIXELS, 1.0)
+        if bars <= slots:
+            return 1
+        return 1 << int(np.ceil(np.log2(bars / slots)))
+    
+    def _render_lod(self, force: bool = False):
+        """Rebuild the candle and volume collections from the bars in view, bucketed to the axes' pixel width"""
+        history = self.history
+        if history is None or self.wicks is None or self.ax_price is None:
+            return
+        count = len(history['x'])
+        xmin, xmax = self.ax_price.get_xlim()
+        step = self._lod_step(xmax - xmin)
+        # Buckets are aligned to multiples of step, with one spare on each side, so panning does not reshuffle them
+        first = min(max(int(np.floor(xmin)) // step - 1, 0) * step, count)
+        last = max(min((int(np.ceil(xmax)) // step + 2) * step, count), first)
+        key = (step, first, last, count)
+        if not force and key == self.lod_key:
+            return
+        self.lod_key = key
+        x, o, h, l, c, volume, bars = self.downsample_ohlcv(history, first, last, step)
+        width = bars * self.BODY_WIDTH
+        self._set_candles(x, o, h, l, c, width)
+        if self.volume_bars is not None:
+            self._set_volume(x, o, c, volume, width)
+            # Bucket totals grow with the step, so the volume axis follows the tallest bar in view
+            peak = np.nanmax(volume, initial=0.0)
+            if self.live_bar is not None and xmin <= self.live_bar['x'] <= xmax:
+                peak = max(peak, self.live_bar['volume'])
+            self.ax_volume.set_ylim(0, peak * 1.05 if peak > 0 else 1)
+        # Indicator lines carry one more value than the collections (the live bar), reached once the view does
+        for line, values in self.line_values.items():
+            line.set_data(*self.downsample_line(values, first, last if last < count else len(values), step))
+    
+    def _set_view(self, left: float, right: float):
+        """Show bars left..right, kept inside the data, and fit the price axis to them"""
+        history = self.history
+        end = (self.live_bar['x'] if self.live_bar is not None else len(history['x']) - 1) + 1
+        span = min(max(right - left, self.MIN_VISIBLE_BARS), end + 1)
+        left = min(max(left, -1), end - span)
+        self.ax_price.set_xlim(left, left + span)
+        
+        first, last = max(int(np.ceil(left)), 0), int(left + span) + 1
+        lows, highs = history['low'][first:last], history['high'][first:last]
+        if self.live_bar is not None and last > self.live_bar['x']:
+            lows, highs = np.append(lows, self.live_bar['low']), np.append(highs, self.live_bar['high'])
+        low, high = np.nanmin(lows, initial=np.inf), np.nanmax(highs, initial=-np.inf)
+        if low <= high:
+            pad = max(high - low, abs(high) * 0.001) * 0.05
+            self.ax_price.set_ylim(low - pad, high + pad)
+    
+    def _on_scroll(self, event):
+        """Zoom the shared x axis around the bar under the cursor"""
+        if event.inaxes not in (self.ax_price, self.ax_volume, self.ax_rsi) or self.history is None:
+            return
+        xmin, xmax = self.ax_price.get_xlim()
+        factor = 1 / self.ZOOM_FACTOR if event.button == 'up' else self.ZOOM_FACTOR
+        span = (xmax - xmin) * factor
+        left = event.xdata - (event.xdata - xmin) * factor
+        self._set_view(left, left + span)
+        self.draw_idle()
+    
+    def _on_press(self, event):
+        """Start a left-button pan, or show every bar again on a double-click"""
+        if event.button != 1 or event.inaxes not in (self.ax_price, self.ax_volume, self.ax_rsi) \
+                or self.history is None:
+            return
+        if event.dblclick:
+            self._set_view(-1, np.inf)
+            self.draw_idle()
+            return
+        self.pan_start = (event.x, self.ax_price.get_xlim())
+    
+    def _on_motion(self, event):
+        """Drag the view with the mouse while panning"""
+        if self.pan_start is None or self.history is None:
+            return
+        x, (xmin, xmax) = self.pan_start
+        shift = (event.x - x) * (xmax - xmin) / max(self.ax_price.bbox.width, 1.0)
+        self._set_view(xmin - shift, xmax - shift)
+        self.draw_idle()
+    
+    def _on_release(self, event):
+        self.pan_start = None
+    
+    def bar_seconds(self) -> int:
+        return self.INTERVAL_SECONDS.get(self.timeframe, 86400)
+    
+    def set_live_mode(self, enabled: bool):
+        """Turn real-time movement of the newest bar on or off"""
+        self.live = enabled
+    
+    def _start_live_bar(self, df):
+        """Draw the newest bar with animated artists that update_live_quote moves and blits"""
+        x, o, h, l, c = (float(values[-1]) for values in self._ohlc_arrays(df))
+        try:
+            start = df.index[-1].timestamp()
+        except Exception:
+            start = time.time()
+        self.live_bar = {'x': x, 'start': start, 'open': o, 'high': h, 'low': l, 'close': c,
+                         'volume': float(np.nan_to_num(df['Volume'].iloc[-1])), 'start_volume': None}
+        
+        self.live_wick, = self.ax_price.plot([x, x], [l, h], linewidth=1, alpha=0.8, animated=True)
+        self.live_body = Rectangle((x - self.BODY_WIDTH / 2, min(o, c)), self.BODY_WIDTH, abs(c - o),
+                                   alpha=0.9, animated=True)
+        self.ax_price.add_patch(self.live_body)
+        self.live_price_line = self.ax_price.axhline(c, linestyle='--', linewidth=0.8, alpha=0.7, animated=True)
+        self.live_artists = [self.live_wick, self.live_body, self.live_price_line]
+        if self.volume_bars is not None:
+            self.live_volume = Rectangle((x - self.BODY_WIDTH / 2, 0), self.BODY_WIDTH, 0, alpha=0.6,
+                                         linewidth=0, animated=True)
+            self.ax_volume.add_patch(self.live_volume)
+            self.live_artists.append(self.live_volume)
+        self._set_live_artists()
+        
+        if not (np.isnan(l) or np.isnan(h)):
+            self.ax_price.update_datalim([[x, l], [x, h]])
+            self.ax_price.autoscale_view()
+        self.ax_price.set_xlim(-1, x + 1)
+        self._live_bar_in_view()
+    
+    def _set_live_artists(self):
+        """Move the live artists to the live bar's current values"""
+        bar = self.live_bar
+        x, o, h, l, c = bar['x'], bar['open'], bar['high'], bar['low'], bar['close']
+        color = self.UP_COLOR if c >= o else self.DOWN_COLOR
+        self.live_wick.set_data([x, x], [l, h])
+        self.live_wick.set_color(color)
+        self.live_body.set_y(min(o, c))
+        self.live_body.set_height(abs(c - o))
+        self.live_body.set_color(color)
+        self.live_body.set_linewidth(0.5 if c != o else 1.5)  # a doji shows as its edge
+        self.live_price_line.set_ydata([c, c])
+        self.live_price_line.set_color(color)
+        if self.live_volume is not None:
+            self.live_volume.set_height(bar['volume'])
+            self.live_volume.set_facecolor(to_rgba(color, 0.6))
+    
+    def _live_bar_in_view(self) -> bool:
+        """Widen the axes if the live bar has left them; False means a full redraw is needed"""
+        bar = self.live_bar
+        in_view = True
+        low, high = self.ax_price.get_ylim()
+        if bar['low'] < low or bar['high'] > high:
+            pad = (high - low) * 0.05
+            self.ax_price.set_ylim(min(low, bar['low'] - pad), max(high, bar['high'] + pad))
+            in_view = False
+        if self.live_volume is not None and bar['volume'] > self.ax_volume.get_ylim()[1]:
+            self.ax_volume.set_ylim(0, bar['volume'] * 1.05)
+            in_view = False
+        return in_view
+    
+    def update_live_quote(self, symbol: str, last: Optional[float], volume: Optional[float] = None,
+                          timestamp: Optional[float] = None):
+        """Tick the newest bar with a trade price; only the live bar's region is redrawn"""
+        if not self.live or self.live_bar is None or symbol != self.symbol or last is None or not last > 0:
+            return
+        now = time.time() if timestamp is None else timestamp
+        bar = self.live_bar
+        if now >= bar['start'] + self.bar_seconds():
+            self._roll_live_bar(now, last, volume)
+            return
+        
+        bar['high'] = max(bar['high'], last)
+        bar['low'] = min(bar['low'], last)
+        bar['close'] = last
+        if volume is not None and volume >= 0:
+            # Quotes carry cumulative volume; the bar's share is what accrued since it opened
+            if bar['start_volume'] is None or volume < bar['start_volume']:
+                bar['start_volume'] = max(volume - bar['volume'], 0)
+            bar['volume'] = volume - bar['start_volume']
+        self._set_live_artists()
+        if self._live_bar_in_view():
+            self._blit_live()
+        else:
+            self.draw_idle()
+    
+    def _roll_live_bar(self, now: float, last: float, volume: Optional[float]):
+        """Move the finished live bar into the collections and open a new one at the current interval"""
+        bar = self.live_bar
+        history = self.history
+        for key in ('open', 'high', 'low', 'close', 'volume'):
+            history[key] = np.append(history[key], bar[key])
+        history['x'] = np.append(history['x'], bar['x'])
+        
+        interval = self.bar_seconds()
+        self.live_bar = {'x': bar['x'] + 1, 'start': bar['start'] + (now - bar['start']) // interval * interval,
+                         'open': last, 'high': last, 'low': last, 'close': last, 'volume': 0.0,
+                         'start_volume': volume}
+        self._update_indicators()
+        if isinstance(self.bar_times, pd.DatetimeIndex):
+            opened = pd.Timestamp(self.live_bar['start'], unit='s', tz='UTC')
+            opened = opened.tz_convert(self.bar_times.tz) if self.bar_times.tz else opened.tz_localize(None)
+            self.bar_times = self.bar_times.append(pd.DatetimeIndex([opened]))
+        # A view that reached the live bar follows it: the whole history grows, a zoomed window scrolls
+        xmin, xmax = self.ax_price.get_xlim()
+        if xmax >= bar['x']:
+            self.ax_price.set_xlim(xmin + 1 if xmin > -1 else xmin, xmax + 1)
+        self._render_lod(force=True)
+        self._set_live_artists()
+        self._live_bar_in_view()
+        self.draw_idle()
+    
+    def _update_indicators(self):
+        """Recompute the moving averages and RSI over completed bars plus the live bar; _render_lod draws them"""
+        closes = pd.Series(np.append(self.history['close'], self.live_bar['close']))
+        for length, line in self.sma_lines.items():
+            self.line_values[line] = closes.rolling(length).mean().to_numpy(dtype=float)
+        if self.rsi_line is not None:
+            self.line_values[self.rsi_line] = ta.rsi(closes, length=14).to_numpy(dtype=float)
+    
+    def _blit_live(self):
+        """Restore the static background and repaint just the live artists"""
+        if self.background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self.background)
+        for artist in self.live_artists:
+            artist.axes.draw_artist(artist)
+        self.blit(self.ax_price.bbox)
+        if self.live_volume is not None:
+            self.blit(self.ax_volume.bbox)
+    
+    def _on_draw(self, event):
+        """After a full draw, keep the static background for blitting and paint the live bar over it"""
+        self.background = self.copy_from_bbox(self.figure.bbox)
+        for artist in self.live_artists:
+            artist.axes.draw_artist(artist)
+    
+    def _plot_rsi(self, ax, rsi):
+        """Plot the precomputed RSI indicator"""
+        if rsi is not None:
+            self.rsi_line, = ax.plot(range(len(rsi)), rsi, color='#ffd700', linewidth=1.5)
+            self.line_values[self.rsi_line] = rsi.to_numpy(dtype=float)
             
             # Add RSI levels
             ax.axhline(y=70, color='#ef5350', linestyle='--', alpha=0.5, linewidth=1)
@@ -640,25 +2489,30 @@ class ProfessionalTradingChart(FigureCanvas):
         ax_volume.tick_params(labelbottom=False)
     
     def _format_date_axis(self, ax, df):
-        """Format the date axis properly"""
-        dates = df.index
-        n_ticks = min(8, len(dates))
-        
-        if len(dates) > 0:
-            tick_indices = np.linspace(0, len(dates)-1, n_ticks, dtype=int)
-            
-            ax.set_xticks(tick_indices)
-            date_labels = []
-            for i in tick_indices:
-                if i < len(dates):
-                    date_labels.append(dates[i].strftime('%Y-%m-%d'))
-            
-            ax.set_xticklabels(date_labels, rotation=45, ha='right')
+        """Label bar positions with their dates; ticks are placed for the current view, so they follow zoom and pan"""
+        self.bar_times = df.index
+        # The x axis is shared, so the locator and formatter serve all three panes
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=8, integer=True))
+        ax.xaxis.set_major_formatter(FuncFormatter(self._format_bar_time))
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')  # new ticks copy the first tick's label alignment
+    
+    def _format_bar_time(self, x, pos=None) -> str:
+        """Open time of the bar at position x: the date, plus the time for intraday bars"""
+        i = int(round(x))
+        if self.bar_times is None or not 0 <= i < len(self.bar_times):
+            return ''
+        when = self.bar_times[i]
+        if not hasattr(when, 'strftime'):
+            return str(when)
+        return when.strftime('%Y-%m-%d' if self.bar_seconds() >= 86400 else '%m-%d %H:%M')
 
 class ChartControlsWidget(QWidget):
     """Chart controls for timeframe and period selection"""
     
     timeframe_changed = pyqtSignal(str, str)
+    live_toggled = pyqtSignal(bool)
     
     def __init__(self):
         super().__init__()
@@ -683,6 +2537,13 @@ class ChartControlsWidget(QWidget):
         self.period_combo.currentTextChanged.connect(self.on_timeframe_changed)
         layout.addWidget(self.period_combo)
         
+        # Live updates of the newest bar
+        self.live_checkbox = QCheckBox("Live")
+        self.live_checkbox.setChecked(True)
+        self.live_checkbox.setStyleSheet("color: white;")
+        self.live_checkbox.toggled.connect(self.live_toggled.emit)
+        layout.addWidget(self.live_checkbox)
+        
         layout.addStretch()
         
         # Style controls
@@ -715,15 +2576,322 @@ class ChartControlsWidget(QWidget):
         period = self.period_combo.currentText()
         self.timeframe_changed.emit(timeframe, period)
 
+class WatchlistTableModel(QAbstractTableModel):
+    """Virtualized watchlist over the quote board: per-cell change notification, off-thread sorting, indexed filtering"""
+
+    HEADERS = ["Symbol", "Last", "Change", "Change %", "Bid", "Ask", "Spread", "Bid Size", "Volume"]
+    COLUMN_KEYS = ['symbol', 'last', 'change', 'percent_change', 'bid', 'ask', 'spread', 'bid_size', 'volume']
+    # Board fields each column is rendered from; a cell is repainted only when one of them changes
+    COLUMN_FIELDS = [(), ('last',), ('change',), ('percent_change',), ('bid',), ('ask',), ('bid', 'ask'),
+                     ('bid_size', 'last'), ('volume',)]
+    MAX_CELL_SIGNALS = 200  # beyond this many changed runs per refresh, one bounding dataChanged is cheaper
+    RESORT_INTERVAL = 1.0   # seconds between background re-sorts while quotes keep moving
+
+    sort_ready = pyqtSignal(int, object)  # sort generation, row order; emitted from the sort thread
+
+    def __init__(self, quote_board: QuoteBoard, parent=None):
+        super().__init__(parent)
+        self.quote_board = quote_board
+        self.symbols = []
+        self.rows = {}  # symbol -> base row (position in self.symbols / self.records)
+        self.symbol_array = np.empty(0, dtype=str)
+        self.base_of_board = np.empty(0, dtype=np.intp)  # board row -> base row, -1 if not listed
+        self.records = quote_board.snapshot([])
+        self.board_version = 0  # last board version pulled
+
+        # Display order: order[display row] = base row; position[base row] = display row or -1 when filtered out
+        self.sorted_rows = np.empty(0, dtype=np.intp)
+        self.order = np.empty(0, dtype=np.intp)
+        self.position = np.empty(0, dtype=np.intp)
+        self.row_mask = None  # base rows passing the filter, None when unfiltered
+        self.filter_text = ""
+
+        # Prebuilt symbol index: sorted symbols and their base rows, for binary-search prefix filtering
+        self.symbol_index = np.empty(0, dtype=str)
+        self.symbol_index_rows = np.empty(0, dtype=np.intp)
+
+        self.sort_column = None
+        self.sort_descending = False
+        self.sort_generation = 0
+        self.sort_in_flight = False
+        self.last_sort = 0.0
+        self.sort_executor = ThreadPoolExecutor(max_workers=1)
+        self.sort_ready.connect(self.apply_sort)
+
+        # Formatting state is shared by every cell, so build the fonts and brushes once
+        self.bold_font = QFont("Consolas", 10, QFont.Weight.Bold)
+        self.brushes = {
+            'default': QBrush(QColor('white')),
+            'missing': QBrush(QColor('#888888')),
+            'up': QBrush(QColor('#26a69a')),
+            'down': QBrush(QColor('#ef5350')),
+        }
+
+    def set_symbols(self, symbols: List[str]):
+        """Replace the watchlist rows"""
+        self.beginResetModel()
+        self.symbols = list(symbols)
+        self.rows = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.symbol_array = np.array(self.symbols, dtype=str)
+        board_rows = self.quote_board.rows_for(self.symbols)
+        self.base_of_board = np.full(board_rows.max() + 1 if len(board_rows) else 0, -1, dtype=np.intp)
+        self.base_of_board[board_rows] = np.arange(len(board_rows), dtype=np.intp)
+        self.records = self.quote_board.read_rows(board_rows)
+        self.symbol_index_rows = np.argsort(self.symbol_array, kind='stable')
+        self.symbol_index = self.symbol_array[self.symbol_index_rows]
+        self.sorted_rows = np.arange(len(self.symbols), dtype=np.intp)
+        self.row_mask = self.filter_mask(self.filter_text)
+        self.rebuild_order()
+        self.endResetModel()
+        if self.sort_column is not None:
+            self.request_sort()
+
+    def symbol_at(self, row: int) -> Optional[str]:
+        """Symbol shown on a display row"""
+        if 0 <= row < len(self.order):
+            return self.symbols[self.order[row]]
+        return None
+
+    def filter_mask(self, text: str):
+        """Base rows whose symbol starts with text, found by binary search in the symbol index"""
+        if not text:
+            return None
+        lo = np.searchsorted(self.symbol_index, text, side='left')
+        hi = np.searchsorted(self.symbol_index, text + '\uffff', side='left')
+        mask = np.zeros(len(self.symbols), dtype=bool)
+        mask[self.symbol_index_rows[lo:hi]] = True
+        return mask
+
+    def set_filter(self, text: str):
+        """Show only symbols starting with text"""
+        self.filter_text = text.strip().upper()
+        self.beginResetModel()
+        self.row_mask = self.filter_mask(self.filter_text)
+        self.rebuild_order()
+        self.endResetModel()
+
+    def rebuild_order(self):
+        """Display order from the current sort and filter"""
+        order = self.sorted_rows
+        if self.row_mask is not None:
+            order = order[self.row_mask[order]]
+        self.order = order
+        self.position = np.full(len(self.symbols), -1, dtype=np.intp)
+        self.position[order] = np.arange(len(order), dtype=np.intp)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Header-click sort; the ordering itself is computed on the sort thread"""
+        self.sort_column = column if 0 <= column < len(self.HEADERS) else None
+        self.sort_descending = order == Qt.SortOrder.DescendingOrder
+        self.request_sort()
+
+    def sort_keys(self, column: int):
+        """Copy of the values a column sorts by, with missing data as NaN"""
+        key = self.COLUMN_KEYS[column]
+        if key == 'symbol':
+            return self.symbol_array
+        if key == 'spread':
+            return self.records['ask'] - self.records['bid']
+        keys = self.records[key].astype(float)
+        if key in QuoteBoard.SIZE_FIELDS:
+            keys[keys < 0] = np.nan
+        return keys
+
+    def request_sort(self):
+        """Start a background sort for the current column; stale results are dropped"""
+        self.sort_generation += 1
+        if self.sort_column is None:
+            self.apply_sort(self.sort_generation, np.arange(len(self.symbols), dtype=np.intp))
+            return
+        self.sort_in_flight = True
+        self.last_sort = time.monotonic()
+        self.sort_executor.submit(self._sort_rows, self.sort_generation, self.sort_keys(self.sort_column),
+                                  self.sort_descending)
+
+    def _sort_rows(self, generation: int, keys, descending: bool):
+        """Bulk argsort on the sort thread; missing values always sort last"""
+        try:
+            if keys.dtype.kind == 'f':
+                order = np.argsort(-keys if descending else keys, kind='stable')
+            else:
+                order = np.argsort(keys, kind='stable')
+                if descending:
+                    order = order[::-1]
+            self.sort_ready.emit(generation, order.astype(np.intp))
+        except Exception as e:
+            watchlist_log.error("Sort error: %s", e)
+            # Report the failure on the GUI thread so the sort is no longer considered in flight
+            self.sort_ready.emit(generation, None)
+
+    def apply_sort(self, generation: int, sorted_rows):
+        """Install a finished sort, keeping selections on the same symbols; None marks a failed sort"""
+        if generation != self.sort_generation:
+            return
+        self.sort_in_flight = False
+        if sorted_rows is None or len(sorted_rows) != len(self.symbols):
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_order = self.order
+        self.sorted_rows = sorted_rows
+        self.rebuild_order()
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in old_indexes:
+            row = self.position[old_order[index.row()]] if index.row() < len(old_order) else -1
+            new_indexes.append(self.index(int(row), index.column()) if row >= 0 else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def refresh_from_board(self) -> List[str]:
+        """Pull rows written since the last refresh and signal only the visible cells that changed"""
+        board_rows, records, self.board_version = self.quote_board.changed_since(self.board_version)
+        listed = board_rows < len(self.base_of_board)
+        rows = self.base_of_board[board_rows[listed]]
+        records = records[listed]
+        listed = rows >= 0
+        rows, new = rows[listed], records[listed]
+        symbols = self.symbol_array[rows].tolist()
+        if not symbols:
+            return symbols
+        old = self.records[rows]
+
+        # Compare whole columns at once; NaN on both sides means 'still no data', not a change
+        field_changed = {}
+        for field in QuoteBoard.VALUE_FIELDS:
+            differs = old[field] != new[field]
+            if field in QuoteBoard.PRICE_FIELDS:
+                differs &= ~(np.isnan(old[field]) & np.isnan(new[field]))
+            field_changed[field] = differs
+        cells = np.zeros((len(rows), len(self.HEADERS)), dtype=bool)
+        for column, fields in enumerate(self.COLUMN_FIELDS):
+            for field in fields:
+                cells[:, column] |= field_changed[field]
+        self.records[rows] = new
+
+        # Keep a sorted view roughly current without re-sorting on every tick
+        if (self.sort_column is not None and not self.sort_in_flight
+                and time.monotonic() - self.last_sort >= self.RESORT_INTERVAL):
+            self.request_sort()
+
+        # Filtered-out rows have nothing on screen to repaint
+        display_rows = self.position[rows]
+        shown = display_rows >= 0
+        display_rows, cells = display_rows[shown], cells[shown]
+
+        # A run starts at a changed cell whose left neighbour did not change
+        starts = cells.copy()
+        starts[:, 1:] &= ~cells[:, :-1]
+        if starts.sum() > self.MAX_CELL_SIGNALS:
+            changed_rows, changed_columns = np.nonzero(cells)
+            if len(changed_rows):
+                changed_rows = display_rows[changed_rows]
+                self.dataChanged.emit(self.index(int(changed_rows.min()), int(changed_columns.min())),
+                                      self.index(int(changed_rows.max()), int(changed_columns.max())))
+            return symbols
+
+        # One dataChanged per run of adjacent changed cells
+        for row, row_cells in zip(display_rows.tolist(), cells):
+            columns = np.flatnonzero(row_cells).tolist()
+            start = previous = None
+            for column in columns + [None]:
+                if start is not None and column != previous + 1:
+                    self.dataChanged.emit(self.index(row, start), self.index(row, previous))
+                    start = None
+                if start is None:
+                    start = column
+                previous = column
+        return symbols
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Only called for cells on screen, so formatting cost follows the viewport, not the list size
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cell_text(row, column)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.brushes[self.cell_state(row, column)]
+        if role == Qt.ItemDataRole.FontRole and column in (1, 2, 3) and self.cell_state(row, column) != 'missing':
+            return self.bold_font
+        return None
+
+    def cell_value(self, row: int, column: int):
+        """Value shown in a cell, or None when there is no data"""
+        base = self.order[row]
+        key = self.COLUMN_KEYS[column]
+        if key == 'symbol':
+            return self.symbols[base]
+        record = self.records[base]
+        if key == 'spread':
+            bid = QuoteBoard.value(record, 'bid')
+            ask = QuoteBoard.value(record, 'ask')
+            return ask - bid if bid and ask and bid > 0 and ask > 0 else None
+        value = QuoteBoard.value(record, key)
+        if key in ('last', 'bid', 'ask', 'volume') and value is not None and value <= 0:
+            return None
+        # Bid Size (mock for demo)
+        if key == 'bid_size' and value is None and QuoteBoard.value(record, 'last') is not None:
+            return 100
+        return value
+
+    def cell_state(self, row: int, column: int) -> str:
+        """Which cached brush a cell uses"""
+        value = self.cell_value(row, column)
+        if value is None:
+            return 'missing'
+        if self.COLUMN_KEYS[column] in ('change', 'percent_change'):
+            return 'up' if value >= 0 else 'down'
+        return 'default'
+
+    def cell_text(self, row: int, column: int) -> str:
+        value = self.cell_value(row, column)
+        key = self.COLUMN_KEYS[column]
+        if key == 'symbol':
+            return value
+        if value is None:
+            return "N/A"
+        if key in ('last', 'bid', 'ask'):
+            return f"${value:.2f}"
+        if key in ('change', 'spread'):
+            return f"{value:+.2f}" if key == 'change' else f"{value:.2f}"
+        if key == 'percent_change':
+            return f"{value:+.2f}%"
+        if key == 'bid_size':
+            return str(value)
+        # Volume (formatted)
+        if value > 1e9:
+            return f"{value/1e9:.2f}B"
+        elif value > 1e6:
+            return f"{value/1e6:.1f}M"
+        elif value > 1e3:
+            return f"{value/1e3:.0f}K"
+        return str(value)
+
+
 class AdvancedWatchlistWidget(QWidget):
     """Advanced watchlist with proper data handling"""
     
     symbol_selected = pyqtSignal(str)
+    symbol_removed = pyqtSignal(str)
+    visible_symbols_changed = pyqtSignal(list)
     
-    def __init__(self):
+    def __init__(self, quote_board: Optional[QuoteBoard] = None):
         super().__init__()
         self.watchlist = ["AAPL", "MSFT", "GOOGL", "TSLA", "AMZN", "NVDA", "META", "SPY", "QQQ", "AMD"]
-        self.watchlist_data = {}
+        self.quote_board = quote_board or QuoteBoard()
+        self.model = WatchlistTableModel(self.quote_board)
+        self.visible_symbols = []
         self.init_ui()
         
     def init_ui(self):
@@ -782,24 +2950,33 @@ class AdvancedWatchlistWidget(QWidget):
         controls_layout.addWidget(remove_btn)
         layout.addLayout(controls_layout)
         
-        # Professional watchlist table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Symbol", "Last", "Change", "Change %", "Bid", "Ask", "Bid Size", "Volume"
-        ])
+        # Symbol filter (prefix match against the model's symbol index)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter...")
+        self.filter_input.textChanged.connect(self.on_filter_changed)
+        self.filter_input.setStyleSheet(self.symbol_input.styleSheet())
+        layout.addWidget(self.filter_input)
+        
+        # Professional watchlist table, rendered from the quote board model
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setWordWrap(False)
+        
+        # Fixed row heights so scrolling never measures rows
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(24)
         
         # Set column widths
         header = self.table.horizontalHeader()
         if header is not None:
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
-            header.setSectionResizeMode(7, QHeaderView.ResizeMode.Stretch)
+            for column in range(8):
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.setSectionResizeMode(8, QHeaderView.ResizeMode.Stretch)
+            # Header clicks sort; start unsorted so the watchlist keeps its own order
+            header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.table.setSortingEnabled(True)
         
         self.table.setColumnWidth(0, 70)
         self.table.setColumnWidth(1, 80)
@@ -807,13 +2984,16 @@ class AdvancedWatchlistWidget(QWidget):
         self.table.setColumnWidth(3, 70)
         self.table.setColumnWidth(4, 70)
         self.table.setColumnWidth(5, 70)
-        self.table.setColumnWidth(6, 70)
+        self.table.setColumnWidth(6, 60)
+        self.table.setColumnWidth(7, 70)
         
-        self.table.cellClicked.connect(self.on_symbol_clicked)
+        self.table.clicked.connect(self.on_symbol_clicked)
+        self.model.layoutChanged.connect(self.emit_visible_symbols)
+        self.table.verticalScrollBar().valueChanged.connect(self.emit_visible_symbols)
         
         # Professional TWS-style table styling
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #444444;
                 background-color: #0d1421;
                 alternate-background-color: #1a2332;
@@ -822,7 +3002,7 @@ class AdvancedWatchlistWidget(QWidget):
                 font-size: 11px;
                 selection-background-color: #1e3a5f;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
                 border-bottom: 1px solid #2a2a2a;
             }
@@ -842,123 +3022,68 @@ class AdvancedWatchlistWidget(QWidget):
         
     def add_symbol(self):
         symbol = self.symbol_input.text().upper().strip()
-        if symbol and symbol not in self.watchlist:
+        if symbol and symbol not in self.model.rows:
             self.watchlist.append(symbol)
             self.update_watchlist_display()
             self.symbol_input.clear()
     
     def remove_symbol(self):
-        current_row = self.table.currentRow()
-        if current_row >= 0 and current_row < len(self.watchlist):
-            symbol = self.watchlist[current_row]
+        symbol = self.model.symbol_at(self.table.currentIndex().row())
+        if symbol is not None:
             self.watchlist.remove(symbol)
-            if symbol in self.watchlist_data:
-                del self.watchlist_data[symbol]
+            self.quote_board.remove(symbol)
             self.update_watchlist_display()
+            self.symbol_removed.emit(symbol)
     
     def update_watchlist_display(self):
         """Updated display logic with proper data validation"""
-        self.table.setRowCount(len(self.watchlist))
-        
-        for i, symbol in enumerate(self.watchlist):
-            self.table.setItem(i, 0, QTableWidgetItem(symbol))
-            data = self.watchlist_data.get(symbol, {})
-            
-            print(f"[WATCHLIST] Updating display for {symbol}: {data}")
-            
-            # Check data source to determine display behavior
-            source = data.get('source', 'No TWS Data')
-            
-            # Last price
-            last = data.get('last')
-            if last is not None and last > 0:
-                last_item = QTableWidgetItem(f"${last:.2f}")
-                last_item.setFont(QFont("Consolas", 10, QFont.Weight.Bold))
-                last_item.setForeground(QColor('white'))
-            else:
-                last_item = QTableWidgetItem("N/A")
-                last_item.setForeground(QColor('#888888'))
-            self.table.setItem(i, 1, last_item)
-            
-            # Change
-            change = data.get('change')
-            if change is not None:
-                change_color = '#26a69a' if change >= 0 else '#ef5350'
-                change_item = QTableWidgetItem(f"{change:+.2f}")
-                change_item.setForeground(QColor(change_color))
-                change_item.setFont(QFont("Consolas", 10, QFont.Weight.Bold))
-            else:
-                change_item = QTableWidgetItem("N/A")
-                change_item.setForeground(QColor('#888888'))
-            self.table.setItem(i, 2, change_item)
-            
-            # Change %
-            percent_change = data.get('percent_change')
-            if percent_change is not None:
-                change_color = '#26a69a' if percent_change >= 0 else '#ef5350'
-                pct_item = QTableWidgetItem(f"{percent_change:+.2f}%")
-                pct_item.setForeground(QColor(change_color))
-                pct_item.setFont(QFont("Consolas", 10, QFont.Weight.Bold))
-            else:
-                pct_item = QTableWidgetItem("N/A")
-                pct_item.setForeground(QColor('#888888'))
-            self.table.setItem(i, 3, pct_item)
-            
-            # Bid/Ask
-            bid = data.get('bid')
-            ask = data.get('ask')
-            
-            if bid is not None and bid > 0:
-                bid_item = QTableWidgetItem(f"${bid:.2f}")
-            else:
-                bid_item = QTableWidgetItem("N/A")
-                bid_item.setForeground(QColor('#888888'))
-            self.table.setItem(i, 4, bid_item)
-            
-            if ask is not None and ask > 0:
-                ask_item = QTableWidgetItem(f"${ask:.2f}")
-            else:
-                ask_item = QTableWidgetItem("N/A")
-                ask_item.setForeground(QColor('#888888'))
-            self.table.setItem(i, 5, ask_item)
-            
-            # Bid Size (mock for demo)
-            bid_size = data.get('bid_size', 100 if last is not None else None)
-            if bid_size is not None:
-                self.table.setItem(i, 6, QTableWidgetItem(str(bid_size)))
-            else:
-                size_item = QTableWidgetItem("N/A")
-                size_item.setForeground(QColor('#888888'))
-                self.table.setItem(i, 6, size_item)
-            
-            # Volume (formatted)
-            volume = data.get('volume')
-            if volume is not None and volume > 0:
-                if volume > 1e9:
-                    vol_text = f"{volume/1e9:.2f}B"
-                elif volume > 1e6:
-                    vol_text = f"{volume/1e6:.1f}M"
-                elif volume > 1e3:
-                    vol_text = f"{volume/1e3:.0f}K"
-                else:
-                    vol_text = str(volume)
-            else:
-                vol_text = "N/A"
-                
-            vol_item = QTableWidgetItem(vol_text)
-            if vol_text == "N/A":
-                vol_item.setForeground(QColor('#888888'))
-            self.table.setItem(i, 7, vol_item)
-    
-    def update_symbol_data(self, symbol: str, data: dict):
-        """Update symbol data with validation"""
-        if symbol in self.watchlist:
-            self.watchlist_data[symbol] = data
-            self.update_watchlist_display()
+        self.model.set_symbols(self.watchlist)
+        self.emit_visible_symbols()
+
+    def emit_visible_symbols(self):
+        """Tell the poll scheduler which rows are on screen"""
+        rows = self.model.rowCount()
+        if not rows:
+            visible = []
+        else:
+            first = self.table.rowAt(0)
+            last = self.table.rowAt(self.table.viewport().height() - 1)
+            first = 0 if first < 0 else first
+            last = rows - 1 if last < 0 else last
+            visible = [self.model.symbol_at(row) for row in range(first, last + 1)]
+        if visible != self.visible_symbols:
+            self.visible_symbols = visible
+            self.visible_symbols_changed.emit(visible)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.emit_visible_symbols()
+
+    def neighbour_symbols(self, symbol: str, distance: int = 2) -> List[str]:
+        """Symbols within distance display rows of symbol, nearest first"""
+        base = self.model.rows.get(symbol)
+        row = self.model.position[base] if base is not None and base < len(self.model.position) else -1
+        if row < 0:
+            return []
+        neighbours = []
+        for offset in range(1, distance + 1):
+            for candidate in (row + offset, row - offset):
+                neighbour = self.model.symbol_at(candidate) if candidate >= 0 else None
+                if neighbour is not None:
+                    neighbours.append(neighbour)
+        return neighbours
+
+    def refresh_from_board(self) -> List[str]:
+        """Repaint only the cells changed on the board since the last refresh; returns the changed symbols"""
+        return self.model.refresh_from_board()
+
+    def on_filter_changed(self, text: str):
+        self.model.set_filter(text)
+        self.emit_visible_symbols()
     
-    def on_symbol_clicked(self, row, column):
-        if row < len(self.watchlist):
-            symbol = self.watchlist[row]
+    def on_symbol_clicked(self, index):
+        symbol = self.model.symbol_at(index.row())
+        if symbol is not None:
             self.symbol_selected.emit(symbol)
 
 class ProfessionalTradingPanel(QWidget):
@@ -966,6 +3091,18 @@ class ProfessionalTradingPanel(QWidget):
     
     order_placed = pyqtSignal(str, str)
     
+    # Colour and flash states are selected through dynamic properties, so this sheet is parsed once
+    MARKET_LABEL_STYLE = """
+        QLabel { color: white; padding: 4px; }
+        QLabel[tick="flat"] { color: white; font-weight: bold; }
+        QLabel[tick="up"] { color: #26a69a; font-weight: bold; }
+        QLabel[tick="down"] { color: #ef5350; font-weight: bold; }
+        QLabel[tick="warn"] { color: #ffd700; font-weight: bold; }
+        QLabel[flash="true"] { background-color: rgba(255, 255, 255, 26); border-radius: 3px; }
+    """
+    FLASH_MS = 500
+    FLASH_TICK_MS = 50
+    
     def __init__(self, ibkr_connection):
         super().__init__()
         self.ibkr_connection = ibkr_connection
@@ -973,6 +3110,12 @@ class ProfessionalTradingPanel(QWidget):
         self.current_price = 0.0
         self.bid_price = 0.0
         self.ask_price = 0.0
+        
+        # One shared timer expires every active flash
+        self.flash_deadlines = {}  # label -> monotonic deadline
+        self.flash_timer = QTimer(self)
+        self.flash_timer.setInterval(self.FLASH_TICK_MS)
+        self.flash_timer.timeout.connect(self.expire_flashes)
         self.init_ui()
         
     def init_ui(self):
@@ -1030,7 +3173,7 @@ class ProfessionalTradingPanel(QWidget):
         
         for label in labels:
             label.setFont(QFont("Consolas", 11))
-            label.setStyleSheet("color: white; padding: 4px;")
+            label.setStyleSheet(self.MARKET_LABEL_STYLE)
         
         market_layout.addWidget(self.last_label, 0, 0)
         market_layout.addWidget(self.change_label, 0, 1)
@@ -1257,12 +3400,12 @@ class ProfessionalTradingPanel(QWidget):
             if symbol != self.selected_symbol:
                 return  # Ignore data for symbols we're not tracking
                 
-            print(f"[TRADING PANEL] Updating market data for {symbol}: {data}")
+            panel_log.debug("Updating market data for %s: %s", symbol, data)
             
             # Validate that the data actually belongs to this symbol
             data_symbol = data.get('symbol', '').upper()
             if data_symbol and data_symbol != symbol.upper():
-                print(f"[TRADING PANEL] Data mismatch: Expected {symbol}, got {data_symbol}")
+                panel_log.warning("Data mismatch: Expected %s, got %s", symbol, data_symbol)
                 return
             
             # Check if we have valid data
@@ -1276,7 +3419,7 @@ class ProfessionalTradingPanel(QWidget):
 
             # If data is None or invalid, show "No Data" for this specific symbol
             if (last is None or last <= 0):
-                print(f"[TRADING PANEL] No valid data for {symbol}")
+                panel_log.debug("No valid data for %s", symbol)
                 
                 self.current_price = 0.0
                 self.bid_price = 0.0
@@ -1299,7 +3442,7 @@ class ProfessionalTradingPanel(QWidget):
             price_changed = (self.current_price != last)
             
             # Valid data - proceed with normal updates
-            print(f"[TRADING PANEL] Valid data received for {symbol}")
+            panel_log.debug("Valid data received for %s", symbol)
             
             self.current_price = last
             self.bid_price = bid
@@ -1312,22 +3455,13 @@ class ProfessionalTradingPanel(QWidget):
             last_text = f"Last: ${last:.2f}"
             self.last_label.setText(last_text)
             if price_changed:
-                # Flash effect for price changes
-                flash_color = '#26a69a' if change >= 0 else '#ef5350'
-                self.last_label.setStyleSheet(f"""
-                    color: {flash_color}; 
-                    font-weight: bold; 
-                    padding: 4px;
-                    background-color: rgba(255, 255, 255, 0.1);
-                    border-radius: 3px;
-                """)
-                # Reset style after 500ms
-                QTimer.singleShot(500, lambda: self.last_label.setStyleSheet("color: white; font-weight: bold; padding: 4px;"))
+                # Flash in the direction of the day's change, then settle back to white
+                self.set_tick_state(self.last_label, 'up' if change >= 0 else 'down')
+                self.flash(self.last_label)
             
             # Change with color coding
-            change_color = '#26a69a' if change >= 0 else '#ef5350'
             self.change_label.setText(f"Change: {change:+.2f} ({percent_change:+.2f}%)")
-            self.change_label.setStyleSheet(f"color: {change_color}; font-weight: bold; padding: 4px;")
+            self.set_tick_state(self.change_label, 'up' if change >= 0 else 'down')
             
             # Bid/Ask with real-time highlighting
             self.bid_label.setText(f"Bid: ${bid:.2f}")
@@ -1344,9 +3478,9 @@ class ProfessionalTradingPanel(QWidget):
             
             # Calculate and display spread with real-time color coding
             spread = ask - bid
-            spread_color = '#26a69a' if spread < 0.05 else '#ffd700' if spread < 0.10 else '#ef5350'
+            spread_state = 'up' if spread < 0.05 else 'warn' if spread < 0.10 else 'down'
             self.spread_label.setText(f"Spread: ${spread:.2f}")
-            self.spread_label.setStyleSheet(f"color: {spread_color}; font-weight: bold; padding: 4px;")
+            self.set_tick_state(self.spread_label, spread_state)
             
             # Update risk metrics
             self.update_risk_metrics()
@@ -1368,6 +3502,43 @@ class ProfessionalTradingPanel(QWidget):
             self.place_order_btn.setEnabled(True)
 
     
+    def set_tick_state(self, label: QLabel, state: str):
+        """Select a label's colour rule via its 'tick' property; only re-polishes on a state change"""
+        if label.property('tick') == state:
+            return
+        label.setProperty('tick', state)
+        self.repolish(label)
+    
+    def flash(self, label: QLabel):
+        """Highlight a label for FLASH_MS, extending any flash already running"""
+        if label not in self.flash_deadlines:
+            label.setProperty('flash', True)
+            self.repolish(label)
+        self.flash_deadlines[label] = time.monotonic() + self.FLASH_MS / 1000.0
+        if not self.flash_timer.isActive():
+            self.flash_timer.start()
+    
+    def expire_flashes(self):
+        """Clear finished flashes; the shared timer stops once none are active"""
+        now = time.monotonic()
+        for label, deadline in list(self.flash_deadlines.items()):
+            if deadline <= now:
+                del self.flash_deadlines[label]
+                label.setProperty('flash', False)
+                if label is self.last_label:
+                    label.setProperty('tick', 'flat')
+                self.repolish(label)
+        if not self.flash_deadlines:
+            self.flash_timer.stop()
+    
+    @staticmethod
+    def repolish(widget: QWidget):
+        """Re-apply already-parsed style rules after a dynamic property change"""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+    
     def update_risk_metrics(self):
         """Calculate and display enhanced risk metrics"""
         if self.current_price > 0:
@@ -1399,58 +3570,6 @@ class ProfessionalTradingPanel(QWidget):
             self.take_profit_spin.setValue(self.current_price * 1.02)
             self.stop_loss_spin.setValue(self.current_price * 0.98)
     
-    def place_bracket_order(self, symbol, action, quantity, limit_price, take_profit, stop_loss):
-        """Place bracket order (parent + take profit + stop loss)"""
-        if not self.ibkr_connection.connected:
-            return False
-        try:
-            contract = Stock(symbol, "SMART", "USD")
-            qualified = self.ibkr_connection.ib.qualifyContracts(contract)
-            if not qualified:
-                return False
-            contract = qualified[0]
-            
-            # Parent order
-            parent = Order()
-            parent.orderId = self.ibkr_connection.next_order_id
-            self.ibkr_connection.next_order_id += 1
-            parent.action = action.upper()
-            parent.orderType = 'LMT'
-            parent.lmtPrice = limit_price
-            parent.totalQuantity = quantity
-            parent.transmit = False  # Don't transmit yet
-            
-            # Take profit
-            tp = Order()
-            tp.orderId = self.ibkr_connection.next_order_id
-            self.ibkr_connection.next_order_id += 1
-            tp.action = 'SELL' if action == 'BUY' else 'BUY'
-            tp.orderType = 'LMT'
-            tp.lmtPrice = take_profit
-            tp.totalQuantity = quantity
-            tp.parentId = parent.orderId
-            tp.transmit = False
-            
-            # Stop loss
-            sl = Order()
-            sl.orderId = self.ibkr_connection.next_order_id
-            self.ibkr_connection.next_order_id += 1
-            sl.action = 'SELL' if action == 'BUY' else 'BUY'
-            sl.orderType = 'STP'
-            sl.auxPrice = stop_loss
-            sl.totalQuantity = quantity
-            sl.parentId = parent.orderId
-            sl.transmit = True  # Transmit the bracket
-            
-            # Place orders
-            self.ibkr_connection.ib.placeOrder(contract, parent)
-            self.ibkr_connection.ib.placeOrder(contract, tp)
-            self.ibkr_connection.ib.placeOrder(contract, sl)
-            return True
-        except Exception as e:
-            print(f"Bracket order error: {e}")
-            return False
-    
     def place_order(self):
         """Enhanced order placement with validation"""
         if not self.selected_symbol:
@@ -1482,19 +3601,19 @@ class ProfessionalTradingPanel(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                success = self.place_bracket_order(
+                future = self.ibkr_connection.place_bracket_order(
                     self.selected_symbol, action, quantity, limit_price, take_profit, stop_loss
                 )
-                if success:
-                    QMessageBox.information(self, "Order Placed", "Bracket order submitted successfully!")
-                    self.order_placed.emit(self.selected_symbol, f"Bracket {action} {quantity} {self.selected_symbol}")
+                symbol = self.selected_symbol
+                self.ibkr_connection.bridge.deliver(future, lambda done: self.on_order_result(
+                    done, symbol, order_type, f"Bracket {action} {quantity} {symbol}"))
         else:
             # Regular order logic
             limit_price = self.limit_price_spin.value() if order_type == "LMT" else None
             stop_price = self.stop_loss_spin.value() if order_type == "STP" else None
             tif = self.tif_combo.currentText()
             
-            success, order_id_or_msg = self.ibkr_connection.place_order(
+            future = self.ibkr_connection.place_order(
                 self.selected_symbol,
                 action,
                 quantity,
@@ -1503,12 +3622,25 @@ class ProfessionalTradingPanel(QWidget):
                 stop_price=stop_price,
                 tif=tif
             )
-            
-            if success:
-                QMessageBox.information(self, "Order Placed", f"{order_type} order placed! Order ID: {order_id_or_msg}")
-                self.order_placed.emit(self.selected_symbol, f"{order_type} {action} {quantity} {self.selected_symbol}")
+            symbol = self.selected_symbol
+            self.ibkr_connection.bridge.deliver(future, lambda done: self.on_order_result(
+                done, symbol, order_type, f"{order_type} {action} {quantity} {symbol}"))
+
+    def on_order_result(self, future, symbol: str, order_type: str, description: str):
+        """Report the outcome of an order submitted on the IB loop thread"""
+        try:
+            success, order_id_or_msg = future.result()
+        except Exception as e:
+            success, order_id_or_msg = False, str(e)
+        
+        if success:
+            if order_type == "BRACKET":
+                QMessageBox.information(self, "Order Placed", "Bracket order submitted successfully!")
             else:
-                QMessageBox.warning(self, "Order Failed", f"Order failed: {order_id_or_msg}")
+                QMessageBox.information(self, "Order Placed", f"{order_type} order placed! Order ID: {order_id_or_msg}")
+            self.order_placed.emit(symbol, description)
+        else:
+            QMessageBox.warning(self, "Order Failed", f"Order failed: {order_id_or_msg}")
     
     def cancel_all_orders(self):
         """Cancel all orders with confirmation"""
@@ -1522,6 +3654,198 @@ class ProfessionalTradingPanel(QWidget):
             self.ibkr_connection.cancel_all_orders()
             QMessageBox.information(self, "Orders Cancelled", "All orders cancelled")
 
+class PositionsTableModel(QAbstractTableModel):
+    """Positions keyed by conId (or symbol): rows change only when positions open or close, and
+    mark-to-market columns are recomputed for every row in one vectorized pass"""
+
+    HEADERS = ["Symbol", "Position", "Avg Cost", "Current Price",
+               "Market Value", "Unrealized P&L", "Unrealized P&L %", "Day P&L"]
+    FIELDS = ('quantity', 'avg_cost', 'multiplier', 'current_price', 'market_value', 'pnl', 'pnl_pct', 'day_pnl')
+    DTYPE = np.dtype([(field, 'f8') for field in FIELDS])
+    COLUMN_FIELDS = [None, 'quantity', 'avg_cost', 'current_price', 'market_value', 'pnl', 'pnl_pct', 'day_pnl']
+    # The board is keyed by symbol, which for options and futures is the underlying, so only
+    # these security types (at multiplier 1) are marked; other rows keep the IB-reported values
+    MARKABLE_SEC_TYPES = ('STK', 'CASH')
+
+    def __init__(self, quote_board: QuoteBoard, parent=None):
+        super().__init__(parent)
+        self.quote_board = quote_board
+        self.keys = []     # row -> position key
+        self.symbols = []  # row -> symbol
+        self.rows = {}     # position key -> row
+        self.markable = np.zeros(0, dtype=bool)  # row -> whether the symbol's board quote prices it
+        self.reported = np.zeros(0, dtype=self.DTYPE)  # values as last reported by the account
+        self.records = np.zeros(0, dtype=self.DTYPE)   # reported values marked to the quote board
+
+        # Formatting state is shared by every cell, so build the font and brushes once
+        self.bold_font = QFont("Consolas", 11, QFont.Weight.Bold)
+        self.brushes = {
+            'default': QBrush(QColor('white')),
+            'up': QBrush(QColor('#26a69a')),
+            'down': QBrush(QColor('#ef5350')),
+        }
+
+    @staticmethod
+    def position_key(position: dict):
+        """Contract id when the account reports one, otherwise the symbol"""
+        return position.get('con_id') or position.get('symbol', 'N/A')
+
+    @classmethod
+    def is_markable(cls, position: dict) -> bool:
+        """True if the position's own price is the board quote for its symbol"""
+        sec_type = position.get('sec_type') or 'STK'  # demo positions carry no contract details
+        return sec_type in cls.MARKABLE_SEC_TYPES and float(position.get('multiplier') or 1) == 1
+
+    @staticmethod
+    def row_runs(rows: List[int]):
+        """Group descending row numbers into (first, last) runs of adjacent rows"""
+        runs = []
+        for row in rows:
+            if runs and runs[-1][0] == row + 1:
+                runs[-1][0] = row
+            else:
+                runs.append([row, row])
+        return runs
+
+    def set_positions(self, positions: List[dict]):
+        """Apply an account snapshot: remove closed positions, append new ones, update the rest in place"""
+        incoming = {}
+        for position in positions:
+            try:
+                pnl = float(position.get('pnl', 0))
+                values = (float(position.get('quantity', 0)), float(position.get('avg_cost', 0)),
+                          float(position.get('multiplier') or 1), float(position.get('current_price', 0)),
+                          float(position.get('market_value', 0)), pnl, float(position.get('pnl_pct', 0)),
+                          pnl * 0.2)  # Day P&L: mock calculation
+                incoming[self.position_key(position)] = (position.get('symbol', 'N/A'), values,
+                                                         self.is_markable(position))
+            except Exception as e:
+                portfolio_log.error("Error reading position %s: %s", position.get('symbol'), e)
+
+        # Closed positions
+        closed = sorted((row for key, row in self.rows.items() if key not in incoming), reverse=True)
+        for first, last in self.row_runs(closed):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.keys[first:last + 1]
+            del self.symbols[first:last + 1]
+            self.markable = np.delete(self.markable, np.s_[first:last + 1])
+            self.reported = np.delete(self.reported, np.s_[first:last + 1])
+            self.records = np.delete(self.records, np.s_[first:last + 1])
+            self.endRemoveRows()
+        if closed:
+            self.rows = {key: row for row, key in enumerate(self.keys)}
+
+        # Open positions already shown take the new account values
+        held = [key for key in incoming if key in self.rows]
+        if held:
+            rows = np.array([self.rows[key] for key in held], dtype=np.intp)
+            self.reported[rows] = np.array([incoming[key][1] for key in held], dtype=self.DTYPE)
+            self.markable[rows] = [incoming[key][2] for key in held]
+
+        # Newly opened positions
+        opened = [key for key in incoming if key not in self.rows]
+        if opened:
+            first = len(self.keys)
+            self.beginInsertRows(QModelIndex(), first, first + len(opened) - 1)
+            values = np.array([incoming[key][1] for key in opened], dtype=self.DTYPE)
+            self.keys.extend(opened)
+            self.symbols.extend(incoming[key][0] for key in opened)
+            self.markable = np.concatenate([self.markable, [incoming[key][2] for key in opened]]).astype(bool)
+            self.rows.update((key, first + i) for i, key in enumerate(opened))
+            self.reported = np.concatenate([self.reported, values])
+            self.records = np.concatenate([self.records, values])
+            self.endInsertRows()
+
+        self.mark_to_market()
+
+    def mark_to_market(self) -> bool:
+        """Reprice all positions from the quote board and signal the cells that moved"""
+        if not self.keys:
+            return False
+        marked = self.reported.copy()
+        last = self.quote_board.snapshot(self.symbols)['last']
+        priced = self.markable & ~np.isnan(last) & (last > 0)
+        if priced.any():
+            price = last[priced]
+            quantity = marked['quantity'][priced]
+            market_value = quantity * price
+            cost = quantity * marked['avg_cost'][priced]
+            pnl = market_value - cost
+            marked['current_price'][priced] = price
+            marked['market_value'][priced] = market_value
+            marked['pnl'][priced] = pnl
+            marked['pnl_pct'][priced] = np.divide(pnl, np.abs(cost), out=np.zeros_like(pnl),
+                                                  where=cost != 0) * 100
+            marked['day_pnl'][priced] = pnl * 0.2  # Mock calculation
+
+        changed = np.zeros((len(marked), len(self.HEADERS)), dtype=bool)
+        for column, field in enumerate(self.COLUMN_FIELDS):
+            if field:
+                changed[:, column] = marked[field] != self.records[field]
+        self.records = marked
+
+        # One dataChanged per run of adjacent changed rows, spanning the columns that moved
+        changed_rows = np.flatnonzero(changed.any(axis=1)).tolist()
+        for first, last in self.row_runs(changed_rows[::-1]):
+            columns = np.flatnonzero(changed[first:last + 1].any(axis=0))
+            self.dataChanged.emit(self.index(first, int(columns[0])), self.index(last, int(columns[-1])))
+        return bool(changed_rows)
+
+    def total_unrealized(self) -> float:
+        return float(self.records['pnl'].sum())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cell_text(row, column)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.brushes[self.cell_state(row, column)]
+        if role == Qt.ItemDataRole.FontRole and column >= 5:
+            return self.bold_font
+        return None
+
+    def cell_state(self, row: int, column: int) -> str:
+        """Which cached brush a cell uses: long/short for the size, gain/loss for the P&L columns"""
+        record = self.records[row]
+        if column == 1:
+            quantity = record['quantity']
+            return 'up' if quantity > 0 else 'down' if quantity < 0 else 'default'
+        if column in (5, 6):
+            return 'up' if record['pnl'] >= 0 else 'down'
+        if column == 7:
+            return 'up' if record['day_pnl'] >= 0 else 'down'
+        return 'default'
+
+    def cell_text(self, row: int, column: int) -> str:
+        if column == 0:
+            return self.symbols[row]
+        record = self.records[row]
+        field = self.COLUMN_FIELDS[column]
+        value = float(record[field])
+        if field == 'quantity':
+            return str(int(value))
+        if field in ('avg_cost', 'current_price'):
+            return f"${value:.2f}"
+        if field == 'market_value':
+            return f"${value:,.2f}"
+        if field == 'pnl_pct':
+            return f"{value:+.2f}%"
+        return f"${value:+,.2f}"
+
+
 class EnhancedPortfolioWidget(QWidget):
     """Enhanced portfolio widget matching TWS portfolio display"""
     
@@ -1529,6 +3853,8 @@ class EnhancedPortfolioWidget(QWidget):
         super().__init__()
         self.ibkr_connection = ibkr_connection
         self.portfolio_data = {}  # Initialize this FIRST
+        self.positions_model = PositionsTableModel(ibkr_connection.quote_board)
+        self.label_colors = {}  # summary label -> colour currently applied
         self.init_ui()
         self.refresh_portfolio()  # Initial load
 
@@ -1627,22 +3953,19 @@ class EnhancedPortfolioWidget(QWidget):
         positions_label.setStyleSheet("color: #00d4ff; padding: 8px 0px;")
         layout.addWidget(positions_label)
         
-        self.positions_table = QTableWidget()
-        self.positions_table.setColumnCount(8)
-        self.positions_table.setHorizontalHeaderLabels([
-            "Symbol", "Position", "Avg Cost", "Current Price", 
-            "Market Value", "Unrealized P&L", "Unrealized P&L %", "Day P&L"
-        ])
+        self.positions_table = QTableView()
+        self.positions_table.setModel(self.positions_model)
+        self.positions_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
         # Set column widths
         header = self.positions_table.horizontalHeader()
         if header is not None:
-            for i in range(self.positions_table.columnCount()):
+            for i in range(self.positions_model.columnCount()):
                 header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
         
         # Style the table
         self.positions_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #444444;
                 background-color: #0d1421;
                 alternate-background-color: #1a2332;
@@ -1651,7 +3974,7 @@ class EnhancedPortfolioWidget(QWidget):
                 font-size: 11px;
                 selection-background-color: #1e3a5f;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
                 border-bottom: 1px solid #2a2a2a;
             }
@@ -1693,97 +4016,63 @@ class EnhancedPortfolioWidget(QWidget):
         self.total_cash_label.setText(f"Total Cash: ${total_cash:,.2f}")
         self.buying_power_label.setText(f"Buying Power: ${buying_power:,.2f}")
         
-        # Calculate totals for P&L
-        positions = self.portfolio_data.get('positions', [])
-        total_unrealized = sum(pos.get('pnl', 0) for pos in positions)
-        
-        self.unrealized_pnl_label.setText(f"Unrealized P&L: ${total_unrealized:+,.2f}")
-        pnl_color = '#26a69a' if total_unrealized >= 0 else '#ef5350'
-        self.unrealized_pnl_label.setStyleSheet(f"color: {pnl_color}; font-weight: bold; padding: 4px;")
+        # Positions are diffed into the model; only opened/closed rows and changed cells repaint
+        self.positions_model.set_positions(self.portfolio_data.get('positions', []))
+        total_unrealized = self.update_unrealized_pnl()
         
         # Day P&L and realized P&L
         day_pnl = self.portfolio_data.get('day_change', total_unrealized * 0.3)
         realized_pnl = float(account_summary.get('RealizedPnL', 1250.00))
         
         self.day_pnl_label.setText(f"Day P&L: ${day_pnl:+,.2f}")
-        day_color = '#26a69a' if day_pnl >= 0 else '#ef5350'
-        self.day_pnl_label.setStyleSheet(f"color: {day_color}; font-weight: bold; padding: 4px;")
+        self.set_label_color(self.day_pnl_label, '#26a69a' if day_pnl >= 0 else '#ef5350')
         
         self.realized_pnl_label.setText(f"Realized P&L: ${realized_pnl:+,.2f}")
-        real_color = '#26a69a' if realized_pnl >= 0 else '#ef5350'
-        self.realized_pnl_label.setStyleSheet(f"color: {real_color}; font-weight: bold; padding: 4px;")
-        
-        # Update positions table with error handling
-        self.positions_table.setRowCount(len(positions))
-        
-        for i, position in enumerate(positions):
-            try:
-                symbol = position.get('symbol', 'N/A')
-                pos_size = position.get('quantity', 0)
-                avg_cost = position.get('avg_cost', 0)
-                market_value = position.get('market_value', 0)
-                current_price = position.get('current_price', 0)
-                pnl = position.get('pnl', 0)
-                pnl_pct = position.get('pnl_pct', 0)
-                
-                # Symbol
-                self.positions_table.setItem(i, 0, QTableWidgetItem(symbol))
-                
-                # Position size with color for long/short
-                pos_item = QTableWidgetItem(str(int(pos_size)))
-                pos_color = '#26a69a' if pos_size > 0 else '#ef5350' if pos_size < 0 else 'white'
-                pos_item.setForeground(QColor(pos_color))
-                self.positions_table.setItem(i, 1, pos_item)
-                
-                # Average cost
-                self.positions_table.setItem(i, 2, QTableWidgetItem(f"${avg_cost:.2f}"))
-                
-                # Current price
-                self.positions_table.setItem(i, 3, QTableWidgetItem(f"${current_price:.2f}"))
-                
-                # Market value
-                self.positions_table.setItem(i, 4, QTableWidgetItem(f"${market_value:,.2f}"))
-                
-                # Unrealized P&L with color
-                unrealized_item = QTableWidgetItem(f"${pnl:+,.2f}")
-                unrealized_color = '#26a69a' if pnl >= 0 else '#ef5350'
-                unrealized_item.setForeground(QColor(unrealized_color))
-                unrealized_item.setFont(QFont("Consolas", 11, QFont.Weight.Bold))
-                self.positions_table.setItem(i, 5, unrealized_item)
-                
-                # Unrealized P&L %
-                unrealized_pct_item = QTableWidgetItem(f"{pnl_pct:+.2f}%")
-                unrealized_pct_item.setForeground(QColor(unrealized_color))
-                unrealized_pct_item.setFont(QFont("Consolas", 11, QFont.Weight.Bold))
-                self.positions_table.setItem(i, 6, unrealized_pct_item)
-                
-                # Day P&L (estimate or calculate)
-                day_pnl_pos = pnl * 0.2  # Mock calculation
-                day_pnl_item = QTableWidgetItem(f"${day_pnl_pos:+,.2f}")
-                day_pnl_color = '#26a69a' if day_pnl_pos >= 0 else '#ef5350'
-                day_pnl_item.setForeground(QColor(day_pnl_color))
-                day_pnl_item.setFont(QFont("Consolas", 11, QFont.Weight.Bold))
-                self.positions_table.setItem(i, 7, day_pnl_item)
-                
-            except Exception as e:
-                print(f"Error updating position row {i}: {e}")
-                # Add empty row on error
-                for col in range(8):
-                    self.positions_table.setItem(i, col, QTableWidgetItem("Error"))
+        self.set_label_color(self.realized_pnl_label, '#26a69a' if realized_pnl >= 0 else '#ef5350')
+
+    def update_unrealized_pnl(self) -> float:
+        """Show the model's marked-to-market unrealized P&L total"""
+        total_unrealized = self.positions_model.total_unrealized()
+        self.unrealized_pnl_label.setText(f"Unrealized P&L: ${total_unrealized:+,.2f}")
+        self.set_label_color(self.unrealized_pnl_label, '#26a69a' if total_unrealized >= 0 else '#ef5350')
+        return total_unrealized
+
+    def set_label_color(self, label: QLabel, color: str):
+        """Restyle a summary label only when its colour actually changes"""
+        if self.label_colors.get(label) == color:
+            return
+        self.label_colors[label] = color
+        label.setStyleSheet(f"color: {color}; font-weight: bold; padding: 4px;")
+
+    def mark_to_market(self):
+        """Reprice held positions from the latest quotes; called once per rendered frame"""
+        if self.positions_model.mark_to_market():
+            self.update_unrealized_pnl()
 
     def refresh_portfolio(self):
-        """Force refresh portfolio data"""
+        """Force refresh portfolio data; when connected it is fetched on the IB loop thread"""
         try:
-            portfolio_data = self.ibkr_connection.get_portfolio_data()
-            self.update_portfolio(portfolio_data)
+            if self.ibkr_connection.connected:
+                future = self.ibkr_connection.request_portfolio_data()
+                self.ibkr_connection.bridge.deliver(future, self.on_portfolio_data)
+            else:
+                self.update_portfolio(self.ibkr_connection.get_portfolio_data())
         except Exception as e:
-            print(f"Error refreshing portfolio: {e}")
+            portfolio_log.error("Error refreshing portfolio: %s", e)
             # Use mock data as fallback
             self.update_portfolio(self.ibkr_connection.get_mock_portfolio_data())
+
+    def on_portfolio_data(self, future):
+        """Apply a portfolio snapshot requested by refresh_portfolio"""
+        try:
+            self.update_portfolio(future.result())
+        except Exception as e:
+            portfolio_log.error("Error refreshing portfolio: %s", e)
+            self.update_portfolio(self.ibkr_connection.get_mock_portfolio_data())
     def on_connection_status_changed(self, connected):
         """Handle connection status changes and refresh portfolio"""
         if connected:
-            print("[PORTFOLIO] Connection established, refreshing portfolio...")
+            portfolio_log.info("Connection established, refreshing portfolio...")
             # Wait a moment for connection to stabilize
             QTimer.singleShot(2000, self.refresh_portfolio)
 
@@ -1838,48 +4127,315 @@ class ConnectionDialog(QDialog):
 
 
 
+class QuoteFetchPool:
+    """Bounded thread pool for concurrent quote fetches with per-symbol deadlines
+
+    A fetch's deadline runs from the moment a worker picks it up, so time spent queued behind slow
+    symbols does not count against it. Fetches still queued when the cycle budget (one deadline per
+    wave of max_workers fetches) runs out are cancelled.
+    """
+
+    def __init__(self, max_workers: int = 8, deadline: float = 2.0):
+        self.max_workers = max(1, max_workers)
+        self.deadline = deadline
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="quote-fetch")
+        self.stats_lock = threading.Lock()
+        self.cycles = 0
+        self.total_timeouts = 0
+        self.total_errors = 0
+        self.last_cycle_latency = 0.0
+        self.last_cycle_timeouts = 0
+
+    def fetch(self, keys, fetch_fn, deadline: Optional[float] = None) -> Dict:
+        """Run fetch_fn(key) for every key concurrently, dropping results that miss their own deadline"""
+        deadline = self.deadline if deadline is None else deadline
+        keys = list(keys)
+        started = time.monotonic()
+        begun = {}  # key -> time.monotonic() when a worker picked the fetch up
+
+        def run(key):
+            begun[key] = time.monotonic()
+            return fetch_fn(key)
+
+        futures = {self.executor.submit(run, key): key for key in keys}
+        waves = (len(keys) + self.max_workers - 1) // self.max_workers
+        cycle_end = started + deadline * max(waves, 1)
+        pending = set(futures)
+        results = {}
+        errors = 0
+        late = []
+
+        while pending:
+            now = time.monotonic()
+            # A running fetch past its own deadline is abandoned; its worker finishes it unobserved
+            for future in [future for future in pending if futures[future] in begun
+                           and now - begun[futures[future]] >= deadline]:
+                pending.discard(future)
+                late.append(futures[future])
+            if not pending or now >= cycle_end:
+                break
+            # Wake for the next completion, the next running deadline, or soon after a queued fetch starts
+            wake = [begun[futures[future]] + deadline for future in pending if futures[future] in begun]
+            if len(wake) < len(pending):
+                wake.append(now + min(deadline, 0.05))
+            done, pending = concurrent.futures.wait(pending, timeout=max(min(wake + [cycle_end]) - now, 0),
+                                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    errors += 1
+                    quote_log.warning("Fetch failed for %s: %s", key, e)
+
+        # Whatever the cycle budget left behind is late too: queued fetches are cancelled, running ones ignored
+        for future in pending:
+            future.cancel()
+            late.append(futures[future])
+        timeouts = len(late)
+        for key in late:
+            quote_log.warning("Deadline of %.1fs missed for %s, dropping result", deadline, key)
+
+        with self.stats_lock:
+            self.cycles += 1
+            self.total_timeouts += timeouts
+            self.total_errors += errors
+            self.last_cycle_latency = time.monotonic() - started
+            self.last_cycle_timeouts = timeouts
+
+        return results
+
+    def set_max_workers(self, max_workers: int):
+        """Resize the pool; fetches already running finish on the old pool"""
+        old_executor = self.executor
+        self.max_workers = max(1, max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="quote-fetch")
+        old_executor.shutdown(wait=False)
+
+    def set_deadline(self, deadline: float):
+        """Set the per-symbol deadline in seconds, counted from when a worker starts the fetch"""
+        self.deadline = max(0.1, deadline)
+
+    def get_stats(self) -> Dict:
+        """Per-cycle latency and timeout counters for tuning"""
+        with self.stats_lock:
+            return {
+                'max_workers': self.max_workers,
+                'deadline': self.deadline,
+                'cycles': self.cycles,
+                'last_cycle_latency_ms': self.last_cycle_latency * 1000,
+                'last_cycle_timeouts': self.last_cycle_timeouts,
+                'total_timeouts': self.total_timeouts,
+                'total_errors': self.total_errors,
+            }
+
+    def shutdown(self):
+        """Stop the pool without waiting for late fetches"""
+        self.executor.shutdown(wait=False)
+
+
+def is_us_market_open(now: Optional[datetime] = None) -> bool:
+    """Regular US equity session check: Mon-Fri 09:30-16:00 New York time (holidays ignored)"""
+    new_york = None
+    if ZoneInfo is not None:
+        try:
+            new_york = ZoneInfo("America/New_York")
+        except ZoneInfoNotFoundError:  # e.g. Windows without the tzdata package
+            pass
+    if new_york is not None:
+        now = now.astimezone(new_york) if now else datetime.now(new_york)
+    else:
+        # No tz database: approximate New York as UTC-5
+        now = (now.astimezone(timezone.utc) if now else datetime.now(timezone.utc)) - timedelta(hours=5)
+
+    if now.weekday() >= 5:
+        return False
+    minutes = now.hour * 60 + now.minute
+    return 9 * 60 + 30 <= minutes < 16 * 60
+
+
+class QuotePollScheduler:
+    """Per-symbol refresh rates by priority, backing off while the exchange is closed"""
+
+    # Seconds between polls for each priority tier
+    DEFAULT_INTERVALS = {
+        'selected': 1.0,     # symbol shown in the trading panel
+        'visible': 5.0,      # rows currently on screen in the watchlist
+        'background': 30.0,  # everything else
+    }
+
+    def __init__(self, intervals: Optional[Dict[str, float]] = None, closed_multiplier: float = 10.0):
+        self.intervals = dict(self.DEFAULT_INTERVALS)
+        if intervals:
+            self.intervals.update(intervals)
+        self.closed_multiplier = closed_multiplier
+        self.selected = None
+        self.visible = set()
+        self.last_polled = {}  # symbol -> time.monotonic() of the last poll
+        self.lock = threading.Lock()
+        self.market_open = True
+        self.market_checked_at = 0.0
+
+    def set_selected(self, symbol: Optional[str]):
+        with self.lock:
+            self.selected = symbol.upper() if symbol else None
+
+    def set_visible(self, symbols: List[str]):
+        with self.lock:
+            self.visible = set(symbols)
+
+    def forget(self, symbol: str):
+        with self.lock:
+            self.last_polled.pop(symbol, None)
+            self.visible.discard(symbol)
+
+    def is_market_open(self) -> bool:
+        """Market session state, re-checked at most once a minute"""
+        now = time.monotonic()
+        if now - self.market_checked_at > 60:
+            # Stamp first so a failing check is retried once a minute, not on every get_interval
+            self.market_checked_at = now
+            try:
+                self.market_open = is_us_market_open()
+            except Exception as e:
+                quote_log.warning("Market hours check failed, keeping market %s: %s",
+                                  'open' if self.market_open else 'closed', e)
+        return self.market_open
+
+    def get_priority(self, symbol: str) -> str:
+        if symbol == self.selected:
+            return 'selected'
+        if symbol in self.visible:
+            return 'visible'
+        return 'background'
+
+    def get_interval(self, symbol: str) -> float:
+        """Current seconds between polls for a symbol"""
+        interval = self.intervals[self.get_priority(symbol)]
+        if not self.is_market_open():
+            interval *= self.closed_multiplier
+        return interval
+
+    def get_backlog(self, symbol: str, now: Optional[float] = None) -> float:
+        """Seconds a symbol is overdue for a refresh (0 when it is not due yet)"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            last = self.last_polled.get(symbol)
+        if last is None:
+            return 0.0
+        return max(0.0, now - last - self.get_interval(symbol))
+
+    def due_symbols(self, symbols: List[str], now: Optional[float] = None) -> List[str]:
+        """Symbols whose refresh interval has elapsed, highest priority first"""
+        now = time.monotonic() if now is None else now
+        order = {'selected': 0, 'visible': 1, 'background': 2}
+        with self.lock:
+            due = [symbol for symbol in symbols
+                   if now - self.last_polled.get(symbol, float('-inf')) >= self.get_interval(symbol)]
+        return sorted(due, key=lambda symbol: order[self.get_priority(symbol)])
+
+    def mark_polled(self, symbols: List[str], now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            for symbol in symbols:
+                self.last_polled[symbol] = now
+
+    def next_due_in(self, symbols: List[str], now: Optional[float] = None) -> float:
+        """Seconds until the next symbol becomes due"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            waits = [self.last_polled.get(symbol, float('-inf')) + self.get_interval(symbol) - now
+                     for symbol in symbols]
+        return max(0.0, min(waits)) if waits else self.intervals['background']
+
+    def get_schedule(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Current priority, rate and backlog for each symbol"""
+        now = time.monotonic()
+        schedule = {}
+        for symbol in symbols:
+            interval = self.get_interval(symbol)
+            schedule[symbol] = {
+                'priority': self.get_priority(symbol),
+                'interval': interval,
+                'rate_hz': 1.0 / interval,
+                'backlog': self.get_backlog(symbol, now),
+            }
+        return schedule
+
+
 class DataUpdateWorker(QThread):
     """Background worker for updating market data and portfolio"""
     
-    data_ready = pyqtSignal(str, dict)  # symbol, data
+    quotes_ready = pyqtSignal(object)  # QuoteBoard version after this cycle's writes
     portfolio_ready = pyqtSignal(dict)  # portfolio_data
     orders_ready = pyqtSignal(list)  # open orders
     trades_ready = pyqtSignal(list)  # executions
     error_occurred = pyqtSignal(str)    # error_message
     
-    def __init__(self, symbols: List[str], ibkr_connection):
+    def __init__(self, symbols: List[str], ibkr_connection, fetch_pool: Optional[QuoteFetchPool] = None,
+                 scheduler: Optional[QuotePollScheduler] = None):
         super().__init__()
         self.symbols = symbols
         self.ibkr_connection = ibkr_connection
+        self.fetch_pool = fetch_pool or QuoteFetchPool()
+        self.scheduler = scheduler or QuotePollScheduler()
         self.running = False
         self.update_interval = 1  # Faster updates - 1 second instead of 2
-        
+        self.batch_size = 50  # Symbols per multi-ticker Yahoo download
+        # A batch is one download for up to batch_size symbols, so it gets more than the pool's per-symbol
+        # deadline; the cold-start full-day download of a large batch can take several seconds
+        self.batch_deadline = 15.0
+        self.quote_board = ibkr_connection.quote_board
+        self.last_version = 0  # board version last announced through quotes_ready
+
     def run(self):
         """Main worker thread loop with better error handling"""
         self.running = True
         consecutive_errors = 0
         max_consecutive_errors = 5
+        last_account_refresh = 0.0
         
         while self.running:
             try:
                 # Check connection health first
                 if not self.ibkr_connection.connected: 
-                    print("[WORKER] Connection not healthy, using fallback data")
+                    worker_log.debug("Connection not healthy, using fallback data")
                     pass
                 
-                # Update market data for all symbols
-                for symbol in self.symbols:
+                # Quotes are written into the board in place; readers pull what changed
+                symbols = list(self.symbols)
+                if self.ibkr_connection.simulated_market:
+                    self.ibkr_connection.publish_simulated_quotes(symbols)
+                    polled = []
+                else:
+                    # Streamed TWS quotes are pushed onto the board; only the rest go to Yahoo
+                    streamed = set(self.ibkr_connection.get_streaming_symbols(symbols))
+                    polled = [symbol for symbol in symbols if symbol not in streamed]
+
+                # Poll only the symbols the scheduler says are due, highest priority first.
+                # Batches are downloaded concurrently and batches that miss batch_deadline are dropped;
+                # a late download still fills the quote cache for the next cycle
+                symbols = self.scheduler.due_symbols(polled)
+                self.scheduler.mark_polled(symbols)
+                batches = [tuple(symbols[start:start + self.batch_size])
+                           for start in range(0, len(symbols), self.batch_size)]
+                results = self.fetch_pool.fetch(
+                    batches,
+                    lambda batch: self.ibkr_connection.get_batch_fallback_data(list(batch), self.batch_size),
+                    deadline=self.batch_deadline
+                )
+
+                for batch in batches:
                     if not self.running:
                         break
-                    
-                    try:
-                        data = self.ibkr_connection.get_fallback_data(symbol)
-                        self.data_ready.emit(symbol, data)
+
+                    if batch in results:
+                        self.quote_board.update_many(results[batch])
                         consecutive_errors = 0  # Reset error counter on success
-                    except Exception as e:
+                    else:
                         consecutive_errors += 1
-                        self.error_occurred.emit(f"Error updating {symbol}: {str(e)}")
-                        
+                        self.error_occurred.emit(f"Error updating {', '.join(batch)}: fetch failed or timed out")
+
                         if consecutive_errors >= max_consecutive_errors:
                             self.error_occurred.emit(f"Too many consecutive errors ({consecutive_errors}), slowing down updates")
                             # Sleep longer after many errors
@@ -1887,9 +4443,19 @@ class DataUpdateWorker(QThread):
                                 if not self.running:
                                     break
                                 self.msleep(100)
+
+                version = self.quote_board.version
+                if version != self.last_version and self.running:
+                    self.last_version = version
+                    self.quotes_ready.emit(version)
+
+                # Account data keeps the flat update_interval cadence
+                account_due = time.monotonic() - last_account_refresh >= self.update_interval
+                if account_due:
+                    last_account_refresh = time.monotonic()
                 
                 # Update portfolio and other data
-                if self.running:
+                if self.running and account_due:
                     try:
                         portfolio_data = self.ibkr_connection.get_portfolio_data()
                         self.portfolio_ready.emit(portfolio_data)
@@ -1897,7 +4463,7 @@ class DataUpdateWorker(QThread):
                         self.error_occurred.emit(f"Error updating portfolio: {str(e)}")
                 
                 # Update orders and trades
-                if self.running:
+                if self.running and account_due:
                     try:
                         open_orders = self.ibkr_connection.get_open_orders()
                         self.orders_ready.emit(open_orders)
@@ -1910,8 +4476,10 @@ class DataUpdateWorker(QThread):
                     except Exception as e:
                         self.error_occurred.emit(f"Error updating trades: {str(e)}")
                 
-                # Sleep for the update interval
-                for _ in range(self.update_interval * 10):
+                # Sleep until the next symbol is due, but wake up at least every
+                # update_interval for streamed quotes and account data
+                wait = min(self.scheduler.next_due_in(polled), self.update_interval)
+                for _ in range(max(1, int(wait * 10))):
                     if not self.running:
                         break
                     self.msleep(100)
@@ -1921,10 +4489,10 @@ class DataUpdateWorker(QThread):
                 consecutive_errors += 1
                 
                 if consecutive_errors >= max_consecutive_errors:
-                    print(f"[WORKER] Too many errors, stopping worker thread")
+                    worker_log.error("Too many errors, stopping worker thread")
                     break
         
-        print("[WORKER] Data worker thread stopped")
+        worker_log.info("Data worker thread stopped")
 
     
     def stop(self):
@@ -1940,11 +4508,204 @@ class DataUpdateWorker(QThread):
         """Remove a symbol from the update list"""
         if symbol in self.symbols:
             self.symbols.remove(symbol)
+        self.scheduler.forget(symbol)
     
     def set_update_interval(self, interval: int):
         """Set the update interval in seconds"""
         self.update_interval = max(1, interval)
 
+    def set_batch_size(self, batch_size: int):
+        """Set how many symbols are fetched per batched download"""
+        self.batch_size = max(1, batch_size)
+
+class RSSFeedFetcher:
+    """Polls RSS feeds on a background thread with conditional GETs and backoff, into a deduplicated item cache"""
+
+    DEFAULT_FEEDS = [
+        {'url': "https://finance.yahoo.com/news/rssindex", 'provider': 'YAHOO FINANCE', 'interval': 60.0},
+        {'url': "https://www.cnbc.com/id/100003114/device/rss/rss.html", 'provider': 'CNBC', 'interval': 120.0},
+    ]
+    MAX_BACKOFF = 900.0   # seconds; failing feeds are retried at most this far apart
+    REQUEST_TIMEOUT = 10.0
+
+    def __init__(self, feeds: Optional[List[Dict]] = None, max_items: int = 500, autostart: bool = True):
+        self.lock = threading.Lock()
+        self.feeds = []
+        self.items = OrderedDict()  # dedupe key -> news item, in arrival order
+        self.max_items = max_items
+        self.version = 0            # bumped whenever the cache gains items
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = "Mozilla/5.0 (Professional Trading Platform RSS reader)"
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+        for feed in self.DEFAULT_FEEDS if feeds is None else feeds:
+            self.add_feed(**feed)
+        if autostart:
+            self.start()
+
+    def add_feed(self, url: str, provider: Optional[str] = None, interval: float = 60.0):
+        """Register a feed; it is polled on its own interval starting with the next loop pass"""
+        with self.lock:
+            self.feeds.append({
+                'url': url,
+                'provider': provider,
+                'interval': interval,
+                'etag': None,
+                'modified': None,
+                'next_poll': 0.0,
+                'failures': 0,
+                'last_status': None,
+                'fetches': 0,
+                'not_modified': 0,
+            })
+        self.wakeup.set()
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="rss-fetcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=self.REQUEST_TIMEOUT)
+
+    def _run(self):
+        """Fetch whichever feeds are due, then sleep until the next one is"""
+        while self.running:
+            now = time.monotonic()
+            with self.lock:
+                due = [feed for feed in self.feeds if feed['next_poll'] <= now]
+            for feed in due:
+                if not self.running:
+                    return
+                self.poll_feed(feed)
+            with self.lock:
+                next_poll = min((feed['next_poll'] for feed in self.feeds), default=now + 60.0)
+            self.wakeup.wait(max(0.0, next_poll - time.monotonic()))
+            self.wakeup.clear()
+
+    def poll_feed(self, feed: Dict):
+        """One conditional GET; 304 keeps the cache, 429/503 wait for Retry-After, other errors push the
+        feed's next poll out exponentially. Feed state is only touched under the lock."""
+        with self.lock:
+            url = feed['url']
+            delay = feed['interval']
+            headers = {}
+            if feed['etag']:
+                headers['If-None-Match'] = feed['etag']
+            if feed['modified']:
+                headers['If-Modified-Since'] = feed['modified']
+        retry_after = None
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            status = response.status_code
+            with self.lock:
+                feed['fetches'] += 1
+                feed['last_status'] = status
+                if status == 304:
+                    feed['not_modified'] += 1
+            if status in (429, 503):
+                retry_after = self.retry_after_seconds(response.headers.get('Retry-After'))
+                raise RuntimeError(f"HTTP {status}")
+            if status != 304:
+                response.raise_for_status()
+                added = self.ingest(feed, feedparser.parse(response.content))
+                with self.lock:
+                    feed['etag'] = response.headers.get('ETag')
+                    feed['modified'] = response.headers.get('Last-Modified')
+                news_log.debug("Fetched %s: %d new items", url, added)
+            with self.lock:
+                feed['failures'] = 0
+        except Exception as e:
+            with self.lock:
+                feed['failures'] += 1
+                failures = feed['failures']
+            if retry_after is not None:
+                delay = retry_after
+            else:
+                delay = min(delay * 2 ** failures, self.MAX_BACKOFF)
+            news_log.warning("RSS fetch failed for %s (attempt %d, retrying in %.0fs): %s", url, failures, delay, e)
+        with self.lock:
+            feed['next_poll'] = time.monotonic() + delay
+
+    @staticmethod
+    def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+        """Retry-After header as seconds from now; it is either delta-seconds or an HTTP date"""
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def ingest(self, feed: Dict, parsed) -> int:
+        """Parse entries off the GUI thread and add the ones not already cached"""
+        provider_name = feed['provider'] or 'RSS'
+        if not feed['provider'] and hasattr(parsed, 'feed') and hasattr(parsed.feed, 'title'):
+            provider_name = parsed.feed.title.upper()
+
+        news_items = []
+        for entry in parsed.entries[:50]:  # Limit to 50 recent items
+            title = entry.title if hasattr(entry, 'title') else ''
+            published = entry.published if hasattr(entry, 'published') else ''
+            link = entry.link if hasattr(entry, 'link') else ''
+
+            # Parse published date
+            try:
+                if published:
+                    parsed_date = date_parser.parse(published)
+                else:
+                    parsed_date = datetime.now()
+            except Exception:
+                parsed_date = datetime.now()
+
+            key = entry.get('id') or link or f"{provider_name}:{title}"
+            news_items.append((key, {
+                'timestamp': parsed_date,
+                'provider': provider_name,
+                'symbol': '',
+                'headline': title,
+                'url': link,
+                'received_at': datetime.now()
+            }))
+
+        added = 0
+        with self.lock:
+            for key, item in news_items:
+                if key in self.items:
+                    continue
+                self.items[key] = item
+                added += 1
+            while len(self.items) > self.max_items:
+                self.items.popitem(last=False)
+            if added:
+                self.version += 1
+        return added
+
+    def get_items(self) -> List[Dict]:
+        """Cached items, oldest first; safe to call from the GUI thread"""
+        with self.lock:
+            return list(self.items.values())
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {
+                'items': len(self.items),
+                'version': self.version,
+                'feeds': [{key: feed[key] for key in ('url', 'last_status', 'failures', 'fetches', 'not_modified')}
+                          for feed in self.feeds],
+            }
+
+
 class EnhancedNewsWidget(QWidget):
     """TWS-style news feed with fallback RSS import for paper trading."""
 
@@ -1952,10 +4713,18 @@ class EnhancedNewsWidget(QWidget):
         super().__init__()
         self.ibkr_connection = ibkr_connection
         self.current_symbol = None
+        self.rss_fetcher = RSSFeedFetcher()
+        self.max_items = 50
+        self.news_version = None   # (symbol, TWS store version, RSS cache version) last rendered
+        self.news_source = None    # 'tws' or 'rss'
+        self.seen_keys = set()     # article ids / URLs already in the list
+        self.sort_keys = []        # -timestamp per list row, ascending, for bisect insertion
+        self.acronyms = {}         # provider -> acronym, resolved once per provider
+        self.placeholder = None
         self.init_ui()
         self.news_timer = QTimer()
         self.news_timer.timeout.connect(self.refresh_news)
-        self.news_timer.start(2000)  # Refresh every 2 seconds
+        self.news_timer.start(2000)  # Refresh every 2 seconds; RSS is only read from the fetcher's cache
         self.refresh_news()
 
     def init_ui(self):
@@ -2039,105 +4808,116 @@ class EnhancedNewsWidget(QWidget):
             try:
                 webbrowser.open(url)
             except Exception as e:
-                print(f"Error opening URL: {e}")
+                news_log.error("Error opening URL: %s", e)
         else:
-            print("No valid URL found for this news item")
+            news_log.warning("No valid URL found for this news item")
 
     def refresh_news(self):
-        # Get TWS news
-        tws_items = self.ibkr_connection.get_tws_news(self.current_symbol)
-        # If no TWS news, fallback to RSS
-        if not tws_items:
-            tws_items = self.import_rss_news()
-        items = sorted(tws_items, key=lambda x: x.get('timestamp', datetime.min), reverse=True)[:50]  # Newest first, limit 50
-        self.news_list.clear()
-        if not items:
-            self.news_list.addItem("No news available - Check connection or subscriptions")
+        """Insert news that arrived since the last refresh; nothing is rebuilt when no news arrived"""
+        version = (self.current_symbol, self.ibkr_connection.news_store.next_id, self.rss_fetcher.version)
+        if version == self.news_version:
             return
+        self.news_version = version
+        
+        # Get TWS news, falling back to RSS
+        source = 'tws'
+        items = self.ibkr_connection.get_tws_news(self.current_symbol)
+        if not items:
+            source = 'rss'
+            items = self.rss_fetcher.get_items()
+        if source != self.news_source:
+            self.reset_news_list()
+            self.news_source = source
+        
+        new_items = []
         for news in items:
-            # Parse timestamp to DD/MM/YY HH:MM:SS format
-            timestamp = news.get('timestamp')
-            date_time_str = ""
-            try:
-                if isinstance(timestamp, datetime):
-                    date_time_str = timestamp.strftime("%d/%m/%y %H:%M:%S")
-                elif isinstance(timestamp, (int, float)):
-                    date_time_str = datetime.fromtimestamp(timestamp).strftime("%d/%m/%y %H:%M:%S")
-                elif isinstance(timestamp, str):
-                    try:
-                        parsed_dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                        date_time_str = parsed_dt.strftime("%d/%m/%y %H:%M:%S")
-                    except Exception:
-                        try:
-                            parsed_dt = datetime.strptime(timestamp, "%a, %d %b %Y %H:%M:%S %Z")
-                            date_time_str = parsed_dt.strftime("%d/%m/%y %H:%M:%S")
-                        except Exception:
-                            # Default to current time if parsing fails
-                            date_time_str = datetime.now().strftime("%d/%m/%y %H:%M:%S")
-            except Exception:
-                date_time_str = datetime.now().strftime("%d/%m/%y %H:%M:%S")
-            
-            # Get provider acronym
-            provider = news.get('provider', '').upper()
-            provider_acronym = self.get_provider_acronym(provider)
-            
-            # Get headline only
-            headline = news.get('headline', '')
-            
-            # Format as: "DD/MM/YY HH:MM:SS ACRONYM HEADLINE"
-            display_text = f"{date_time_str} {provider_acronym} {headline}".strip()
+            key = news.get('articleId') or news.get('url') or news.get('link') or \
+                f"{news.get('provider', '')}:{news.get('headline', '')}"
+            if key not in self.seen_keys:
+                self.seen_keys.add(key)
+                new_items.append(self.normalize_news(news))
+        if not new_items:
+            if self.news_list.count() == 0:
+                self.placeholder = QListWidgetItem("No news available - Check connection or subscriptions")
+                self.news_list.addItem(self.placeholder)
+            return
+        if self.placeholder is not None:
+            self.news_list.takeItem(self.news_list.row(self.placeholder))
+            self.placeholder = None
+        
+        # Keep the reader's place: if scrolled down, re-anchor on the top visible item after inserting
+        scroll_bar = self.news_list.verticalScrollBar()
+        anchor = self.news_list.itemAt(0, 0) if scroll_bar.value() > 0 else None
+        
+        # Newest first: each item goes in at its timestamp's position
+        for sort_key, display_text, url in sorted(new_items):
+            row = bisect.bisect_right(self.sort_keys, sort_key)
+            if row >= self.max_items:
+                continue
+            self.sort_keys.insert(row, sort_key)
             
             # Create clickable item
             item = QListWidgetItem(display_text)
             item.setForeground(QColor('#e0e0e0'))
             
             # Store the URL for click handling
-            url = news.get('url', news.get('link', ''))
             item.setData(Qt.ItemDataRole.UserRole, url)
-            
-            self.news_list.addItem(item)
+            self.news_list.insertItem(row, item)
+        
+        # Limit 50; the oldest fall off the bottom
+        while len(self.sort_keys) > self.max_items:
+            self.sort_keys.pop()
+            self.news_list.takeItem(self.news_list.count() - 1)
+        
+        if anchor is not None and self.news_list.row(anchor) >= 0:
+            self.news_list.scrollToItem(anchor, QListWidget.ScrollHint.PositionAtTop)
 
+    def reset_news_list(self):
+        """Drop everything shown, e.g. when the symbol or news source changes"""
+        self.news_list.clear()
+        self.seen_keys.clear()
+        self.sort_keys.clear()
+        self.placeholder = None
 
-    def import_rss_news(self):
-        """Fallback RSS import for paper trading with no subscriptions."""
+    @staticmethod
+    def normalize_timestamp(timestamp) -> datetime:
+        """News timestamps as naive local datetimes, whatever form the source delivered"""
         try:
-            feed_url = "https://finance.yahoo.com/news/rssindex"
-            feed = feedparser.parse(feed_url)
-            news_items = []
-            provider_name = 'YAHOO FINANCE'
-            
-            if hasattr(feed, 'feed') and not isinstance(feed.feed, list) and hasattr(feed.feed, 'title'):
-                provider_name = feed.feed.title.upper()
-            
-            for entry in feed.entries[:50]:  # Limit to 50 recent items
-                title = entry.title if hasattr(entry, 'title') else ''
-                published = entry.published if hasattr(entry, 'published') else ''
-                link = entry.link if hasattr(entry, 'link') else ''
-                
-                # Parse published date
+            if isinstance(timestamp, (int, float)):
+                timestamp = datetime.fromtimestamp(timestamp)
+            elif isinstance(timestamp, str):
                 try:
-                    if published:
-                        parsed_date = date_parser.parse(published)
-                    else:
-                        parsed_date = datetime.now()
-                except:
-                    parsed_date = datetime.now()
-                
-                news_items.append({
-                    'timestamp': parsed_date,
-                    'provider': provider_name,
-                    'symbol': '',
-                    'headline': title,
-                    'url': link,
-                    'received_at': datetime.now()
-                })
-            return news_items
-        except Exception as e:
-            print(f"Error fetching RSS news: {e}")
-            return []
+                    timestamp = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    timestamp = date_parser.parse(timestamp)
+            if not isinstance(timestamp, datetime):
+                return datetime.now()
+            if timestamp.tzinfo is not None:
+                timestamp = timestamp.astimezone().replace(tzinfo=None)
+            return timestamp
+        except Exception:
+            # Default to current time if parsing fails
+            return datetime.now()
+
+    def normalize_news(self, news: Dict):
+        """Sort key, display text and URL for a news item, computed once when it first arrives"""
+        timestamp = self.normalize_timestamp(news.get('timestamp'))
+        
+        # Get provider acronym
+        provider = news.get('provider', '').upper()
+        provider_acronym = self.acronyms.get(provider)
+        if provider_acronym is None:
+            provider_acronym = self.acronyms[provider] = self.get_provider_acronym(provider)
+        
+        # Format as: "DD/MM/YY HH:MM:SS ACRONYM HEADLINE"
+        display_text = f"{timestamp.strftime('%d/%m/%y %H:%M:%S')} {provider_acronym} {news.get('headline', '')}".strip()
+        url = news.get('url', news.get('link', ''))
+        return -timestamp.timestamp(), display_text, url
 
     def update_news_for_symbol(self, symbol):
-        self.current_symbol = symbol
+        if symbol != self.current_symbol:
+            self.current_symbol = symbol
+            self.reset_news_list()
         self.refresh_news()
 
 class AdvancedScreenerWidget(QWidget):
@@ -2148,14 +4928,14 @@ class AdvancedScreenerWidget(QWidget):
             # Attempt to import WebEngine components
             from PyQt6.QtWebEngineWidgets import QWebEngineView
             from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
-            print("[SCREENER] WebEngine components successfully imported")
+            screener_log.info("WebEngine components successfully imported")
             return True
         except ImportError as e:
-            print(f"[SCREENER] WebEngine not available: {e}")
-            print("Install with: pip install PyQt6-WebEngine")
+            screener_log.warning("WebEngine not available: %s", e)
+            screener_log.warning("Install with: pip install PyQt6-WebEngine")
             return False
         except Exception as e:
-            print(f"[SCREENER] WebEngine check failed: {e}")
+            screener_log.warning("WebEngine check failed: %s", e)
             return False
     
     def __init__(self):
@@ -2353,7 +5133,7 @@ class AdvancedScreenerWidget(QWidget):
             return
         
         current_url = self.web_view.url().toString()
-        print(f"[SCREENER] Page loaded: {current_url}")
+        screener_log.info("Page loaded: %s", current_url)
         
         # Check if we're on the login page
         if "login" in current_url.lower() or "signin" in current_url.lower():
@@ -2435,7 +5215,7 @@ class AdvancedScreenerWidget(QWidget):
     
     def on_login_script_result(self, result):
         """Handle the result of the login script"""
-        print(f"[SCREENER] Login script result: {result}")
+        screener_log.debug("Login script result: %s", result)
         
         # Import QTimer here to avoid import issues
         from PyQt6.QtCore import QTimer
@@ -2452,7 +5232,7 @@ class AdvancedScreenerWidget(QWidget):
         
         if "elite.finviz.com" in current_url and "screener" not in current_url:
             # We're logged in but not on the screener page, redirect
-            print(f"[SCREENER] Login successful, redirecting to screener...")
+            screener_log.info("Login successful, redirecting to screener...")
             from PyQt6.QtCore import QUrl
             self.web_view.load(QUrl(self.screener_url))
         elif "login" in current_url.lower():
@@ -2506,12 +5286,248 @@ class AdvancedScreenerWidget(QWidget):
         self.login_attempted = False
         self.web_view.reload()
 
+class OrdersTableModel(QAbstractTableModel):
+    """Open orders keyed by orderId (permId for orders from TWS or other clients); rows are updated in
+    place and only changed cells are signalled"""
+
+    HEADERS = ["Order ID", "Symbol", "Action", "Qty", "Type", "Price", "Status", "Time"]
+    SYMBOL_COLUMN = 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.keys = []     # row -> order key, see order_key
+        self.rows = {}     # order key -> row
+        self.cells = []    # row -> display strings
+        self.sort_keys = []  # row -> raw values for sorting
+
+    @staticmethod
+    def order_key(order):
+        """orderId when set; orders placed from TWS or by other clients arrive with orderId 0, so use permId"""
+        order_id = getattr(order, 'orderId', 0)
+        if order_id:
+            return ('orderId', order_id)
+        return ('permId', getattr(order, 'permId', 0))
+
+    @staticmethod
+    def order_row(order):
+        """Display strings and sort values for one open order"""
+        order_id = getattr(order, 'orderId', '')
+        symbol = ''
+        if hasattr(order, 'contract') and order.contract:
+            symbol = getattr(order.contract, 'symbol', '')
+        else:
+            # Sometimes contract might be missing; try other fields or set as Unknown
+            symbol = getattr(order, 'symbol', 'Unknown')
+
+        action = getattr(order, 'action', '')
+        qty = getattr(order, 'totalQuantity', '')
+        order_type = getattr(order, 'orderType', '')
+        status = 'Unknown'
+        if hasattr(order, 'status'):
+            status = str(getattr(order, 'status', 'Unknown'))
+        elif hasattr(order, 'orderStatus') and order.orderStatus:
+            status = str(getattr(order.orderStatus, 'status', 'Unknown'))
+
+        # Price information is not always directly on order, try lmtPrice or auxPrice
+        price = 0.0
+        # IB marks unset prices with the largest double
+        if hasattr(order, 'lmtPrice') and 0 < order.lmtPrice < sys.float_info.max:
+            price = order.lmtPrice
+        elif hasattr(order, 'auxPrice') and 0 < order.auxPrice < sys.float_info.max:
+            price = order.auxPrice
+
+        # Time info may be in transmitTime or createdTime if available
+        time_str = ""
+        if hasattr(order, 'transmitTime') and order.transmitTime:
+            time_str = str(order.transmitTime)
+        elif hasattr(order, 'createdTime') and order.createdTime:
+            time_str = str(order.createdTime)
+
+        cells = (str(order_id), symbol, action, str(qty), order_type, f"${price:.2f}", status, time_str)
+        sort_keys = (order_id, symbol, action, qty, order_type, price, status, time_str)
+        return cells, sort_keys
+
+    def set_orders(self, open_orders):
+        """Diff open orders into the table: cancelled/filled rows go, new ones are appended, the rest update in place"""
+        incoming = {}
+        for order in open_orders:
+            try:
+                cells, sort_keys = self.order_row(order)
+                incoming[self.order_key(order)] = (cells, sort_keys)
+            except Exception as e:
+                trade_log.error("Error updating order %s: %s", getattr(order, 'orderId', '?'), e)
+
+        # Orders no longer open, removed bottom-up so earlier rows keep their numbers
+        closed = sorted((row for key, row in self.rows.items() if key not in incoming), reverse=True)
+        for first, last in PositionsTableModel.row_runs(closed):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.keys[first:last + 1]
+            del self.cells[first:last + 1]
+            del self.sort_keys[first:last + 1]
+            self.endRemoveRows()
+        if closed:
+            self.rows = {key: row for row, key in enumerate(self.keys)}
+
+        # Orders already shown: signal the span of cells that differ
+        for key, (cells, sort_keys) in incoming.items():
+            row = self.rows.get(key)
+            if row is None or self.cells[row] == cells:
+                continue
+            changed = [column for column, (old, new) in enumerate(zip(self.cells[row], cells)) if old != new]
+            self.cells[row] = cells
+            self.sort_keys[row] = sort_keys
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
+        # New orders
+        opened = [key for key in incoming if key not in self.rows]
+        if opened:
+            first = len(self.keys)
+            self.beginInsertRows(QModelIndex(), first, first + len(opened) - 1)
+            for key in opened:
+                self.rows[key] = len(self.keys)
+                self.keys.append(key)
+                self.cells.append(incoming[key][0])
+                self.sort_keys.append(incoming[key][1])
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cells[index.row()][index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self.sort_keys[index.row()][index.column()]
+        return None
+
+
+class TradesTableModel(QAbstractTableModel):
+    """Append-only view of the trade history, newest first, exposed a page at a time through fetchMore"""
+
+    HEADERS = ["Symbol", "Action", "Qty", "Price", "Commission", "P&L", "Time"]
+    SYMBOL_COLUMN = 0
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.trades = []   # chronological history; only ever appended to
+        self.total = 0     # trades known to the model
+        self.loaded = 0    # newest trades currently exposed as rows
+        self.rendered = {}  # history index -> (display strings, sort values), filled as rows are shown
+
+    def set_trades(self, trades: List):
+        """Pick up trades appended since the last call; a replaced history resets the table"""
+        if not trades and not self.total:
+            return
+        appended = (0 < self.total <= len(trades)
+                    and trades[self.total - 1] == self.trades[self.total - 1])
+        if not appended:
+            self.beginResetModel()
+            self.trades = trades
+            self.total = len(trades)
+            self.loaded = min(self.total, self.PAGE_SIZE)
+            self.rendered.clear()
+            self.endResetModel()
+            return
+        self.trades = trades
+        new = len(trades) - self.total
+        if new > 0:
+            # Newest first, so fresh fills go in at the top
+            self.beginInsertRows(QModelIndex(), 0, new - 1)
+            self.total += new
+            self.loaded += new
+            self.endInsertRows()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Expose the next page of older trades as the view scrolls toward the end"""
+        count = min(self.PAGE_SIZE, self.total - self.loaded)
+        if parent.isValid() or count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    @staticmethod
+    def trade_row(trade):
+        """Display strings and sort values for a saved trade dict or an IB execution"""
+        # When dealing with executions from IB, attributes differ from dicts saved in trades_history
+        # For dict type entries (historical trades saved), access keys
+        if isinstance(trade, dict):
+            symbol = trade.get('symbol', 'N/A')
+            side = trade.get('side', 'N/A')
+            qty = trade.get('quantity', trade.get('shares', 0))
+            price = trade.get('price', 0.0)
+            commission = trade.get('commission', 0.0)
+            pnl = trade.get('pnl', 0.0)
+            time_str = trade.get('time', '') or trade.get('timestamp', '')
+        else:
+            # Assume IB execution object
+            symbol = getattr(trade.contract if hasattr(trade, 'contract') else trade, 'symbol', 'N/A')
+            side = getattr(trade, 'side', 'N/A')
+            qty = getattr(trade, 'shares', 0)
+            price = getattr(trade, 'price', 0.0)
+            commission = 0.0  # commission info typically not on execution object
+            pnl = 0.0  # pnl info typically not on execution object
+            time_str = ''  # time not usually on execution object
+
+        cells = (symbol, side, str(qty), f"${price:.2f}", f"${commission:.2f}", f"${pnl:.2f}", str(time_str))
+        return cells, (symbol, side, qty, price, commission, pnl, str(time_str))
+
+    def row_values(self, row: int):
+        """Formatted trade for a display row, rendered on first use"""
+        position = self.total - 1 - row
+        values = self.rendered.get(position)
+        if values is None:
+            try:
+                values = self.trade_row(self.trades[position])
+            except Exception as e:
+                trade_log.error("Error updating trade row %d: %s", row, e)
+                values = (("Error",) * len(self.HEADERS), ("",) * len(self.HEADERS))
+            self.rendered[position] = values
+        return values
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.row_values(index.row())[0][index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self.row_values(index.row())[1][index.column()]
+        return None
+
+
 class OrdersWidget(QWidget):
     """Orders and positions tracking widget"""
     
     def __init__(self, ibkr_connection):
         super().__init__()
         self.ibkr_connection = ibkr_connection
+        self.orders_model = OrdersTableModel(self)
+        self.trades_model = TradesTableModel(self)
         self.init_ui()
         
     def init_ui(self):
@@ -2530,6 +5546,12 @@ class OrdersWidget(QWidget):
         """)
         layout.addWidget(title)
         
+        # Symbol filter, applied by the proxy models
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by symbol...")
+        self.filter_input.textChanged.connect(self.on_filter_changed)
+        layout.addWidget(self.filter_input)
+        
         # Tab widget for orders and trades
         tab_widget = QTabWidget()
         tab_widget.setStyleSheet("""
@@ -2551,24 +5573,22 @@ class OrdersWidget(QWidget):
             }
         """)
         
-        # Open orders table
-        self.orders_table = QTableWidget()
-        self.orders_table.setColumnCount(8)
-        self.orders_table.setHorizontalHeaderLabels([
-            "Order ID", "Symbol", "Action", "Qty", "Type", "Price", "Status", "Time"
-        ])
+        # Open orders and trades tables; sorting and filtering run in the proxies, on raw values
+        self.orders_proxy = self.make_proxy(self.orders_model)
+        self.orders_table = QTableView()
+        self.orders_table.setModel(self.orders_proxy)
         
-        # Trades table
-        self.trades_table = QTableWidget()
-        self.trades_table.setColumnCount(7)
-        self.trades_table.setHorizontalHeaderLabels([
-            "Symbol", "Action", "Qty", "Price", "Commission", "P&L", "Time"
-        ])
+        self.trades_proxy = self.make_proxy(self.trades_model)
+        self.trades_table = QTableView()
+        self.trades_table.setModel(self.trades_proxy)
         
         # Style tables
         for table in [self.orders_table, self.trades_table]:
+            table.setSortingEnabled(True)
+            table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             table.setStyleSheet("""
-                QTableWidget {
+                QTableView {
                     gridline-color: #444444;
                     background-color: #0d1421;
                     alternate-background-color: #1a2332;
@@ -2577,7 +5597,7 @@ class OrdersWidget(QWidget):
                     font-size: 10px;
                     selection-background-color: #1e3a5f;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 4px;
                     border-bottom: 1px solid #2a2a2a;
                 }
@@ -2592,7 +5612,7 @@ class OrdersWidget(QWidget):
             """)
             
             header = table.horizontalHeader()
-            for i in range(table.columnCount()):
+            for i in range(table.model().columnCount()):
                 header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
         
         tab_widget.addTab(self.orders_table, "Open Orders")
@@ -2601,60 +5621,25 @@ class OrdersWidget(QWidget):
         layout.addWidget(tab_widget)
         self.setLayout(layout)
         
+    @staticmethod
+    def make_proxy(model):
+        """Sort/filter proxy over a table model: sorts on the raw UserRole values, filters on the symbol"""
+        proxy = QSortFilterProxyModel(model)
+        proxy.setSourceModel(model)
+        proxy.setSortRole(Qt.ItemDataRole.UserRole)
+        proxy.setFilterKeyColumn(model.SYMBOL_COLUMN)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        return proxy
+    
+    def on_filter_changed(self, text):
+        """Filter both tables by symbol"""
+        self.orders_proxy.setFilterFixedString(text.strip())
+        self.trades_proxy.setFilterFixedString(text.strip())
+    
     def update_orders(self, open_orders):
         """Update open orders table"""
-        self.orders_table.setRowCount(len(open_orders))
-        for i, order in enumerate(open_orders):
-            try:
-                # Extract order details safely
-                order_id = getattr(order, 'orderId', '')
-                symbol = ''
-                if hasattr(order, 'contract') and order.contract:
-                    symbol = getattr(order.contract, 'symbol', '')
-                else:
-                    # Sometimes contract might be missing; try other fields or set as Unknown
-                    symbol = getattr(order, 'symbol', 'Unknown')
-                
-                action = getattr(order, 'action', '')
-                qty = getattr(order, 'totalQuantity', '')
-                order_type = getattr(order, 'orderType', '')
-                status = 'Unknown'
-                if hasattr(order, 'status'):
-                    status = str(getattr(order, 'status', 'Unknown'))
-                elif hasattr(order, 'orderStatus') and order.orderStatus:
-                    status = str(getattr(order.orderStatus, 'status', 'Unknown'))
-
-                # Price information is not always directly on order, try lmtPrice or auxPrice
-                price = ''
-                if hasattr(order, 'lmtPrice') and order.lmtPrice > 0:
-                    price = f"${order.lmtPrice:.2f}"
-                elif hasattr(order, 'auxPrice') and order.auxPrice > 0:
-                    price = f"${order.auxPrice:.2f}"
-                else:
-                    price = "$0.00"
-
-                # Time info may be in transmitTime or createdTime if available
-                time_str = ""
-                if hasattr(order, 'transmitTime') and order.transmitTime:
-                    time_str = str(order.transmitTime)
-                elif hasattr(order, 'createdTime') and order.createdTime:
-                    time_str = str(order.createdTime)
-                else:
-                    time_str = ""
-
-                # Populate table cells
-                self.orders_table.setItem(i, 0, QTableWidgetItem(str(order_id)))
-                self.orders_table.setItem(i, 1, QTableWidgetItem(symbol))
-                self.orders_table.setItem(i, 2, QTableWidgetItem(action))
-                self.orders_table.setItem(i, 3, QTableWidgetItem(str(qty)))
-                self.orders_table.setItem(i, 4, QTableWidgetItem(order_type))
-                self.orders_table.setItem(i, 5, QTableWidgetItem(price))
-                self.orders_table.setItem(i, 6, QTableWidgetItem(status))
-                self.orders_table.setItem(i, 7, QTableWidgetItem(time_str))
-            except Exception as e:
-                print(f"Error updating order row {i}: {e}")
-
-                
+        self.orders_model.set_orders(open_orders)
+    
     def update_trades(self, executions):
         """Update trades table with all historical trades"""
         # Try to get historical trades from self.ibkr_connection.trades_history if available
@@ -2664,48 +5649,85 @@ class OrdersWidget(QWidget):
         else:
             # Fallback to executions passed in
             trades = executions
+        self.trades_model.set_trades(trades)
+
+
+class UICoalescer(QObject):
+    """Frame-rate-capped render tick: keeps only the latest pending update per key and applies them once per frame"""
+
+    MIN_FPS = 10
+    MAX_FPS = 30
+
+    def __init__(self, fps: int = 20, parent=None):
+        super().__init__(parent)
+        self.pending = OrderedDict()  # key -> (callback, args), latest wins
+        self.posted = 0
+        self.applied = 0
+        self.coalesced = 0   # updates replaced by a newer one before their frame
+        self.frames = 0
+        self.last_frame_ms = 0.0
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.flush)
+        self.set_fps(fps)
+
+    def set_fps(self, fps: int):
+        """Set the render tick rate (clamped to MIN_FPS..MAX_FPS)"""
+        self.fps = max(self.MIN_FPS, min(self.MAX_FPS, int(fps)))
+        self.timer.setInterval(int(1000 / self.fps))
 
-        self.trades_table.setRowCount(len(trades))
-        for i, trade in enumerate(trades):
+    def post(self, key: str, callback, *args):
+        """Schedule callback(*args) for the next frame, replacing any pending update with the same key"""
+        self.posted += 1
+        if key in self.pending:
+            self.coalesced += 1
+        self.pending[key] = (callback, args)
+        # The timer only runs while there is something to draw
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """Apply every pending update once"""
+        if not self.pending:
+            self.timer.stop()
+            return
+        start = time.perf_counter()
+        pending, self.pending = self.pending, OrderedDict()
+        for key, (callback, args) in pending.items():
             try:
-                # When dealing with executions from IB, attributes differ from dicts saved in trades_history
-                # For dict type entries (historical trades saved), access keys
-                if isinstance(trade, dict):
-                    symbol = trade.get('symbol', 'N/A')
-                    side = trade.get('side', 'N/A')
-                    qty = trade.get('quantity', trade.get('shares', 0))
-                    price = trade.get('price', 0.0)
-                    commission = trade.get('commission', 0.0)
-                    pnl = trade.get('pnl', 0.0)
-                    time_str = trade.get('time', '') or trade.get('timestamp', '')
-                else:
-                    # Assume IB execution object
-                    symbol = getattr(trade.contract if hasattr(trade, 'contract') else trade, 'symbol', 'N/A')
-                    side = getattr(trade, 'side', 'N/A')
-                    qty = getattr(trade, 'shares', 0)
-                    price = getattr(trade, 'price', 0.0)
-                    commission = 0.0  # commission info typically not on execution object
-                    pnl = 0.0  # pnl info typically not on execution object
-                    time_str = ''  # time not usually on execution object
-
-                self.trades_table.setItem(i, 0, QTableWidgetItem(symbol))
-                self.trades_table.setItem(i, 1, QTableWidgetItem(side))
-                self.trades_table.setItem(i, 2, QTableWidgetItem(str(qty)))
-                self.trades_table.setItem(i, 3, QTableWidgetItem(f"${price:.2f}"))
-                self.trades_table.setItem(i, 4, QTableWidgetItem(f"${commission:.2f}"))
-                self.trades_table.setItem(i, 5, QTableWidgetItem(f"${pnl:.2f}"))
-                self.trades_table.setItem(i, 6, QTableWidgetItem(str(time_str)))
+                callback(*args)
             except Exception as e:
-                print(f"Error updating trade row {i}: {e}")
+                ui_log.error("Error applying %s update: %s", key, e)
+            self.applied += 1
+        self.frames += 1
+        self.last_frame_ms = (time.perf_counter() - start) * 1000
+
+    def get_stats(self) -> Dict:
+        return {
+            'fps': self.fps,
+            'posted': self.posted,
+            'applied': self.applied,
+            'coalesced': self.coalesced,
+            'frames': self.frames,
+            'last_frame_ms': self.last_frame_ms,
+        }
 
 
 class ProfessionalTradingPlatform(QMainWindow):
     """Main trading platform window with professional TWS-style interface"""
     
+    simulated_quotes_ready = pyqtSignal(object)  # QuoteBoard version after a simulator driver publish
+    polled_quotes_ready = pyqtSignal(object)  # QuoteBoard version after a quote-cycle fetch
+    
     def __init__(self):
         super().__init__()
         self.ibkr_connection = EnhancedIBKRConnection()
         self.data_worker = None
+        self.quote_pool = QuoteFetchPool(max_workers=8, deadline=2.0)
+        # Without the data worker, quote fetches run one cycle at a time on this thread instead of the GUI's
+        self.quote_cycle = ThreadPoolExecutor(max_workers=1, thread_name_prefix='quote-cycle')
+        self.quote_cycle_future = None
+        self.poll_scheduler = QuotePollScheduler()
+        self.ui_coalescer = UICoalescer(fps=20, parent=self)
         self.init_ui()
         self.setup_connections()
         self.setup_timers()
@@ -2715,12 +5737,25 @@ class ProfessionalTradingPlatform(QMainWindow):
 
     def initial_data_load(self):
         """Load initial data for all watchlist symbols"""
-        for symbol in self.watchlist_widget.watchlist:
-            try:
-                data = self.ibkr_connection.get_real_time_data(symbol)
-                self.on_market_data_update(symbol, data)
-            except Exception as e:
-                print(f"Error loading initial data for {symbol}: {e}")
+        symbols = list(self.watchlist_widget.watchlist)
+        self.poll_scheduler.mark_polled(symbols)
+        self.start_quote_cycle(symbols)
+    
+    def start_quote_cycle(self, symbols: List[str]) -> bool:
+        """Fetch quotes on the quote-cycle thread; False while the previous cycle is still running"""
+        if self.quote_cycle_future is not None and not self.quote_cycle_future.done():
+            return False
+        self.quote_cycle_future = self.quote_cycle.submit(self._run_quote_cycle, symbols)
+        return True
+    
+    def _run_quote_cycle(self, symbols: List[str]):
+        """Quote-cycle thread: fetch concurrently, write the board, and hand the version to the GUI thread"""
+        try:
+            quotes = self.quote_pool.fetch(symbols, self.ibkr_connection.get_real_time_data)
+            self.ibkr_connection.quote_board.update_many(quotes)
+            self.polled_quotes_ready.emit(self.ibkr_connection.quote_board.version)
+        except Exception as e:
+            main_log.error("Error fetching quotes for %d symbols: %s", len(symbols), e)
         
     def init_ui(self):
         """Initialize the main user interface"""
@@ -2870,7 +5905,7 @@ QLabel {
         left_layout = QVBoxLayout()
         
         # Watchlist
-        self.watchlist_widget = AdvancedWatchlistWidget()
+        self.watchlist_widget = AdvancedWatchlistWidget(self.ibkr_connection.quote_board)
         left_layout.addWidget(self.watchlist_widget)
         
         # Trading panel
@@ -3000,6 +6035,13 @@ QLabel {
         disconnect_action.triggered.connect(self.disconnect_from_tws)
         connection_menu.addAction(disconnect_action)
         
+        connection_menu.addSeparator()
+
+        simulated_action = QAction('Simulated Market Data', self)
+        simulated_action.setCheckable(True)
+        simulated_action.toggled.connect(self.on_simulated_market_toggled)
+        connection_menu.addAction(simulated_action)
+
         connection_menu.addSeparator()
         
         # Client ID submenu
@@ -3036,6 +6078,19 @@ QLabel {
         
         view_menu.addSeparator()
         
+        # UI refresh rate submenu
+        refresh_menu = view_menu.addMenu('UI Refresh Rate')
+        refresh_group = QActionGroup(self)
+        for fps in (10, 20, 30):
+            fps_action = QAction(f'{fps} Hz', self)
+            fps_action.setCheckable(True)
+            fps_action.setChecked(fps == self.ui_coalescer.fps)
+            fps_action.triggered.connect(lambda checked, rate=fps: self.ui_coalescer.set_fps(rate))
+            refresh_group.addAction(fps_action)
+            refresh_menu.addAction(fps_action)
+        
+        view_menu.addSeparator()
+        
         # Layout submenu
         layout_menu = view_menu.addMenu('Layout')
         
@@ -3065,9 +6120,15 @@ QLabel {
         """Setup signal connections between widgets"""
         # Watchlist to chart and trading
         self.watchlist_widget.symbol_selected.connect(self.on_symbol_selected)
+        self.watchlist_widget.symbol_removed.connect(self.on_symbol_removed)
+        self.watchlist_widget.visible_symbols_changed.connect(self.poll_scheduler.set_visible)
+        self.poll_scheduler.set_visible(self.watchlist_widget.visible_symbols)
+        self.simulated_quotes_ready.connect(self.on_market_data_update)
+        self.polled_quotes_ready.connect(self.on_market_data_update)
         
         # Chart controls
         self.chart_controls.timeframe_changed.connect(self.on_timeframe_changed)
+        self.chart_controls.live_toggled.connect(self.chart_widget.set_live_mode)
         
         # Trading panel signals
         self.trading_panel.order_placed.connect(self.on_order_placed)
@@ -3092,17 +6153,31 @@ QLabel {
             self.connect_to_tws(**params)
     
     def connect_to_tws(self, host="127.0.0.1", port=7496, client_id=1):
-        """Connect to TWS/Gateway with specified parameters"""
+        """Connect to TWS/Gateway with specified parameters, without blocking the GUI thread"""
+        try:
+            self.status_bar.showMessage(f"Connecting to TWS at {host}:{port}...")
+            future = self.ibkr_connection.connect(host, port, client_id)
+            self.ibkr_connection.bridge.deliver(
+                future, lambda done: self.on_tws_connected(done, host, port, client_id))
+        except Exception as e:
+            QMessageBox.critical(self, "Connection Error", f"Error connecting to TWS:\n{str(e)}")
+
+    def on_tws_connected(self, future, host, port, client_id):
+        """Finish a connection attempt once the IB loop thread reports back"""
         try:
-            success = self.ibkr_connection.connect(host, port, client_id)
+            success = future.result()
             if success:
                 self.status_bar.showMessage(f"Connected to TWS - Client ID: {client_id}")
                 self.trading_panel.update_connection_status(True)
                 
-                # Start data worker
+                # Stream watchlist quotes from TWS; Yahoo only covers what is left
                 symbols = self.watchlist_widget.watchlist
-                self.data_worker = DataUpdateWorker(symbols, self.ibkr_connection)
-                self.data_worker.data_ready.connect(self.on_market_data_update)
+                self.ibkr_connection.subscribe_market_data(symbols)
+
+                # Start data worker
+                self.data_worker = DataUpdateWorker(symbols, self.ibkr_connection, self.quote_pool,
+                                                    self.poll_scheduler)
+                self.data_worker.quotes_ready.connect(self.on_market_data_update)
                 self.data_worker.portfolio_ready.connect(self.on_portfolio_update)
                 self.data_worker.orders_ready.connect(self.on_orders_update)
                 self.data_worker.trades_ready.connect(self.on_trades_update)
@@ -3159,35 +6234,90 @@ QLabel {
     def on_symbol_selected(self, symbol: str):
         """Handle symbol selection from watchlist"""
         self.trading_panel.set_selected_symbol(symbol)
+        self.poll_scheduler.set_selected(symbol)
+        # Quotes are pulled from the board on change, so seed the panel with the current row
+        data = self.ibkr_connection.quote_board.get(symbol)
+        if data:
+            self.trading_panel.update_market_data(symbol, data)
         self.chart_widget.update_chart(symbol)
+        # Neighbouring rows are the likeliest next clicks, so have their bars on disk before then
+        self.chart_widget.prefetch(self.watchlist_widget.neighbour_symbols(symbol))
         self.status_bar.showMessage(f"Selected: {symbol}")
         self.news_widget.update_news_for_symbol(symbol)
     
+    def on_symbol_removed(self, symbol: str):
+        """Stop streaming and forget the last sent quote for a removed symbol"""
+        self.ibkr_connection.unsubscribe_market_data(symbol)
+        self.poll_scheduler.forget(symbol)
+        self.ibkr_connection.bar_store.forget(symbol)
+        if self.data_worker:
+            self.data_worker.remove_symbol(symbol)
+    
     def on_timeframe_changed(self, timeframe: str, period: str):
         """Handle timeframe change from chart controls"""
         if hasattr(self.chart_widget, 'symbol') and self.chart_widget.symbol:
             self.chart_widget.update_chart(self.chart_widget.symbol, timeframe, period)
     
+    def shutdown(self):
+        """Stop the background pools on exit so the interpreter is not held by queued downloads"""
+        self.ibkr_connection.simulator.stop_driver()
+        if self.quote_cycle_future is not None:
+            self.quote_cycle_future.cancel()
+        self.quote_cycle.shutdown(wait=False)
+        self.quote_pool.shutdown()
+        self.chart_widget.shutdown()
+    
+    def on_simulated_market_toggled(self, enabled: bool):
+        """Serve quotes from the simulator, with its driver pushing ticks at the configured rate"""
+        self.ibkr_connection.set_simulated_market(enabled)
+        simulator = self.ibkr_connection.simulator
+        if enabled:
+            simulator.start_driver(self.ibkr_connection.quote_board, lambda: list(self.watchlist_widget.watchlist),
+                                   on_publish=self.simulated_quotes_ready.emit)
+        else:
+            simulator.stop_driver()
+    
     def on_order_placed(self, symbol: str, order_details: str):
         """Handle order placement"""
         self.status_bar.showMessage(f"Order placed: {order_details}")
     
-    def on_market_data_update(self, symbol: str, data: dict):
-        """Handle market data updates with proper validation"""
-        print(f"[MAIN] Market data update for {symbol}: {data}")
-        
-        # Update watchlist first
-        self.watchlist_widget.update_symbol_data(symbol, data)
+    def on_market_data_update(self, version: int):
+        """Queue a quote board refresh for the next frame"""
+        self.ui_coalescer.post('quotes', self.render_market_data, version)
 
-        # Update trading panel
-        self.trading_panel.update_market_data(symbol, data)
+    def render_market_data(self, version: int):
+        """Pull the rows written to the quote board up to version"""
+        # Held positions are repriced whether or not they are on the watchlist
+        self.portfolio_widget.mark_to_market()
+        
+        # Update watchlist first; it re-renders the changed rows and reports them
+        changed = self.watchlist_widget.refresh_from_board()
+        if not changed:
+            return
+        main_log.debug("Market data update for %d symbols (board version %s)", len(changed), version)
+        board = self.ibkr_connection.quote_board
+
+        # Update trading panel with the selected symbol's row
+        selected = self.trading_panel.selected_symbol
+        if selected in changed:
+            self.trading_panel.update_market_data(selected, board.get(selected))
+        
+        # Tick the charted symbol's newest bar
+        chart_symbol = self.chart_widget.symbol
+        if chart_symbol in changed:
+            quote = board.get(chart_symbol)
+            self.chart_widget.update_live_quote(chart_symbol, quote.get('last'), quote.get('volume'))
 
         # Update status based on data source
-        source = data.get('source', '')
+        source = board.get(changed[0])['source']
         if source in ['Yahoo Finance (Demo)', 'Yahoo Finance']:
             msg = ("Quotes: Yahoo Finance | TWS: Connected"
                 if self.ibkr_connection.connected
                 else "Quotes: Yahoo Finance | TWS: Disconnected")
+        elif source == 'Simulated Market':
+            msg = ("Quotes: Simulated Market | TWS: Connected"
+                if self.ibkr_connection.connected
+                else "Quotes: Simulated Market | TWS: Disconnected")
         elif source == 'Mock Data (Development)':
             msg = ("Quotes: Mock Data | TWS: Connected"
                 if self.ibkr_connection.connected
@@ -3201,47 +6331,50 @@ QLabel {
 
     def on_portfolio_update(self, portfolio_data: dict):
         """Handle portfolio updates"""
-        print(f"[MAIN] Portfolio update received: {portfolio_data}")
-        self.portfolio_widget.update_portfolio(portfolio_data)
+        main_log.debug("Portfolio update received: %s", portfolio_data)
+        self.ui_coalescer.post('portfolio', self.portfolio_widget.update_portfolio, portfolio_data)
     
     def on_orders_update(self, open_orders):
         """Handle orders updates"""
-        self.orders_widget.update_orders(open_orders)
+        self.ui_coalescer.post('orders', self.orders_widget.update_orders, open_orders)
     
     def on_trades_update(self, executions):
         """Handle trades updates"""
-        self.orders_widget.update_trades(executions)
+        self.ui_coalescer.post('trades', self.orders_widget.update_trades, executions)
     
     def on_data_error(self, error_message: str):
         """Handle data update errors"""
-        print(f"Data error: {error_message}")
+        main_log.warning("Data error: %s", error_message)
     
     def update_data(self):
         """Update data when not using background worker"""
         if not self.data_worker:
-            print("[MAIN] Manual data update triggered")
-            connection_working = False
+            main_log.debug("Manual data update triggered")
             
-            # Update market data
-            for symbol in self.watchlist_widget.watchlist:
-                data = self.ibkr_connection.get_real_time_data(symbol)
-                if data.get('source') not in ['No TWS Data', 'Mock Data (Development)']:
-                    connection_working = True
-                self.on_market_data_update(symbol, data)
+            # Update the symbols the scheduler says are due, concurrently and off the GUI thread;
+            # symbols past the deadline wait for their next turn, and a cycle still running is not doubled up
+            if self.quote_cycle_future is None or self.quote_cycle_future.done():
+                due = self.poll_scheduler.due_symbols(list(self.watchlist_widget.watchlist))
+                self.poll_scheduler.mark_polled(due)
+                self.start_quote_cycle(due)
             
             # IMPORTANT: Also update portfolio data manually
-            try:
-                portfolio_data = self.ibkr_connection.get_portfolio_data()
-                self.on_portfolio_update(portfolio_data)
-            except Exception as e:
-                print(f"Error updating portfolio: {e}")
+            self.portfolio_widget.refresh_portfolio()
 
 
     def update_status(self):
         """Update status bar with current time and connection status"""
         current_time = datetime.now().strftime("%H:%M:%S")
         connection_status = "Connected" if self.ibkr_connection.connected else "Disconnected (Paper Mode)"
-        self.status_bar.showMessage(f"{connection_status} | {current_time}")
+        pool_stats = self.quote_pool.get_stats()
+        cache_stats = self.ibkr_connection.quote_cache.get_stats()
+        ui_stats = self.ui_coalescer.get_stats()
+        self.status_bar.showMessage(
+            f"{connection_status} | Quotes: {pool_stats['last_cycle_latency_ms']:.0f} ms, "
+            f"{pool_stats['last_cycle_timeouts']} timeouts | "
+            f"Cache: {cache_stats['hit_rate']:.0f}% hit, {cache_stats['coalesced']} coalesced | "
+            f"UI: {ui_stats['fps']} Hz, {ui_stats['coalesced']} updates coalesced | {current_time}"
+        )
     
     def cancel_all_orders(self):
         """Cancel all open orders"""
@@ -3325,6 +6458,8 @@ def main():
     import sys
     from PyQt6.QtCore import Qt, QCoreApplication
     
+    log_listener = setup_logging()
+    
     warnings.filterwarnings("ignore", category=UserWarning, message="pkg_resources is deprecated as an API*")
     
     QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
@@ -3332,10 +6467,10 @@ def main():
     # Import QtWebEngineWidgets after setting the attribute
     try:
         from PyQt6.QtWebEngineWidgets import QWebEngineView
-        print("[WEBENGINE] Successfully imported QtWebEngineWidgets after setting attribute")
+        main_log.info("Successfully imported QtWebEngineWidgets after setting attribute")
     except ImportError as e:
-        print(f"[WEBENGINE] Import failed: {e}")
-        print("Please install with: pip install PyQt6-WebEngine")
+        main_log.warning("QtWebEngineWidgets import failed: %s", e)
+        main_log.warning("Please install with: pip install PyQt6-WebEngine")
     
     app = QApplication(sys.argv)
     
@@ -3351,12 +6486,11 @@ def main():
         
         # Your welcome message code...
         
-        sys.exit(app.exec())
+        exit_code = app.exec()
+        window.shutdown()
         
     except Exception as e:
-        import traceback
-        print(f"Startup error: {e}")
-        print(traceback.format_exc())
+        main_log.exception("Startup error: %s", e)
         
         error_msg = QMessageBox()
         error_msg.setIcon(QMessageBox.Icon.Critical)
@@ -3364,7 +6498,11 @@ def main():
         error_msg.setText("Failed to start the trading platform")
         error_msg.setInformativeText(f"Error details:\n{str(e)}")
         error_msg.exec()
-        sys.exit(1)
+        exit_code = 1
+    
+    # Drain queued records to disk before exiting
+    log_listener.stop()
+    sys.exit(exit_code)
         
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Imports the platform module, whose file name is not a valid module name, once for every test file"""
+import importlib.util
+import logging
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+
+MODULE_NAME = "trading_platform"
+MODULE_PATH = Path(__file__).resolve().parents[1] / "IST 495 - Professional Trading Platform - Final Implementation.py"
+
+# The module switches matplotlib to the Qt backend on import, which needs a running QApplication
+app = QApplication.instance() or QApplication([])
+
+if MODULE_NAME in sys.modules:
+    trading_platform = sys.modules[MODULE_NAME]
+else:
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+    trading_platform = importlib.util.module_from_spec(spec)
+    sys.modules[MODULE_NAME] = trading_platform
+    spec.loader.exec_module(trading_platform)
+
+# Tests do not call setup_logging; keep expected warnings (failed fetches, backoff) off the console
+logging.getLogger(trading_platform.LOG_ROOT).addHandler(logging.NullHandler())
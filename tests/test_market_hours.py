@@ -0,0 +1,36 @@
+"""Market-hours check and poll scheduler when the host has no time zone database"""
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from load_platform import trading_platform
+
+
+def missing_zone(key):
+    raise trading_platform.ZoneInfoNotFoundError(f"No time zone found with key {key}")
+
+
+class MarketHoursFallbackTest(unittest.TestCase):
+
+    def test_missing_tz_database_uses_utc_minus_five(self):
+        with mock.patch.object(trading_platform, 'ZoneInfo', missing_zone):
+            # Tuesday 2024-01-02: 15:00 UTC is 10:00 in New York, 22:00 UTC is 17:00
+            self.assertTrue(trading_platform.is_us_market_open(datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)))
+            self.assertFalse(trading_platform.is_us_market_open(datetime(2024, 1, 2, 22, 0, tzinfo=timezone.utc)))
+            # Saturday
+            self.assertFalse(trading_platform.is_us_market_open(datetime(2024, 1, 6, 15, 0, tzinfo=timezone.utc)))
+
+    def test_scheduler_survives_a_failing_check(self):
+        scheduler = trading_platform.QuotePollScheduler()
+        check = mock.Mock(side_effect=RuntimeError("no tz database"))
+        with mock.patch.object(trading_platform, 'is_us_market_open', check):
+            self.assertEqual(scheduler.get_interval('AAPL'), scheduler.intervals['background'])
+            self.assertEqual(scheduler.due_symbols(['AAPL', 'MSFT']), ['AAPL', 'MSFT'])
+            scheduler.next_due_in(['AAPL'])
+        # The failure is stamped like a success, so the check is not retried on every call
+        self.assertEqual(check.call_count, 1)
+        self.assertTrue(scheduler.market_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
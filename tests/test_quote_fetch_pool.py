@@ -0,0 +1,42 @@
+"""QuoteFetchPool deadlines run per fetch, from the moment a worker starts it"""
+import threading
+import time
+import unittest
+
+from load_platform import trading_platform
+
+
+class QuoteFetchPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = trading_platform.QuoteFetchPool(max_workers=2, deadline=0.3)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.pool.shutdown()
+
+    def fetch_fn(self, key):
+        if key == 'STUCK':
+            self.release.wait(5)
+        else:
+            time.sleep(0.2)
+        return key.lower()
+
+    def test_queued_fetches_get_their_own_deadline(self):
+        # Three waves of 0.2s fetches: a single 0.3s budget from submission would drop the later waves
+        keys = ['A', 'B', 'C', 'D', 'E', 'F']
+        self.assertEqual(self.pool.fetch(keys, self.fetch_fn), {key: key.lower() for key in keys})
+        self.assertEqual(self.pool.get_stats()['last_cycle_timeouts'], 0)
+
+    def test_stuck_fetch_is_dropped_alone(self):
+        keys = ['STUCK', 'A', 'B', 'C', 'D']
+        started = time.monotonic()
+        results = self.pool.fetch(keys, self.fetch_fn)
+        self.assertEqual(results, {key: key.lower() for key in keys[1:]})
+        self.assertEqual(self.pool.get_stats()['last_cycle_timeouts'], 1)
+        self.assertLess(time.monotonic() - started, 0.3 * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
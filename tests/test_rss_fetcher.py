@@ -0,0 +1,107 @@
+"""RSSFeedFetcher against a local HTTP stand-in serving 200, 304 and 429 responses"""
+import http.server
+import threading
+import time
+import unittest
+
+from load_platform import trading_platform
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Local Wire</title>
+<item><title>Fed holds rates</title><link>http://local/a</link><guid>a</guid>
+<pubDate>Mon, 06 Sep 2021 16:45:00 GMT</pubDate></item>
+<item><title>AAPL beats estimates</title><link>http://local/b</link><guid>b</guid></item>
+</channel></rss>"""
+ETAG = '"v1"'
+
+
+class FeedHandler(http.server.BaseHTTPRequestHandler):
+    """/feed answers 200 with an ETag, then 304 to a matching If-None-Match; /limited always answers 429"""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.path == '/limited':
+            self.send_response(429)
+            self.send_header('Retry-After', '120')
+            self.end_headers()
+        elif self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.end_headers()
+            self.wfile.write(FEED)
+
+
+class RSSFeedFetcherTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        FeedHandler.requests.clear()
+
+    def make_fetcher(self, *paths, interval=60.0):
+        feeds = [{'url': self.base + path, 'provider': 'LOCAL', 'interval': interval} for path in paths]
+        return trading_platform.RSSFeedFetcher(feeds, autostart=False)
+
+    def test_conditional_get_returns_304_and_keeps_the_cache(self):
+        fetcher = self.make_fetcher('/feed')
+        feed = fetcher.feeds[0]
+        fetcher.poll_feed(feed)
+        self.assertEqual([item['headline'] for item in fetcher.get_items()], ['Fed holds rates', 'AAPL beats estimates'])
+        version = fetcher.version
+
+        fetcher.poll_feed(feed)
+        self.assertEqual(FeedHandler.requests, [('/feed', None), ('/feed', ETAG)])
+        self.assertEqual(feed['not_modified'], 1)
+        self.assertEqual(feed['last_status'], 304)
+        self.assertEqual(fetcher.version, version)
+        self.assertEqual(len(fetcher.get_items()), 2)
+
+    def test_items_are_deduplicated_across_feeds(self):
+        fetcher = self.make_fetcher('/feed', '/feed?copy')
+        for feed in fetcher.feeds:
+            fetcher.poll_feed(feed)
+        self.assertEqual(len(fetcher.get_items()), 2)
+
+    def test_429_waits_for_retry_after(self):
+        fetcher = self.make_fetcher('/limited', interval=1.0)
+        feed = fetcher.feeds[0]
+        fetcher.poll_feed(feed)
+        self.assertEqual(feed['failures'], 1)
+        self.assertEqual(feed['last_status'], 429)
+        self.assertAlmostEqual(feed['next_poll'] - time.monotonic(), 120, delta=5)
+
+    def test_errors_back_off_exponentially(self):
+        fetcher = self.make_fetcher('/feed', interval=1.0)
+        feed = fetcher.feeds[0]
+        feed['url'] = 'http://127.0.0.1:9/unreachable'
+        fetcher.poll_feed(feed)
+        fetcher.poll_feed(feed)
+        self.assertEqual(feed['failures'], 2)
+        self.assertAlmostEqual(feed['next_poll'] - time.monotonic(), 4, delta=1)
+
+    def test_retry_after_accepts_seconds_and_http_dates(self):
+        self.assertEqual(trading_platform.RSSFeedFetcher.retry_after_seconds('30'), 30.0)
+        self.assertEqual(trading_platform.RSSFeedFetcher.retry_after_seconds('Mon, 06 Sep 2021 16:45:00 GMT'), 0.0)
+        self.assertIsNone(trading_platform.RSSFeedFetcher.retry_after_seconds('soon'))
+
+
+if __name__ == "__main__":
+    unittest.main()
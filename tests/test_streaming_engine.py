@@ -0,0 +1,122 @@
+"""IBStreamingQuoteEngine driven by a fake IB event stream instead of TWS"""
+import threading
+import unittest
+from math import nan
+from types import SimpleNamespace
+
+from load_platform import trading_platform
+
+
+class FakeEvent:
+    """The += / -= / emit surface of an ib_insync event"""
+
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        self.handlers.remove(handler)
+        return self
+
+    def emit(self, *args):
+        for handler in list(self.handlers):
+            handler(*args)
+
+
+class FakeIB:
+    """Records market data requests and hands out tickers the test pushes ticks through"""
+
+    def __init__(self):
+        self.pendingTickersEvent = FakeEvent()
+        self.requests = []
+        self.cancelled = []
+        self.request_threads = set()
+
+    def reqMktData(self, contract, genericTickList="", snapshot=False, regulatorySnapshot=False):
+        self.requests.append(contract.symbol)
+        self.request_threads.add(threading.get_ident())
+        return SimpleNamespace(contract=contract, bid=nan, ask=nan, last=nan, bidSize=nan, askSize=nan,
+                               lastSize=nan, volume=nan, close=nan)
+
+    def cancelMktData(self, contract):
+        self.cancelled.append(contract.symbol)
+
+    def tick(self, ticker, **fields):
+        for name, value in fields.items():
+            setattr(ticker, name, value)
+        self.pendingTickersEvent.emit([ticker])
+
+
+class StreamingEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ib = FakeIB()
+        self.ib_loop = trading_platform.IBEventLoop()
+        self.ib_loop.start()
+        self.engine = trading_platform.IBStreamingQuoteEngine(self.ib, self.ib_loop, max_subscriptions=2)
+
+    def tearDown(self):
+        self.ib_loop.stop()
+
+    def flush(self):
+        """Wait until the IB loop thread has run everything queued so far"""
+        self.ib_loop.call(lambda: None, timeout=5)
+
+    def test_pushed_ticks_build_a_quote(self):
+        self.assertTrue(self.engine.subscribe("aapl"))
+        self.flush()
+        self.assertIsNone(self.engine.get_quote("AAPL"))
+        ticker = self.engine.tickers["AAPL"]
+        self.ib.tick(ticker, bid=189.9, ask=190.1, last=190.0, bidSize=300, askSize=200, volume=1000, close=188.0)
+        # Missing values (nan, -1) never overwrite the last good one
+        self.ib.tick(ticker, bid=-1, last=nan)
+
+        quote = self.engine.get_quote("AAPL")
+        self.assertEqual(quote["last"], 190.0)
+        self.assertEqual(quote["bid"], 189.9)
+        self.assertEqual(quote["bid_size"], 300)
+        self.assertAlmostEqual(quote["change"], 2.0)
+        self.assertEqual(quote["source"], "IB Streaming")
+        self.assertEqual(self.engine.tick_updates, 2)
+
+    def test_line_limit(self):
+        self.assertTrue(self.engine.subscribe("AAPL"))
+        self.assertTrue(self.engine.subscribe("MSFT"))
+        self.assertFalse(self.engine.subscribe("NVDA"))
+        self.flush()
+        self.assertEqual(self.ib.requests, ["AAPL", "MSFT"])
+
+    def test_unsubscribe_cancels_and_ignores_later_ticks(self):
+        self.engine.subscribe("AAPL")
+        self.flush()
+        ticker = self.engine.tickers["AAPL"]
+        self.engine.unsubscribe("AAPL")
+        self.ib.tick(ticker, last=190.0)
+        self.flush()
+        self.assertEqual(self.ib.cancelled, ["AAPL"])
+        self.assertIsNone(self.engine.get_quote("AAPL"))
+
+    def test_requests_from_any_thread_run_on_the_loop_thread(self):
+        workers = [threading.Thread(target=self.engine.subscribe, args=("AAPL",)) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.flush()
+        self.assertEqual(self.ib.requests, ["AAPL"])
+        self.assertEqual(self.ib.request_threads, {self.ib_loop.thread.ident})
+
+    def test_stop_detaches_from_the_event_stream(self):
+        self.engine.subscribe("AAPL")
+        self.flush()
+        self.engine.stop()
+        self.flush()
+        self.assertEqual(self.ib.pendingTickersEvent.handlers, [])
+        self.assertEqual(self.ib.cancelled, ["AAPL"])
+
+
+if __name__ == "__main__":
+    unittest.main()